@@ -29,12 +29,18 @@
 # ==================================================================================================================== #
 #
 """A data model for OSVVM's AlertLog YAML file format."""
-from datetime import timedelta
-from enum     import Enum, auto
-from pathlib  import Path
-from typing   import Optional as Nullable, Dict, Iterator, Iterable, Callable
-
-from ruamel.yaml           import YAML, CommentedSeq, CommentedMap
+from datetime  import timedelta
+from enum      import Enum, auto
+from fnmatch   import fnmatchcase
+from functools import partial
+from pathlib   import Path
+from heapq     import nlargest
+from typing    import Optional as Nullable, Any, Dict, List, Tuple, Iterator, Iterable, Callable
+
+from ruamel.yaml           import YAML, CommentedMap
+from ruamel.yaml.events    import Event, ScalarEvent, AliasEvent, MappingStartEvent, MappingEndEvent
+from ruamel.yaml.events    import SequenceStartEvent, SequenceEndEvent
+from ruamel.yaml.nodes     import ScalarNode
 from pyTooling.Decorators  import readonly, export
 from pyTooling.MetaClasses import ExtendedType
 from pyTooling.Common      import getFullyQualifiedName
@@ -42,7 +48,9 @@ from pyTooling.Stopwatch   import Stopwatch
 from pyTooling.Tree        import Node
 from pyTooling.Versioning  import SemanticVersion
 
-from pyEDAA.OSVVM          import OSVVMException
+from pyEDAA.OSVVM          import __version__, OSVVMException, YAMLLoader
+from pyEDAA.OSVVM.Batch    import BatchResult, LoadBatch
+from pyEDAA.OSVVM.Cache    import CacheDirectory
 
 
 @export
@@ -94,6 +102,9 @@ def _format(node: Node) -> str:
 	return f"{node['Name']}: {node['TotalErrors']}={node['AlertCountFailures']}/{node['AlertCountErrors']}/{node['AlertCountWarnings']} {node['PassedCount']}/{node['AffirmCount']}"
 
 
+AlertLogAggregateReturnType = Tuple[int, int, int, int, int, int, int, int, int, int, int]
+
+
 @export
 class AlertLogItem(metaclass=ExtendedType, slots=True):
 	"""
@@ -102,11 +113,17 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 	An item has a reference to its parent item in the AlertLog hierarchy. If the item is the top-most element (root
 	element), the parent reference is ``None``.
 
-	An item can contain further child items.
+	An item can contain further child items. Child items can be materialized lazily: if a callable producing the child
+	items is pending, it's called when the children are accessed for the first time.
+
+	The counts of an item and all its nested items are aggregated bottom-up on first access (see
+	:data:`SubtreeAggregate`) and cached. When items are attached or detached, the cached aggregates of all ancestors are
+	updated incrementally.
 	"""
 	_parent:                     "AlertLogItem"             #: Reference to the parent item.
 	_name:                       str                        #: Name of the AlertLog item.
 	_children:                   Dict[str, "AlertLogItem"]  #: Dictionary of child items.
+	_pendingChildren:            Nullable[Callable[[], Iterable["AlertLogItem"]]]  #: Callable producing not yet materialized child items.
 
 	_status:                     AlertLogStatus             #: AlertLog item's status
 	_totalErrors:                int                        #: Total number of warnings, errors and failures.
@@ -120,6 +137,7 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 	_disabledAlertCountWarnings: int                        #: Count of disabled warnings.
 	_disabledAlertCountErrors:   int                        #: Count of disabled errors.
 	_disabledAlertCountFailures: int                        #: Count of disabled failures.
+	_subtreeAggregate:           Nullable[List[int]]        #: Cached counts of this item and all nested items.
 
 	def __init__(
 		self,
@@ -146,25 +164,18 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 				ex = TypeError(f"Parameter 'parent' is not an AlertLogItem.")
 				ex.add_note(f"Got type '{getFullyQualifiedName(parent)}'.")
 				raise ex
-			elif name in parent._children:
+
+			parent._MaterializeChildren()
+			if name in parent._children:
 				raise DuplicateItemException(f"AlertLogItem '{name}' already exists in '{parent._name}'.")
 
 			parent._children[name] = self
 
 		self._children = {}
+		self._pendingChildren = None
+		self._subtreeAggregate = None
 		if children is not None:
-			for child in children:
-				if not isinstance(child, AlertLogItem):
-					ex = TypeError(f"Item in parameter 'children' is not an AlertLogItem.")
-					ex.add_note(f"Got type '{getFullyQualifiedName(child)}'.")
-					raise ex
-				elif child._name in self._children:
-					raise DuplicateItemException(f"AlertLogItem '{child._name}' already exists in '{self._name}'.")
-				elif child._parent is not None:
-					raise AlertLogException(f"AlertLogItem '{child._name}' is already part of another AlertLog hierarchy ({child._parent._name}).")
-
-				self._children[child._name] = child
-				child._parent = self
+			self._AddChildren(children)
 
 		self._status = status
 		self._totalErrors = totalErrors
@@ -179,6 +190,141 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 		self._disabledAlertCountErrors = disabledAlertCountErrors
 		self._disabledAlertCountFailures = disabledAlertCountFailures
 
+		if parent is not None:
+			parent._AddToAggregate(self)
+			parent._Root()._AddToIndex(self)
+
+	def _AddChildren(self, children: Iterable["AlertLogItem"]) -> None:
+		"""
+		Add child items to this item.
+
+		All child items are checked before the first one is attached, thus either all or none are added.
+
+		:param children:           Child items to add.
+		:raises TypeError:         If a child isn't an AlertLogItem.
+		:raises DuplicateItemException: If a child with the same name already exists.
+		:raises AlertLogException: If a child is already part of another AlertLog hierarchy.
+		"""
+		children = list(children)
+		names = set()
+		for child in children:
+			if not isinstance(child, AlertLogItem):
+				ex = TypeError(f"Item in parameter 'children' is not an AlertLogItem.")
+				ex.add_note(f"Got type '{getFullyQualifiedName(child)}'.")
+				raise ex
+			elif child._name in self._children or child._name in names:
+				raise DuplicateItemException(f"AlertLogItem '{child._name}' already exists in '{self._name}'.")
+			elif child._parent is not None:
+				raise AlertLogException(f"AlertLogItem '{child._name}' is already part of another AlertLog hierarchy ({child._parent._name}).")
+
+			names.add(child._name)
+
+		for child in children:
+			self._children[child._name] = child
+			child._parent = self
+			self._AddToAggregate(child)
+
+	def _MaterializeChildren(self) -> None:
+		"""
+		Materialize pending child items, if child items are created lazily.
+
+		The pending callable is cleared only after all child items were converted and attached. If the conversion fails,
+		no child item is attached and the next access retries the conversion.
+		"""
+		if (pendingChildren := self._pendingChildren) is not None:
+			self._AddChildren(list(pendingChildren()))
+			self._pendingChildren = None
+
+	def _Aggregate(self) -> List[int]:
+		"""
+		Return the cached counts of this item and all nested items. If not cached yet, they are aggregated bottom-up.
+
+		:returns: List of counts in the order of :data:`SubtreeAggregate`.
+		"""
+		if (aggregate := self._subtreeAggregate) is None:
+			self._MaterializeChildren()
+			aggregate = [
+				self._totalErrors,
+				self._alertCountWarnings,
+				self._alertCountErrors,
+				self._alertCountFailures,
+				self._passedCount,
+				self._affirmCount,
+				self._requirementsPassed,
+				self._requirementsGoal,
+				self._disabledAlertCountWarnings,
+				self._disabledAlertCountErrors,
+				self._disabledAlertCountFailures
+			]
+			for child in self._children.values():
+				for i, count in enumerate(child._Aggregate()):
+					aggregate[i] += count
+
+			self._subtreeAggregate = aggregate
+
+		return aggregate
+
+	def _AddToAggregate(self, child: "AlertLogItem") -> None:
+		"""
+		Add an attached child's counts to the cached aggregates of this item and all its ancestors.
+
+		If this item's counts aren't aggregated yet, nothing needs to be updated. The walk stops at the first ancestor,
+		whose counts aren't aggregated yet, because none of its ancestors can be aggregated either.
+
+		:param child: The attached child item.
+		"""
+		if self._subtreeAggregate is None:
+			return
+
+		delta = child._Aggregate()
+		item = self
+		while item is not None and (aggregate := item._subtreeAggregate) is not None:
+			for i, count in enumerate(delta):
+				aggregate[i] += count
+			item = item._parent
+
+	def _RemoveFromAggregate(self, child: "AlertLogItem") -> None:
+		"""
+		Subtract a detached child's counts from the cached aggregates of this item and all its ancestors.
+
+		:param child: The detached child item.
+		"""
+		if self._subtreeAggregate is None:
+			return
+
+		delta = child._subtreeAggregate
+		item = self
+		while item is not None and (aggregate := item._subtreeAggregate) is not None:
+			for i, count in enumerate(delta):
+				aggregate[i] -= count
+			item = item._parent
+
+	def _Root(self) -> "AlertLogItem":
+		"""
+		Return the top-most item (root) of the AlertLog hierarchy this item belongs to.
+
+		:returns: The hierarchy's root item.
+		"""
+		item = self
+		while item._parent is not None:
+			item = item._parent
+
+		return item
+
+	def _AddToIndex(self, item: "AlertLogItem") -> None:
+		"""
+		Hook called on the root item, when an item (and its subtree) was attached to this hierarchy.
+
+		:param item: The attached item.
+		"""
+
+	def _RemoveFromIndex(self, item: "AlertLogItem") -> None:
+		"""
+		Hook called on the root item, before an item (and its subtree) is detached from this hierarchy.
+
+		:param item: The item to detach.
+		"""
+
 	@property
 	def Parent(self) -> Nullable["AlertLogItem"]:
 		"""
@@ -190,19 +336,26 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 
 	@Parent.setter
 	def Parent(self, value: Nullable["AlertLogItem"]) -> None:
-		if value is None:
-			del self._parent._children[self._name]
-		else:
+		if value is not None:
 			if not isinstance(value, AlertLogItem):
 				ex = TypeError(f"Parameter 'value' is not an AlertLogItem.")
 				ex.add_note(f"Got type '{getFullyQualifiedName(value)}'.")
 				raise ex
-			elif self._name in value._children:
+
+			value._MaterializeChildren()
+			if self._name in value._children:
 				raise DuplicateItemException(f"AlertLogItem '{self._name}' already exists in '{value._name}'.")
 
-			value._children[self._name] = self
+		if self._parent is not None:
+			self._parent._Root()._RemoveFromIndex(self)
+			self._parent._RemoveFromAggregate(self)
+			del self._parent._children[self._name]
 
 		self._parent = value
+		if value is not None:
+			value._children[self._name] = self
+			value._AddToAggregate(self)
+			value._Root()._AddToIndex(self)
 
 	@readonly
 	def Name(self) -> str:
@@ -311,8 +464,57 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 		"""
 		return self._disabledAlertCountFailures
 
+	@readonly
+	def SubtreeAggregate(self) -> AlertLogAggregateReturnType:
+		"""
+		Read-only property to access the aggregated counts of this item and all nested items (:attr:`_subtreeAggregate`).
+
+		The tuple contains: total errors, warnings, errors, failures, passed affirmations, affirmations, passed
+		requirements, requirements goal, disabled warnings, disabled errors and disabled failures.
+
+		:returns: Aggregated counts of the item's subtree.
+		"""
+		return tuple(self._Aggregate())
+
+	@readonly
+	def SubtreeTotalErrors(self) -> int:
+		"""
+		Read-only property to access the total error count of this item and all nested items.
+
+		:returns: Total errors of the item's subtree.
+		"""
+		return self._Aggregate()[0]
+
+	@readonly
+	def SubtreeAlertCountWarnings(self) -> int:
+		"""
+		Read-only property to access the warning count of this item and all nested items.
+
+		:returns: Warnings of the item's subtree.
+		"""
+		return self._Aggregate()[1]
+
+	@readonly
+	def SubtreeAlertCountErrors(self) -> int:
+		"""
+		Read-only property to access the error count of this item and all nested items.
+
+		:returns: Errors of the item's subtree.
+		"""
+		return self._Aggregate()[2]
+
+	@readonly
+	def SubtreeAlertCountFailures(self) -> int:
+		"""
+		Read-only property to access the failure count of this item and all nested items.
+
+		:returns: Failures of the item's subtree.
+		"""
+		return self._Aggregate()[3]
+
 	@readonly
 	def Children(self) -> Dict[str, "AlertLogItem"]:
+		self._MaterializeChildren()
 		return self._children
 
 	def __iter__(self) -> Iterator["AlertLogItem"]:
@@ -321,6 +523,7 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 
 		:returns: An iterator of child items.
 		"""
+		self._MaterializeChildren()
 		return iter(self._children.values())
 
 	def __len__(self) -> int:
@@ -329,6 +532,7 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 
 		:returns: The number of nested AlertLog items.
 		"""
+		self._MaterializeChildren()
 		return len(self._children)
 
 	def __getitem__(self, name: str) -> "AlertLogItem":
@@ -338,6 +542,7 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 		:returns:         The referenced child.
 		:raises KeyError: When the child referenced by parameter 'name' doesn't exist.
 		"""
+		self._MaterializeChildren()
 		return self._children[name]
 
 	def ToTree(self, format: Callable[[Node], str] = _format) -> Node:
@@ -347,6 +552,7 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 		:params format: A user-defined :external+pyTool:ref:`pyTooling Tree <STRUCT/Tree>` formatting function.
 		:returns:       A tree of nodes referencing an AlertLog item.
 		"""
+		self._MaterializeChildren()
 		node = Node(
 			value=self,
 			keyValuePairs={
@@ -364,6 +570,10 @@ class AlertLogItem(metaclass=ExtendedType, slots=True):
 
 		return node
 
+	def __getstate__(self) -> Dict[str, Any]:
+		self._MaterializeChildren()
+		return {slotName: getattr(self, slotName) for slotName in self.__allSlots__}
+
 
 @export
 class Settings(metaclass=ExtendedType, mixin=True):
@@ -393,28 +603,50 @@ class Document(AlertLogItem, Settings):
 
 	When analyzing and converting the document, the YAML analysis duration as well as the model conversion duration gets
 	captured.
+
+	In lazy mode, only the document's root element is converted by :meth:`Parse`. Child items of each level are converted
+	when they are accessed for the first time via :attr:`Children`, iteration, indexing or :meth:`ToTree`.
+
+	Nested items can be looked up by their hierarchical name (e.g. ``"subordinate_1/Protocol Error"``) using
+	:meth:`Find`. The underlying path index is built after conversion (or on first use in lazy mode) and kept in sync
+	when items are attached or detached via :attr:`AlertLogItem.Parent`.
 	"""
 
 	_path:                   Path                       #: Path to the YAML file.
+	_loader:                 YAMLLoader                 #: YAML loader used for analysis.
+	_lazy:                   bool                       #: If true, child items are converted on first access.
 	_yamlDocument:           Nullable[YAML]             #: Internal YAML document instance.
 	_version:                Nullable[SemanticVersion]  #: YAML data structure version.
+	_index:                  Nullable[Dict[str, AlertLogItem]]  #: Index of nested items by hierarchical name.
 
 	_analysisDuration:        Nullable[timedelta]       #: YAML file analysis duration in seconds.
 	_modelConversionDuration: Nullable[timedelta]       #: Data structure conversion duration in seconds.
 
-	def __init__(self, filename: Path, analyzeAndConvert: bool = False) -> None:
+	def __init__(
+		self,
+		filename: Path,
+		analyzeAndConvert: bool = False,
+		loader: YAMLLoader | str = YAMLLoader.RoundTrip,
+		lazy: bool = False
+	) -> None:
 		"""
 		Initializes an AlertLog YAML document.
 
 		:param filename:          Path to the YAML file.
 		:param analyzeAndConvert: If true, analyze the YAML document and convert the content to an AlertLog data model instance.
+		:param loader:            YAML loader used for analysis (:class:`~pyEDAA.OSVVM.YAMLLoader` or its value, e.g. ``"fast"``).
+		:param lazy:              If true, child items are converted when accessed for the first time.
+		:raises ValueError:       When parameter 'loader' is not a known YAML loader.
 		"""
 		super().__init__("", parent=None)
 		Settings.__init__(self)
 
 		self._path = filename
+		self._loader = YAMLLoader(loader)
+		self._lazy = lazy
 		self._yamlDocument = None
 		self._version = None
+		self._index = None
 
 		self._analysisDuration = None
 		self._modelConversionDuration =  None
@@ -423,6 +655,62 @@ class Document(AlertLogItem, Settings):
 			self.Analyze()
 			self.Parse()
 
+	@classmethod
+	def Load(
+		cls,
+		filename: Path,
+		loader: YAMLLoader | str = YAMLLoader.RoundTrip,
+		cache: Nullable[CacheDirectory] = None
+	) -> "Document":
+		"""
+		Load an AlertLog YAML document, analyze it and convert the content to an AlertLog hierarchy.
+
+		If a cache is given, the AlertLog hierarchy is looked up in the cache by the YAML file's resolved path,
+		modification time, size and pyEDAA.OSVVM's version. On a cache miss, the YAML file is analyzed and converted, then
+		the result is stored in the cache.
+
+		.. note::
+
+		   The internal YAML document tree isn't cached. A document returned from the cache can't be parsed again.
+
+		:param filename:           Path to the YAML file.
+		:param loader:             YAML loader used for analysis on a cache miss.
+		:param cache:              Optional on-disk cache of converted documents.
+		:returns:                  The converted AlertLog document.
+		:raises AlertLogException: If YAML file doesn't exist.
+		"""
+		if cache is None:
+			return cls(filename, analyzeAndConvert=True, loader=loader)
+
+		try:
+			stat = filename.stat()
+		except OSError as ex:
+			raise AlertLogException(f"OSVVM AlertLog YAML file '{filename}' does not exist.") from ex
+
+		key = cache.CreateKey(cls.__qualname__, filename.resolve(), stat.st_mtime_ns, stat.st_size, __version__)
+		if (document := cache.Get(key)) is not None:
+			return document
+
+		document = cls(filename, analyzeAndConvert=True, loader=loader)
+		cache.Put(key, document)
+
+		return document
+
+	def __getstate__(self) -> Dict[str, Any]:
+		state = super().__getstate__()
+		state["_yamlDocument"] = None
+
+		return state
+
+	@readonly
+	def Lazy(self) -> bool:
+		"""
+		Read-only property returning true, if child items are converted on first access (:attr:`_lazy`).
+
+		:returns: True, if child items are converted lazily.
+		"""
+		return self._lazy
+
 	@property
 	def Path(self) -> Path:
 		"""
@@ -432,6 +720,15 @@ class Document(AlertLogItem, Settings):
 		"""
 		return self._path
 
+	@readonly
+	def Loader(self) -> YAMLLoader:
+		"""
+		Read-only property to access the YAML loader used for analysis (:attr:`_loader`).
+
+		:returns: The YAML loader.
+		"""
+		return self._loader
+
 	@readonly
 	def AnalysisDuration(self) -> timedelta:
 		"""
@@ -468,18 +765,35 @@ class Document(AlertLogItem, Settings):
 				from FileNotFoundError(f"File '{self._path}' not found.")
 
 		with Stopwatch() as sw:
-			try:
-				yamlReader = YAML()
-				self._yamlDocument = yamlReader.load(self._path)
-			except Exception as ex:
-				raise AlertLogException(f"Couldn't open '{self._path}'.") from ex
+			self._yamlDocument = self._LoadYAML(self._loader)
 
 		self._analysisDuration = timedelta(seconds=sw.Duration)
 
+	def _LoadYAML(self, loader: YAMLLoader) -> Dict:
+		"""
+		Read the YAML file (specified by :attr:`_path`) with the given YAML loader.
+
+		:param loader:             YAML loader to use.
+		:returns:                  The YAML document's root node.
+		:raises AlertLogException: If YAML file can't be opened.
+		"""
+		try:
+			yamlReader = YAML(typ="safe") if loader is YAMLLoader.Fast else YAML()
+			return yamlReader.load(self._path)
+		except Exception as ex:
+			raise AlertLogException(f"Couldn't open '{self._path}'.") from ex
+
 	def Parse(self) -> None:
 		"""
 		Convert the YAML data structure to a hierarchy of :class:`AlertLogItem` instances.
 
+		If the document was analyzed by the fast YAML loader and the conversion fails, the YAML file is re-analyzed by the
+		round-trip loader and converted again, so the raised exception carries line numbers.
+
+		.. note::
+
+		   In lazy mode, conversion errors of child items are raised when these items are accessed for the first time.
+
 		:raises AlertLogException: If YAML file was not analyzed.
 		"""
 		if self._yamlDocument is None:
@@ -488,60 +802,381 @@ class Document(AlertLogItem, Settings):
 			raise ex
 
 		with Stopwatch() as sw:
-			self._version = SemanticVersion.Parse(self._yamlDocument["Version"])
+			self._index = None
+			self._subtreeAggregate = None
+			try:
+				self._Parse(self._yamlDocument)
+			except OSVVMException as ex:
+				if self._loader is not YAMLLoader.Fast:
+					raise ex
+
+				self._children = {}
+				self._pendingChildren = None
+				self._subtreeAggregate = None
+				self._Parse(self._LoadYAML(YAMLLoader.RoundTrip))
+				raise ex
+
+			if not self._lazy:
+				self._Aggregate()
+				self._BuildIndex()
+
+		self._modelConversionDuration = timedelta(seconds=sw.Duration)
+
+	def _Parse(self, yamlDocument: Dict) -> None:
+		"""
+		Convert the YAML data structure's root node to a hierarchy of :class:`AlertLogItem` instances.
+
+		:param yamlDocument:       The YAML document's root node.
+		:raises AlertLogException: If the YAML data structure version is unsupported.
+		"""
+		self._version = SemanticVersion.Parse(yamlDocument["Version"])
+		if not (self._version >> "0.1"):
+			ex = AlertLogException(f"Unsupported YAML data structure version {self._version} for file '{self._path}'.")
+			ex.add_note("Supported versions are: 1.0")
+			raise ex
+
+		self._name = self._ParseStrFieldFromYAML(yamlDocument, "Name")
+		self._status = AlertLogStatus.Parse(self._ParseStrFieldFromYAML(yamlDocument, "Status"))
+		if self._lazy:
+			self._pendingChildren = self._DeferChildren(yamlDocument)
+		else:
+			for child in self._ParseSequenceFromYAML(yamlDocument, "Children"):
+				_ = self._ParseAlertLogItem(child, self)
+
+	def ParseStreaming(self) -> None:
+		"""
+		Analyze and convert the YAML file (specified by :attr:`_path`) in a single pass by consuming YAML parser events.
+
+		In contrast to :meth:`Analyze` followed by :meth:`Parse`, no YAML document tree is materialized. Each
+		:class:`AlertLogItem` is created when its YAML mapping is closed, so peak memory is bounded by the depth of the
+		AlertLog hierarchy rather than by the document's size. The resulting hierarchy is identical.
+
+		.. note::
+
+		   As analysis and conversion are interleaved, the overall duration is reported as :data:`ModelConversionDuration`
+		   and :data:`AnalysisDuration` is zero.
+
+		:raises AlertLogException: If YAML file doesn't exist.
+		:raises AlertLogException: If YAML file can't be opened or contains unsupported YAML constructs.
+		"""
+		if not self._path.exists():
+			raise AlertLogException(f"OSVVM AlertLog YAML file '{self._path}' does not exist.") \
+				from FileNotFoundError(f"File '{self._path}' not found.")
+
+		with Stopwatch() as sw:
+			self._index = None
+			self._subtreeAggregate = None
+			yamlReader = YAML(typ="safe")
+			try:
+				with self._path.open("rb") as file:
+					events = yamlReader.parse(file)
+					for event in events:
+						if isinstance(event, MappingStartEvent):
+							break
+					else:
+						raise AlertLogException(f"OSVVM AlertLog YAML file '{self._path}' contains no YAML mapping.")
+
+					yamlDocument = self._ReadStreamedItem(events, yamlReader)
+			except OSVVMException as ex:
+				raise ex
+			except Exception as ex:
+				raise AlertLogException(f"Couldn't open '{self._path}'.") from ex
+
+			self._version = SemanticVersion.Parse(yamlDocument["Version"])
 			if not (self._version >> "0.1"):
 				ex = AlertLogException(f"Unsupported YAML data structure version {self._version} for file '{self._path}'.")
 				ex.add_note("Supported versions are: 1.0")
 				raise ex
 
-			self._name = self._ParseStrFieldFromYAML(self._yamlDocument, "Name")
-			self._status = AlertLogStatus.Parse(self._ParseStrFieldFromYAML(self._yamlDocument, "Status"))
-			for child in self._ParseSequenceFromYAML(self._yamlDocument, "Children"):
-				_ = self._ParseAlertLogItem(child, self)
+			self._name = self._ParseStrFieldFromYAML(yamlDocument, "Name")
+			self._status = AlertLogStatus.Parse(self._ParseStrFieldFromYAML(yamlDocument, "Status"))
+			for child in self._ParseSequenceFromYAML(yamlDocument, "Children"):
+				child.Parent = self
 
+			self._Aggregate()
+			self._BuildIndex()
+
+		self._analysisDuration = timedelta()
 		self._modelConversionDuration = timedelta(seconds=sw.Duration)
 
+	def _BuildIndex(self) -> None:
+		"""Build the index of nested items by hierarchical name."""
+		self._index = {}
+		for child in self:
+			self._IndexItem(child, child._name)
+
+	def _IndexItem(self, item: AlertLogItem, path: str) -> None:
+		"""
+		Add an item and its subtree to the index.
+
+		:param item: Item to add.
+		:param path: Hierarchical name of the item.
+		"""
+		self._index[path] = item
+		for child in item:
+			self._IndexItem(child, f"{path}/{child._name}")
+
+	def _UnindexItem(self, item: AlertLogItem, path: str) -> None:
+		"""
+		Remove an item and its subtree from the index.
+
+		:param item: Item to remove.
+		:param path: Hierarchical name of the item.
+		"""
+		del self._index[path]
+		for child in item._children.values():
+			self._UnindexItem(child, f"{path}/{child._name}")
+
+	def _AddToIndex(self, item: AlertLogItem) -> None:
+		if self._index is None:
+			return
+
+		self._IndexItem(item, self.GetPath(item))
+
+	def _RemoveFromIndex(self, item: AlertLogItem) -> None:
+		if self._index is None:
+			return
+
+		self._UnindexItem(item, self.GetPath(item))
+
+	def GetPath(self, item: AlertLogItem) -> str:
+		"""
+		Return the hierarchical name of a nested item relative to this document.
+
+		:param item:               A nested item.
+		:returns:                  The item's names from the document's top-level down to the item, separated by ``/``.
+		:raises AlertLogException: If the item isn't part of this document.
+		"""
+		names = []
+		while item is not self:
+			if item is None:
+				raise AlertLogException(f"AlertLogItem is not part of AlertLog document '{self._name}'.")
+
+			names.append(item._name)
+			item = item._parent
+
+		return "/".join(reversed(names))
+
+	def Find(self, path: str) -> Nullable[AlertLogItem]:
+		"""
+		Look up a nested item by hierarchical name.
+
+		:param path: The item's names from the document's top-level down to the item, separated by ``/``.
+		:returns:    The nested item, or ``None`` if no such item exists.
+		"""
+		if self._index is None:
+			self._BuildIndex()
+
+		return self._index.get(path, None)
+
+	def Glob(self, pattern: str) -> Iterator[AlertLogItem]:
+		"""
+		Find all nested items whose hierarchical name matches a glob pattern.
+
+		Each ``/``-separated segment of the pattern is matched against an item's name using :func:`fnmatch.fnmatchcase`.
+		A segment ``**`` matches any number of hierarchy levels (including none). Segments without wildcards are looked up
+		directly, so only matching subtrees are visited.
+
+		:param pattern: Glob pattern of hierarchical names (e.g. ``"*/Protocol*"`` or ``"**/Data Check"``).
+		:returns:       An iterator of matching items in hierarchy order.
+		"""
+		seen = set()
+		for item in self._Glob(self, pattern.split("/"), 0):
+			if item not in seen:
+				seen.add(item)
+				yield item
+
+	def _Glob(self, item: AlertLogItem, segments: List[str], index: int) -> Iterator[AlertLogItem]:
+		if index == len(segments):
+			if item is not self:
+				yield item
+			return
+
+		segment = segments[index]
+		if segment == "**":
+			yield from self._Glob(item, segments, index + 1)
+			for child in item:
+				yield from self._Glob(child, segments, index)
+		elif any(c in segment for c in "*?["):
+			for child in item:
+				if fnmatchcase(child._name, segment):
+					yield from self._Glob(child, segments, index + 1)
+		elif (child := item.Children.get(segment, None)) is not None:
+			yield from self._Glob(child, segments, index + 1)
+
+	def FindAll(self, predicate: Callable[[AlertLogItem], bool], withErrorsOnly: bool = False) -> Iterator[AlertLogItem]:
+		"""
+		Find all nested items matching a predicate.
+
+		:param predicate:      Callable returning true for matching items.
+		:param withErrorsOnly: If true, subtrees without any errors are skipped based on :data:`AlertLogItem.SubtreeTotalErrors`.
+		:returns:              An iterator of matching items in hierarchy order.
+		"""
+		stack = list(reversed(self.Children.values()))
+		while stack:
+			item = stack.pop()
+			if withErrorsOnly and item._Aggregate()[0] == 0:
+				continue
+			if predicate(item):
+				yield item
+
+			stack.extend(reversed(item.Children.values()))
+
+	def Noisiest(self, count: int = 20) -> List[AlertLogItem]:
+		"""
+		Return the nested items whose subtrees have the most warnings, errors and failures.
+
+		:param count: Number of items to return.
+		:returns:     List of items ordered by descending alert count of their subtrees.
+		"""
+		def alertCount(item: AlertLogItem) -> int:
+			aggregate = item._Aggregate()
+			return aggregate[1] + aggregate[2] + aggregate[3]
+
+		return nlargest(count, self.FindAll(lambda item: True), key=alertCount)
+
+	def _ReadStreamedItem(self, events: Iterator[Event], yamlReader: YAML) -> Dict[str, Any]:
+		"""
+		Read the fields of an AlertLog item's YAML mapping from a stream of YAML events.
+
+		The mapping's start event was already consumed. All fields are read as plain Python values, except for field
+		``Children``, whose mappings are converted to :class:`AlertLogItem` instances as soon as they are closed.
+
+		:param events:             Stream of YAML events.
+		:param yamlReader:         YAML instance providing the scalar resolver and constructor.
+		:returns:                  Dictionary of fields, where ``Children`` is a list of AlertLog items.
+		:raises AlertLogException: If an item can't be converted. The exception is annotated with the item's line number.
+		"""
+		fields = {}
+		while not isinstance(event := next(events), MappingEndEvent):
+			key = self._ReadStreamedValue(events, event, yamlReader)
+			event = next(events)
+			if key != "Children" or not isinstance(event, SequenceStartEvent):
+				fields[key] = self._ReadStreamedValue(events, event, yamlReader)
+				continue
+
+			children = []
+			while not isinstance(event := next(events), SequenceEndEvent):
+				if not isinstance(event, MappingStartEvent):
+					raise AlertLogException(f"Item in sequence 'Children' is not a mapping (line {event.start_mark.line + 1}).")
+
+				itemFields = self._ReadStreamedItem(events, yamlReader)
+				try:
+					children.append(self._CreateAlertLogItem(itemFields, self._ParseSequenceFromYAML(itemFields, "Children")))
+				except OSVVMException as ex:
+					ex.add_note(f"AlertLog item starts at line {event.start_mark.line + 1}.")
+					raise ex
+
+			fields[key] = children
+
+		return fields
+
+	def _ReadStreamedValue(self, events: Iterator[Event], event: Event, yamlReader: YAML) -> Any:
+		"""
+		Read a YAML value (scalar, mapping or sequence) from a stream of YAML events.
+
+		:param events:             Stream of YAML events.
+		:param event:              The value's first event.
+		:param yamlReader:         YAML instance providing the scalar resolver and constructor.
+		:returns:                  The value as plain Python data structure.
+		:raises AlertLogException: If the YAML stream contains aliases or unexpected events.
+		"""
+		if isinstance(event, ScalarEvent):
+			tag = event.ctag
+			if tag is None or str(tag) == "!":
+				tag = yamlReader.resolver.resolve(ScalarNode, event.value, event.implicit)
+
+			# The constructor caches each constructed node; drop the entry, so memory isn't growing with the document.
+			constructor = yamlReader.constructor
+			node = ScalarNode(tag, event.value, style=event.style)
+			try:
+				return constructor.construct_object(node)
+			finally:
+				constructor.constructed_objects.pop(node, None)
+		elif isinstance(event, MappingStartEvent):
+			mapping = {}
+			while not isinstance(event := next(events), MappingEndEvent):
+				key = self._ReadStreamedValue(events, event, yamlReader)
+				mapping[key] = self._ReadStreamedValue(events, next(events), yamlReader)
+			return mapping
+		elif isinstance(event, SequenceStartEvent):
+			sequence = []
+			while not isinstance(event := next(events), SequenceEndEvent):
+				sequence.append(self._ReadStreamedValue(events, event, yamlReader))
+			return sequence
+		elif isinstance(event, AliasEvent):
+			raise AlertLogException(f"YAML aliases are not supported in OSVVM AlertLog files (line {event.start_mark.line + 1}).")
+		else:  # pragma: no cover
+			raise AlertLogException(f"Unexpected YAML event '{event.__class__.__name__}'.")
+
 	@staticmethod
-	def _ParseSequenceFromYAML(node: CommentedMap, fieldName: str) -> Nullable[CommentedSeq]:
+	def _NodeLocation(node: Dict) -> str:
+		"""
+		Format the location of a YAML node, if line information is available (round-trip loader).
+
+		:param node: YAML node.
+		:returns:    Location suffix for exception messages.
+		"""
+		if isinstance(node, CommentedMap):
+			return f" starting at line {node.lc.line + 1}"
+
+		return ""
+
+	@staticmethod
+	def _FieldLocation(node: Dict, fieldName: str) -> str:
+		"""
+		Format the location of a YAML node's field, if line information is available (round-trip loader).
+
+		:param node:      YAML node.
+		:param fieldName: Name of the field.
+		:returns:         Location suffix for exception notes.
+		"""
+		if isinstance(node, CommentedMap):
+			return f" at line {node.lc.data[fieldName][0] + 1}"
+
+		return ""
+
+	@classmethod
+	def _ParseSequenceFromYAML(cls, node: Dict, fieldName: str) -> Nullable[List]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = OSVVMException(f"Sequence field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = OSVVMException(f"Sequence field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
 		if value is None:
 			return ()
-		elif not isinstance(value, CommentedSeq):
+		elif not isinstance(value, list):
 			ex = AlertLogException(f"Field '{fieldName}' is not a sequence.")  # TODO: from TypeError??
-			ex.add_note(f"Found type {value.__class__.__name__} at line {node._yaml_line_col.data[fieldName][0] + 1}.")
+			ex.add_note(f"Found type {value.__class__.__name__}{cls._FieldLocation(node, fieldName)}.")
 			raise ex
 
 		return value
 
-	@staticmethod
-	def _ParseMapFromYAML(node: CommentedMap, fieldName: str) -> Nullable[CommentedMap]:
+	@classmethod
+	def _ParseMapFromYAML(cls, node: Dict, fieldName: str) -> Nullable[Dict]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = OSVVMException(f"Dictionary field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = OSVVMException(f"Dictionary field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
 		if value is None:
 			return {}
-		elif not isinstance(value, CommentedMap):
+		elif not isinstance(value, dict):
 			ex = AlertLogException(f"Field '{fieldName}' is not a list.")  # TODO: from TypeError??
-			ex.add_note(f"Type mismatch found for line {node._yaml_line_col.data[fieldName][0] + 1}.")
+			ex.add_note(f"Type mismatch found{cls._FieldLocation(node, fieldName)}.")
 			raise ex
 		return value
 
-	@staticmethod
-	def _ParseStrFieldFromYAML(node: CommentedMap, fieldName: str) -> Nullable[str]:
+	@classmethod
+	def _ParseStrFieldFromYAML(cls, node: Dict, fieldName: str) -> Nullable[str]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = OSVVMException(f"String field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = OSVVMException(f"String field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
@@ -550,12 +1185,12 @@ class Document(AlertLogItem, Settings):
 
 		return value
 
-	@staticmethod
-	def _ParseIntFieldFromYAML(node: CommentedMap, fieldName: str) -> Nullable[int]:
+	@classmethod
+	def _ParseIntFieldFromYAML(cls, node: Dict, fieldName: str) -> Nullable[int]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = OSVVMException(f"Integer field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = OSVVMException(f"Integer field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
@@ -564,7 +1199,38 @@ class Document(AlertLogItem, Settings):
 
 		return value
 
-	def _ParseAlertLogItem(self, child: CommentedMap, parent: Nullable[AlertLogItem] = None) -> AlertLogItem:
+	def _ParseAlertLogItem(self, child: Dict, parent: Nullable[AlertLogItem] = None) -> AlertLogItem:
+		if self._lazy:
+			alertLogItem = self._CreateAlertLogItem(child, None, parent)
+			alertLogItem._pendingChildren = self._DeferChildren(child)
+			return alertLogItem
+
+		return self._CreateAlertLogItem(
+			child,
+			(self._ParseAlertLogItem(ch) for ch in self._ParseSequenceFromYAML(child, "Children")),
+			parent
+		)
+
+	def _DeferChildren(self, yamlItem: Dict) -> Nullable[Callable[[], Iterable[AlertLogItem]]]:
+		"""
+		Create a callable converting the YAML item's children to AlertLog items when called.
+
+		The YAML item's children sequence is validated immediately, the children's content is converted when called.
+
+		:param yamlItem: YAML node containing a ``Children`` sequence.
+		:returns:        A callable producing the child items, or ``None`` if the YAML item has no children.
+		"""
+		if not (yamlChildren := self._ParseSequenceFromYAML(yamlItem, "Children")):
+			return None
+
+		return partial(map, self._ParseAlertLogItem, yamlChildren)
+
+	def _CreateAlertLogItem(
+		self,
+		child: Dict,
+		children: Nullable[Iterable[AlertLogItem]],
+		parent: Nullable[AlertLogItem] = None
+	) -> AlertLogItem:
 		results = self._ParseMapFromYAML(child, "Results")
 		yamlAlertCount = self._ParseMapFromYAML(results, "AlertCount")
 		yamlDisabledAlertCount = self._ParseMapFromYAML(results, "DisabledAlertCount")
@@ -582,8 +1248,31 @@ class Document(AlertLogItem, Settings):
 			self._ParseIntFieldFromYAML(yamlDisabledAlertCount, "Warning"),
 			self._ParseIntFieldFromYAML(yamlDisabledAlertCount, "Error"),
 			self._ParseIntFieldFromYAML(yamlDisabledAlertCount, "Failure"),
-			children=(self._ParseAlertLogItem(ch) for ch in self._ParseSequenceFromYAML(child, "Children")),
+			children=children,
 			parent=parent
 		)
 
 		return alertLogItem
+
+
+@export
+def LoadAlertLogs(
+	paths: Iterable[Path],
+	workers: Nullable[int] = None,
+	loader: YAMLLoader | str = YAMLLoader.RoundTrip
+) -> BatchResult:
+	"""
+	Load many AlertLog YAML files in a process pool.
+
+	Each file is analyzed and converted in a worker process. The resulting :class:`Document` is shipped back without its
+	internal YAML document tree. Per-file durations are available via :data:`Document.AnalysisDuration` and
+	:data:`Document.ModelConversionDuration`, the aggregate throughput via :data:`~pyEDAA.OSVVM.Batch.BatchResult.Throughput`.
+	Files failing to load are collected in :data:`~pyEDAA.OSVVM.Batch.BatchResult.Failures`.
+
+	:param paths:       Paths to AlertLog YAML files.
+	:param workers:     Number of worker processes. If ``None``, the number of CPUs is used.
+	:param loader:      YAML loader used for analysis.
+	:returns:           Loaded AlertLog documents and collected failures.
+	:raises ValueError: When parameter 'loader' is not a known YAML loader.
+	"""
+	return LoadBatch(partial(Document, analyzeAndConvert=True, loader=YAMLLoader(loader)), paths, workers)
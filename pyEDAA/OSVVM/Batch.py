@@ -0,0 +1,205 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2021-2026 Electronic Design Automation Abstraction (EDA²)                                                  #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Batch loading of many OSVVM report files using a process pool."""
+from concurrent.futures    import Executor, ProcessPoolExecutor, ThreadPoolExecutor, BrokenExecutor
+from datetime              import timedelta
+from enum                  import Enum, auto
+from multiprocessing       import get_context
+from pathlib               import Path
+from typing                import Optional as Nullable, Any, Callable, Dict, Iterable
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Stopwatch   import Stopwatch
+
+
+@export
+class ExecutorKind(Enum):
+	"""Describes how a batch was executed."""
+	Serial =    auto()  #: Files were loaded one after another in the calling process.
+	Processes = auto()  #: Files were loaded in a process pool.
+	Threads =   auto()  #: Files were loaded in a thread pool, because a process pool couldn't be used.
+
+
+@export
+class BatchResult(metaclass=ExtendedType, slots=True):
+	"""
+	Result of loading many files as a batch.
+
+	Successfully loaded documents and failures are collected per file, so a single broken file doesn't abort the batch.
+	"""
+
+	_documents: Dict[Path, Any]        #: Loaded documents by path.
+	_failures:  Dict[Path, Exception]  #: Exceptions raised while loading a file by path.
+	_duration:  timedelta              #: Wall-clock duration of the batch.
+	_executor:  ExecutorKind           #: How the batch was executed.
+
+	def __init__(
+		self,
+		documents: Dict[Path, Any],
+		failures: Dict[Path, Exception],
+		duration: timedelta,
+		executor: ExecutorKind = ExecutorKind.Serial
+	) -> None:
+		"""
+		Initializes a batch result.
+
+		:param documents: Loaded documents by path.
+		:param failures:  Exceptions raised while loading a file by path.
+		:param duration:  Wall-clock duration of the batch.
+		:param executor:  How the batch was executed.
+		"""
+		self._documents = documents
+		self._failures =  failures
+		self._duration =  duration
+		self._executor =  executor
+
+	@readonly
+	def Documents(self) -> Dict[Path, Any]:
+		"""
+		Read-only property to access the loaded documents (:attr:`_documents`).
+
+		:returns: Loaded documents by path in order of the given paths.
+		"""
+		return self._documents
+
+	@readonly
+	def Failures(self) -> Dict[Path, Exception]:
+		"""
+		Read-only property to access the collected failures (:attr:`_failures`).
+
+		:returns: Exceptions raised while loading a file by path.
+		"""
+		return self._failures
+
+	@readonly
+	def Duration(self) -> timedelta:
+		"""
+		Read-only property to access the wall-clock duration of the batch (:attr:`_duration`).
+
+		:returns: Duration of the batch.
+		"""
+		return self._duration
+
+	@readonly
+	def Executor(self) -> ExecutorKind:
+		"""
+		Read-only property to access how the batch was executed (:attr:`_executor`).
+
+		:returns: Kind of executor used for the batch.
+		"""
+		return self._executor
+
+	@readonly
+	def Throughput(self) -> float:
+		"""
+		Read-only property returning the aggregate throughput of the batch.
+
+		:returns: Number of processed files (loaded or failed) per second.
+		"""
+		seconds = self._duration.total_seconds()
+		return len(self) / seconds if seconds > 0.0 else 0.0
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of processed files (loaded or failed).
+
+		:returns: Number of processed files.
+		"""
+		return len(self._documents) + len(self._failures)
+
+	def __str__(self) -> str:
+		return f"{len(self._documents)} loaded, {len(self._failures)} failed in {self._duration.total_seconds():.3f}s ({self.Throughput:.1f} files/s)"
+
+
+@export
+def LoadBatch(loadFunction: Callable[[Path], Any], paths: Iterable[Path], workers: Nullable[int] = None) -> BatchResult:
+	"""
+	Load many files by calling a load function per file in a process pool.
+
+	The load function and the returned documents must be picklable. Worker processes are spawned instead of forked, so
+	the load function must be importable in a fresh interpreter. If ``workers`` is ``1``, files are loaded serially in the
+	calling process. Duplicate paths are loaded once.
+
+	If the process pool can't be started or breaks (e.g. on platforms without working process spawning or when a worker
+	process is killed), the batch is repeated in a thread pool.
+
+	:param loadFunction: Picklable callable loading a single file.
+	:param paths:        Paths of files to load.
+	:param workers:      Number of worker processes or threads. If ``None``, the executor's default is used.
+	:returns:            Loaded documents and collected failures.
+	:raises ValueError:  When parameter 'workers' is not a positive integer.
+	"""
+	if workers is not None and workers < 1:
+		raise ValueError(f"Parameter 'workers' must be a positive integer.")
+
+	paths = list(dict.fromkeys(paths))
+	documents = {}
+	failures = {}
+
+	with Stopwatch() as sw:
+		if workers == 1 or len(paths) <= 1:
+			executorKind = ExecutorKind.Serial
+			for path in paths:
+				try:
+					documents[path] = loadFunction(path)
+				except Exception as ex:
+					failures[path] = ex
+		else:
+			try:
+				executorKind = ExecutorKind.Processes
+				with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+					_CollectFutures(executor, loadFunction, paths, documents, failures)
+			except (OSError, NotImplementedError, BrokenExecutor):
+				executorKind = ExecutorKind.Threads
+				documents.clear()
+				failures.clear()
+				with ThreadPoolExecutor(max_workers=workers) as executor:
+					_CollectFutures(executor, loadFunction, paths, documents, failures)
+
+	return BatchResult(documents, failures, timedelta(seconds=sw.Duration), executorKind)
+
+
+def _CollectFutures(
+	executor: Executor,
+	loadFunction: Callable[[Path], Any],
+	paths: Iterable[Path],
+	documents: Dict[Path, Any],
+	failures: Dict[Path, Exception]
+) -> None:
+	futures = [(path, executor.submit(loadFunction, path)) for path in paths]
+	for path, future in futures:
+		try:
+			documents[path] = future.result()
+		except BrokenExecutor:
+			raise
+		except Exception as ex:
+			failures[path] = ex
@@ -29,27 +29,150 @@
 # ==================================================================================================================== #
 #
 """Reader for OSVVM test report summary files in YAML format."""
+from array                 import array
+from collections           import Counter
 from datetime              import timedelta, datetime
+from functools             import partial
+from hashlib               import sha256
+from itertools             import groupby
+from json                  import dumps as json_dumps
+from math                  import isnan, nan
 from pathlib               import Path
-from typing                import Optional as Nullable, Iterator, Iterable, Mapping, Any, List
+from typing                import Optional as Nullable, Iterator, Iterable, Mapping, Any, Dict, List, Set, Tuple
 
-from ruamel.yaml           import YAML, CommentedMap, CommentedSeq
+from ruamel.yaml           import YAML, CommentedMap
 from pyTooling.Decorators  import export, InheritDocString, notimplemented, readonly
 from pyTooling.MetaClasses import ExtendedType
 from pyTooling.Common      import getFullyQualifiedName
 from pyTooling.Stopwatch   import Stopwatch
+from pyTooling.Tree        import Node
 from pyTooling.Versioning  import CalendarVersion, SemanticVersion
 
 from pyEDAA.Reports.Unittesting import UnittestException, Document, TestcaseStatus, TestsuiteStatus, TestsuiteType, TestsuiteKind
+from pyEDAA.Reports.Unittesting import IterationScheme
+from pyEDAA.Reports.Unittesting import TestsuiteAggregateReturnType
 from pyEDAA.Reports.Unittesting import TestsuiteSummary as ut_TestsuiteSummary, Testsuite as ut_Testsuite
 from pyEDAA.Reports.Unittesting import Testcase as ut_Testcase
 
+from pyEDAA.OSVVM               import __version__, YAMLLoader
+from pyEDAA.OSVVM.Batch         import BatchResult, LoadBatch
+from pyEDAA.OSVVM.Cache         import CacheDirectory
+
 
 @export
 class OsvvmException:
 	pass
 
 
+_MICROSECOND = timedelta(microseconds=1)
+_UNKNOWN_DURATION = -(1 << 63)  #: Marker for an unknown duration in a :class:`TestcaseColumns` duration column.
+
+
+def _SumAggregates(aggregates: Iterable[TestsuiteAggregateReturnType]) -> TestsuiteAggregateReturnType:
+	totals = [0] * 14 + [timedelta()]
+	for aggregate in aggregates:
+		for i, value in enumerate(aggregate):
+			totals[i] += value
+
+	return tuple(totals)
+
+
+def _ApplyAggregate(testsuite: Any, totals: TestsuiteAggregateReturnType, isSummary: bool) -> None:
+	"""
+	Write aggregated statistics into a test suite or test summary like :meth:`Testsuite.Aggregate` and
+	:meth:`TestsuiteSummary.Aggregate` do.
+
+	:param testsuite: Test suite or test summary to update.
+	:param totals:    Aggregated statistics of all test cases in the test suite's hierarchy.
+	:param isSummary: If true, the status is derived like for a test summary.
+	"""
+	tests, inconsistent, excluded, skipped, errored, weak, failed, passed, warningCount, errorCount, fatalCount, expectedWarningCount, expectedErrorCount, expectedFatalCount, totalDuration = totals
+
+	testsuite._tests = tests
+	testsuite._inconsistent = inconsistent
+	testsuite._excluded = excluded
+	testsuite._skipped = skipped
+	testsuite._errored = errored
+	testsuite._weak = weak
+	testsuite._failed = failed
+	testsuite._passed = passed
+
+	testsuite._warningCount = warningCount
+	testsuite._errorCount = errorCount
+	testsuite._fatalCount = fatalCount
+
+	testsuite._expectedWarningCount = expectedWarningCount
+	testsuite._expectedErrorCount =   expectedErrorCount
+	testsuite._expectedFatalCount =   expectedFatalCount
+
+	if testsuite._totalDuration is None:
+		testsuite._totalDuration = totalDuration
+
+	if errored > 0:
+		testsuite._status = TestsuiteStatus.Errored
+	elif failed > 0:
+		testsuite._status = TestsuiteStatus.Failed
+	elif tests == 0:
+		testsuite._status = TestsuiteStatus.Empty
+	elif tests - skipped == passed:
+		testsuite._status = TestsuiteStatus.Passed
+	elif tests == skipped:
+		testsuite._status = TestsuiteStatus.Skipped
+	elif isSummary and tests == excluded:
+		testsuite._status = TestsuiteStatus.Excluded
+	else:
+		testsuite._status = TestsuiteStatus.Unknown
+
+
+def _SumNullable(left: Any, right: Any) -> Any:
+	if left is None:
+		return right
+	elif right is None:
+		return left
+
+	return left + right
+
+
+def _NormalizeRequirementsCounts(
+	requirementsCount: Nullable[int],
+	passedRequirementsCount: Nullable[int],
+	failedRequirementsCount: Nullable[int]
+) -> Tuple[Nullable[int], Nullable[int], Nullable[int]]:
+	"""
+	Complete partially given requirement counts like :class:`Testcase` does.
+
+	:param requirementsCount:       Number of requirements.
+	:param passedRequirementsCount: Number of passed requirements.
+	:param failedRequirementsCount: Number of failed requirements.
+	:returns:                       Total, passed and failed requirement counts. Either all or none are ``None``.
+	:raises ValueError:             If the counts are not consistent.
+	"""
+	if requirementsCount is not None:
+		if passedRequirementsCount is not None:
+			if failedRequirementsCount is not None:
+				if passedRequirementsCount + failedRequirementsCount != requirementsCount:
+					raise ValueError(f"Parameter 'requirementsCount' is not the sum of 'passedRequirementsCount' and 'failedRequirementsCount'.")
+			else:
+				failedRequirementsCount = requirementsCount - passedRequirementsCount
+		elif failedRequirementsCount is not None:
+			passedRequirementsCount = requirementsCount - failedRequirementsCount
+		else:
+			passedRequirementsCount = requirementsCount
+			failedRequirementsCount = 0
+	else:
+		if passedRequirementsCount is not None:
+			if failedRequirementsCount is not None:
+				requirementsCount = passedRequirementsCount + failedRequirementsCount
+			else:
+				requirementsCount = passedRequirementsCount
+				failedRequirementsCount = 0
+		elif failedRequirementsCount is not None:
+			requirementsCount = failedRequirementsCount
+			passedRequirementsCount = 0
+
+	return requirementsCount, passedRequirementsCount, failedRequirementsCount
+
+
 @export
 @InheritDocString(UnittestException)
 class UnittestException(UnittestException, OsvvmException):
@@ -173,28 +296,9 @@ class Testcase(ut_Testcase):
 			ex.add_note(f"Got type '{getFullyQualifiedName(failedRequirementsCount)}'.")
 			raise ex
 
-		if requirementsCount is not None:
-			if passedRequirementsCount is not None:
-				if failedRequirementsCount is not None:
-					if passedRequirementsCount + failedRequirementsCount != requirementsCount:
-						raise ValueError(f"Parameter 'requirementsCount' is not the sum of 'passedRequirementsCount' and 'failedRequirementsCount'.")
-				else:
-					failedRequirementsCount = requirementsCount - passedRequirementsCount
-			elif failedRequirementsCount is not None:
-				passedRequirementsCount = requirementsCount - failedRequirementsCount
-			else:
-				passedRequirementsCount = requirementsCount
-				failedRequirementsCount = 0
-		else:
-			if passedRequirementsCount is not None:
-				if failedRequirementsCount is not None:
-					requirementsCount = passedRequirementsCount + failedRequirementsCount
-				else:
-					requirementsCount = passedRequirementsCount
-					failedRequirementsCount = 0
-			elif failedRequirementsCount is not None:
-				requirementsCount = failedRequirementsCount
-				passedRequirementsCount = 0
+		requirementsCount, passedRequirementsCount, failedRequirementsCount = _NormalizeRequirementsCounts(
+			requirementsCount, passedRequirementsCount, failedRequirementsCount
+		)
 
 		self._requirementsCount = requirementsCount
 		self._passedRequirementsCount = passedRequirementsCount
@@ -274,6 +378,66 @@ class Testcase(ut_Testcase):
 		"""
 		return self._functionalCoverage
 
+	def Copy(self, parent: Nullable["Testsuite"] = None) -> "Testcase":
+		"""
+		Create a copy of this test case.
+
+		:param parent: Optional reference to the copy's parent test suite.
+		:returns:      A new test case with the same fields.
+		"""
+		return self.__class__(
+			self._name,
+			startTime=self._startTime,
+			setupDuration=self._setupDuration,
+			testDuration=self._testDuration,
+			teardownDuration=self._teardownDuration,
+			totalDuration=self._totalDuration,
+			status=self._status,
+			assertionCount=self._assertionCount,
+			passedAssertionCount=self._passedAssertionCount,
+			requirementsCount=self._requirementsCount,
+			passedRequirementsCount=self._passedRequirementsCount,
+			functionalCoverage=self._functionalCoverage,
+			warningCount=self._warningCount,
+			errorCount=self._errorCount,
+			fatalCount=self._fatalCount,
+			disabledWarningCount=self._disabledWarningCount,
+			disabledErrorCount=self._disabledErrorCount,
+			disabledFatalCount=self._disabledFatalCount,
+			expectedWarningCount=self._expectedWarningCount,
+			expectedErrorCount=self._expectedErrorCount,
+			expectedFatalCount=self._expectedFatalCount,
+			parent=parent
+		)
+
+	def Merge(self, testcase: "Testcase") -> None:
+		"""
+		Merge the results of another run of the same test case into this test case.
+
+		Counts and durations are summed up. The status is combined using :meth:`TestcaseStatus.__matmul__`.
+
+		:param testcase: Test case to merge.
+		"""
+		self._status @= testcase._status
+		self._totalDuration = _SumNullable(self._totalDuration, testcase._totalDuration)
+
+		self._assertionCount = _SumNullable(self._assertionCount, testcase._assertionCount)
+		self._passedAssertionCount = _SumNullable(self._passedAssertionCount, testcase._passedAssertionCount)
+		self._failedAssertionCount = _SumNullable(self._failedAssertionCount, testcase._failedAssertionCount)
+		self._requirementsCount = _SumNullable(self._requirementsCount, testcase._requirementsCount)
+		self._passedRequirementsCount = _SumNullable(self._passedRequirementsCount, testcase._passedRequirementsCount)
+		self._failedRequirementsCount = _SumNullable(self._failedRequirementsCount, testcase._failedRequirementsCount)
+
+		self._warningCount += testcase._warningCount
+		self._errorCount += testcase._errorCount
+		self._fatalCount += testcase._fatalCount
+		self._disabledWarningCount += testcase._disabledWarningCount
+		self._disabledErrorCount += testcase._disabledErrorCount
+		self._disabledFatalCount += testcase._disabledFatalCount
+		self._expectedWarningCount += testcase._expectedWarningCount
+		self._expectedErrorCount += testcase._expectedErrorCount
+		self._expectedFatalCount += testcase._expectedFatalCount
+
 
 @export
 @InheritDocString(ut_Testsuite)
@@ -281,6 +445,736 @@ class Testsuite(ut_Testsuite):
 	"""@InheritDocString(ut_Testsuite)"""
 
 
+@export
+class TestcaseColumns(metaclass=ExtendedType, slots=True):
+	"""
+	A columnar (struct-of-arrays) store of test case results.
+
+	Instead of one :class:`Testcase` object per test case, each field is stored in a typed :class:`array.array` column
+	(counts and durations in microseconds as 64-bit integers, functional coverage as floats and statuses as
+	:class:`TestcaseStatus` values). Unknown setup, test and teardown durations are stored as a marker value, an unknown
+	functional coverage as NaN. Rows are accessed by index via lightweight :class:`TestcaseView` objects created on
+	demand.
+
+	Statistics of a test entity hierarchy can be computed by :meth:`Aggregate` in one pass over the columns. Use
+	:meth:`FromSummary` to create a columnar snapshot of an existing hierarchy of :class:`Testcase` objects.
+	"""
+
+	_testsuites:              List[Testsuite]             #: Test suites referenced by rows.
+	_testsuiteIndices:        Dict[Testsuite, int]        #: Index of a test suite in :attr:`_testsuites`.
+	_rowIndices:              Dict[Tuple[int, str], int]  #: Row index by test suite index and test case name.
+	_names:                   List[str]                   #: Column of test case names.
+	_startTime:               List[Nullable[datetime]]    #: Column of test case start times.
+	_testsuite:               array                       #: Column of test suite indices.
+	_status:                  array                       #: Column of test case status values.
+	_setupDuration:           array                       #: Column of setup durations in microseconds.
+	_testDuration:            array                       #: Column of test durations in microseconds.
+	_teardownDuration:        array                       #: Column of teardown durations in microseconds.
+	_totalDuration:           array                       #: Column of total durations in microseconds.
+	_assertionCount:          array                       #: Column of assertion counts.
+	_hasAssertionCount:       array                       #: Column of flags, if a test case's assertion count is known.
+	_passedAssertionCount:    array                       #: Column of passed assertion counts.
+	_requirementsCount:       array                       #: Column of requirement counts.
+	_hasRequirementsCount:    array                       #: Column of flags, if a test case's requirement count is known.
+	_passedRequirementsCount: array                       #: Column of passed requirement counts.
+	_functionalCoverage:      array                       #: Column of functional coverages.
+	_warningCount:            array                       #: Column of warning counts.
+	_errorCount:              array                       #: Column of error counts.
+	_fatalCount:              array                       #: Column of fatal error counts.
+	_disabledWarningCount:    array                       #: Column of disabled warning counts.
+	_disabledErrorCount:      array                       #: Column of disabled error counts.
+	_disabledFatalCount:      array                       #: Column of disabled fatal error counts.
+	_expectedWarningCount:    array                       #: Column of expected warning counts.
+	_expectedErrorCount:      array                       #: Column of expected error counts.
+	_expectedFatalCount:      array                       #: Column of expected fatal error counts.
+
+	def __init__(self) -> None:
+		"""Initializes an empty columnar test case store."""
+		self._testsuites =              []
+		self._testsuiteIndices =        {}
+		self._rowIndices =              {}
+		self._names =                   []
+		self._startTime =               []
+		self._testsuite =               array("L")
+		self._status =                  array("L")
+		self._setupDuration =           array("q")
+		self._testDuration =            array("q")
+		self._teardownDuration =        array("q")
+		self._totalDuration =           array("q")
+		self._assertionCount =          array("q")
+		self._hasAssertionCount =       array("B")
+		self._passedAssertionCount =    array("q")
+		self._requirementsCount =       array("q")
+		self._hasRequirementsCount =    array("B")
+		self._passedRequirementsCount = array("q")
+		self._functionalCoverage =      array("d")
+		self._warningCount =            array("q")
+		self._errorCount =              array("q")
+		self._fatalCount =              array("q")
+		self._disabledWarningCount =    array("q")
+		self._disabledErrorCount =      array("q")
+		self._disabledFatalCount =      array("q")
+		self._expectedWarningCount =    array("q")
+		self._expectedErrorCount =      array("q")
+		self._expectedFatalCount =      array("q")
+
+	@readonly
+	def Testsuites(self) -> List[Testsuite]:
+		"""
+		Read-only property to access the test suites referenced by rows (:attr:`_testsuites`).
+
+		:returns: List of test suites.
+		"""
+		return self._testsuites
+
+	@classmethod
+	def FromSummary(cls, summary: "TestsuiteSummary") -> "TestcaseColumns":
+		"""
+		Create a columnar snapshot of all test cases in a test entity hierarchy.
+
+		A missing total duration is stored as zero. Other missing durations, counts and coverages are marked as unknown.
+
+		:param summary: Root of the test entity hierarchy.
+		:returns:       A new columnar store containing a row per test case.
+		"""
+		columns = cls()
+		testsuites = list(summary._testsuites.values())
+		while testsuites:
+			testsuite = testsuites.pop(0)
+			testsuites.extend(testsuite._testsuites.values())
+
+			for testcase in testsuite._testcases.values():
+				columns.Append(
+					testsuite,
+					testcase._name,
+					testcase._totalDuration,
+					testcase._status,
+					assertionCount=testcase._assertionCount,
+					passedAssertionCount=testcase._passedAssertionCount,
+					startTime=testcase._startTime,
+					setupDuration=testcase._setupDuration,
+					testDuration=testcase._testDuration,
+					teardownDuration=testcase._teardownDuration,
+					requirementsCount=getattr(testcase, "_requirementsCount", None),
+					passedRequirementsCount=getattr(testcase, "_passedRequirementsCount", None),
+					failedRequirementsCount=getattr(testcase, "_failedRequirementsCount", None),
+					functionalCoverage=getattr(testcase, "_functionalCoverage", None),
+					warningCount=testcase._warningCount,
+					errorCount=testcase._errorCount,
+					fatalCount=testcase._fatalCount,
+					disabledWarningCount=getattr(testcase, "_disabledWarningCount", 0),
+					disabledErrorCount=getattr(testcase, "_disabledErrorCount", 0),
+					disabledFatalCount=getattr(testcase, "_disabledFatalCount", 0),
+					expectedWarningCount=testcase._expectedWarningCount,
+					expectedErrorCount=testcase._expectedErrorCount,
+					expectedFatalCount=testcase._expectedFatalCount
+				)
+
+		return columns
+
+	def Append(
+		self,
+		testsuite: Testsuite,
+		name: str,
+		totalDuration: Nullable[timedelta],
+		status: TestcaseStatus,
+		assertionCount: Nullable[int] = 0,
+		passedAssertionCount: Nullable[int] = 0,
+		warningCount: int = 0,
+		errorCount: int = 0,
+		fatalCount: int = 0,
+		disabledWarningCount: int = 0,
+		disabledErrorCount: int = 0,
+		disabledFatalCount: int = 0,
+		expectedWarningCount: int = 0,
+		expectedErrorCount: int = 0,
+		expectedFatalCount: int = 0,
+		startTime: Nullable[datetime] = None,
+		setupDuration: Nullable[timedelta] = None,
+		testDuration: Nullable[timedelta] = None,
+		teardownDuration: Nullable[timedelta] = None,
+		requirementsCount: Nullable[int] = None,
+		passedRequirementsCount: Nullable[int] = None,
+		failedRequirementsCount: Nullable[int] = None,
+		functionalCoverage: Nullable[float] = None
+	) -> int:
+		"""
+		Append a test case's results as a new row.
+
+		The parameter names match :class:`Testcase`'s initializer. Like adding a :class:`Testcase` to a test suite, a test
+		case with the same name in the same test suite replaces the existing row's values.
+
+		:param testsuite:               Test suite containing the test case.
+		:param name:                    Name of the test case.
+		:param totalDuration:           Total duration of the test case's execution. ``None`` is stored as zero.
+		:param status:                  Status of the test case.
+		:param assertionCount:          Number of assertions within the test. ``None`` marks the count as unknown.
+		:param passedAssertionCount:    Number of passed assertions within the test. ``None`` is stored as zero.
+		:param warningCount:            Count of encountered warnings.
+		:param errorCount:              Count of encountered errors.
+		:param fatalCount:              Count of encountered fatal errors.
+		:param disabledWarningCount:    Count of disabled warnings.
+		:param disabledErrorCount:      Count of disabled errors.
+		:param disabledFatalCount:      Count of disabled fatal errors.
+		:param expectedWarningCount:    Count of expected warnings.
+		:param expectedErrorCount:      Count of expected errors.
+		:param expectedFatalCount:      Count of expected fatal errors.
+		:param startTime:               Time when the test case was started.
+		:param setupDuration:           Duration it took to set up the test case.
+		:param testDuration:            Duration of the test case's test run.
+		:param teardownDuration:        Duration it took to tear down the test case.
+		:param requirementsCount:       Number of requirements within the test.
+		:param passedRequirementsCount: Number of passed requirements within the test.
+		:param failedRequirementsCount: Number of failed requirements within the test.
+		:param functionalCoverage:      Functional coverage of the test case.
+		:returns:                       Index of the new or replaced row.
+		:raises ValueError:             If the requirement counts are not consistent.
+		"""
+		if (testsuiteIndex := self._testsuiteIndices.get(testsuite)) is None:
+			testsuiteIndex = len(self._testsuites)
+			self._testsuites.append(testsuite)
+			self._testsuiteIndices[testsuite] = testsuiteIndex
+
+		# Derive a missing test or total duration like Testcase does.
+		partialDurations = [duration for duration in (setupDuration, teardownDuration) if duration is not None]
+		if testDuration is None:
+			if totalDuration is not None:
+				testDuration = totalDuration - sum(partialDurations, timedelta())
+		elif totalDuration is None:
+			totalDuration = sum(partialDurations, testDuration)
+
+		requirementsCount, passedRequirementsCount, _ = _NormalizeRequirementsCounts(
+			requirementsCount, passedRequirementsCount, failedRequirementsCount
+		)
+
+		values = (
+			(self._status,                  status.value),
+			(self._setupDuration,           _UNKNOWN_DURATION if setupDuration is None else setupDuration // _MICROSECOND),
+			(self._testDuration,            _UNKNOWN_DURATION if testDuration is None else testDuration // _MICROSECOND),
+			(self._teardownDuration,        _UNKNOWN_DURATION if teardownDuration is None else teardownDuration // _MICROSECOND),
+			(self._totalDuration,           0 if totalDuration is None else totalDuration // _MICROSECOND),
+			(self._assertionCount,          0 if assertionCount is None else assertionCount),
+			(self._hasAssertionCount,       assertionCount is not None),
+			(self._passedAssertionCount,    0 if passedAssertionCount is None else passedAssertionCount),
+			(self._requirementsCount,       0 if requirementsCount is None else requirementsCount),
+			(self._hasRequirementsCount,    requirementsCount is not None),
+			(self._passedRequirementsCount, 0 if passedRequirementsCount is None else passedRequirementsCount),
+			(self._functionalCoverage,      nan if functionalCoverage is None else functionalCoverage),
+			(self._warningCount,            warningCount),
+			(self._errorCount,              errorCount),
+			(self._fatalCount,              fatalCount),
+			(self._disabledWarningCount,    disabledWarningCount),
+			(self._disabledErrorCount,      disabledErrorCount),
+			(self._disabledFatalCount,      disabledFatalCount),
+			(self._expectedWarningCount,    expectedWarningCount),
+			(self._expectedErrorCount,      expectedErrorCount),
+			(self._expectedFatalCount,      expectedFatalCount)
+		)
+
+		if (index := self._rowIndices.get((testsuiteIndex, name))) is not None:
+			self._startTime[index] = startTime
+			for column, value in values:
+				column[index] = value
+		else:
+			index = len(self._names)
+			self._rowIndices[(testsuiteIndex, name)] = index
+			self._names.append(name)
+			self._startTime.append(startTime)
+			self._testsuite.append(testsuiteIndex)
+			for column, value in values:
+				column.append(value)
+
+		return index
+
+	def Aggregate(self, summary: "TestsuiteSummary", strict: bool = True) -> TestsuiteAggregateReturnType:
+		"""
+		Aggregate statistics of all test suites and the test summary from the columns.
+
+		The results are identical to :meth:`TestsuiteSummary.Aggregate` applied on the equivalent hierarchy of
+		:class:`Testcase` objects: fields of all test suites in the hierarchy and of the test summary are updated, the
+		status of test cases with unknown status is derived from their counts.
+
+		Per test suite, all columns are summed up over contiguous row ranges and statuses are counted per distinct value,
+		so the work per test case is done by the C-implemented :func:`sum` and :class:`~collections.Counter` instead of
+		per-object method calls.
+
+		:param summary:            Root of the test entity hierarchy referenced by the rows.
+		:param strict:             If true, test cases with fatal errors are counted as failed when deriving the status.
+		:returns:                  The test summary's aggregated statistics.
+		:raises UnittestException: If a test case has an unknown or unsupported status.
+		"""
+		rowTotals = self._AggregateRows(strict)
+
+		totals = _SumAggregates(self._AggregateTestsuite(testsuite, rowTotals) for testsuite in summary._testsuites.values())
+		_ApplyAggregate(summary, totals, isSummary=True)
+
+		return totals[:11] + totals[14:]
+
+	def _AggregateRows(self, strict: bool) -> Dict[int, List[int]]:
+		"""
+		Sum up all rows per test suite.
+
+		:param strict: If true, test cases with fatal errors are counted as failed when deriving the status.
+		:returns:      Per test suite index: test and status counts, warning/error/fatal counts, expected counts and the
+		               total duration in microseconds.
+		"""
+		if TestcaseStatus.Unknown.value in self._status:
+			for index, statusValue in enumerate(self._status):
+				if statusValue == TestcaseStatus.Unknown.value:
+					self._status[index] = self._DeriveStatus(index, strict).value
+
+		categories = {}
+		rowTotals = {}
+		start = 0
+		for testsuiteIndex, rows in groupby(self._testsuite):
+			end = start + sum(1 for _ in rows)
+			if (totals := rowTotals.get(testsuiteIndex)) is None:
+				totals = rowTotals[testsuiteIndex] = [0] * 15
+
+			totals[0] += end - start
+			for statusValue, count in Counter(self._status[start:end]).items():
+				if (category := categories.get(statusValue)) is None:
+					category = categories[statusValue] = self._StatusCategory(TestcaseStatus(statusValue), self._names[self._status.index(statusValue, start, end)])
+				totals[category] += count
+
+			totals[8] +=  sum(self._warningCount[start:end])
+			totals[9] +=  sum(self._errorCount[start:end])
+			totals[10] += sum(self._fatalCount[start:end])
+			totals[11] += sum(self._expectedWarningCount[start:end])
+			totals[12] += sum(self._expectedErrorCount[start:end])
+			totals[13] += sum(self._expectedFatalCount[start:end])
+			totals[14] += sum(self._totalDuration[start:end])
+			start = end
+
+		return rowTotals
+
+	def _AggregateTestsuite(self, testsuite: Testsuite, rowTotals: Dict[int, List[int]]) -> TestsuiteAggregateReturnType:
+		totals = list(_SumAggregates(self._AggregateTestsuite(child, rowTotals) for child in testsuite._testsuites.values()))
+
+		if (testsuiteIndex := self._testsuiteIndices.get(testsuite)) is not None:
+			ownTotals = rowTotals.get(testsuiteIndex, [0] * 15)
+			for i in range(14):
+				totals[i] += ownTotals[i]
+			totals[14] += timedelta(microseconds=ownTotals[14])
+
+		totals = tuple(totals)
+		_ApplyAggregate(testsuite, totals, isSummary=False)
+
+		return totals
+
+	def _DeriveStatus(self, index: int, strict: bool) -> TestcaseStatus:
+		"""
+		Derive a test case's status from its counts like :meth:`Testcase.Aggregate`.
+
+		:param index:  Index of the row.
+		:param strict: If true, test cases with fatal errors are counted as failed.
+		:returns:      The derived status.
+		"""
+		if not self._hasAssertionCount[index]:
+			status = TestcaseStatus.Passed
+		elif self._assertionCount[index] == 0:
+			status = TestcaseStatus.Weak
+		elif self._assertionCount[index] == self._passedAssertionCount[index]:
+			status = TestcaseStatus.Passed
+		else:
+			status = TestcaseStatus.Failed
+
+		if self._warningCount[index] - self._expectedWarningCount[index] > 0:
+			status |= TestcaseStatus.Warned
+
+		if self._errorCount[index] - self._expectedErrorCount[index] > 0:
+			status |= TestcaseStatus.Errored
+
+		if self._fatalCount[index] - self._expectedFatalCount[index] > 0:
+			status |= TestcaseStatus.Aborted
+
+			if strict:
+				status = status & ~TestcaseStatus.Passed | TestcaseStatus.Failed
+
+		return status
+
+	@staticmethod
+	def _StatusCategory(status: TestcaseStatus, testcaseName: str) -> int:
+		"""
+		Classify a test case status like :meth:`Testsuite.Aggregate`.
+
+		:param status:             The test case's status.
+		:param testcaseName:       Name of a test case with this status (used in error messages).
+		:returns:                  Index of the status counter (1: inconsistent, 2: excluded, 3: skipped, 4: errored,
+		                           5: weak, 6: failed, 7: passed).
+		:raises UnittestException: If the status is unknown or unsupported.
+		"""
+		if status is TestcaseStatus.Unknown:
+			raise UnittestException(f"Found testcase '{testcaseName}' with state 'Unknown'.")
+		elif TestcaseStatus.Inconsistent in status:
+			return 1
+		elif status is TestcaseStatus.Excluded:
+			return 2
+		elif status is TestcaseStatus.Skipped:
+			return 3
+		elif status is TestcaseStatus.Errored:
+			return 4
+		elif status is TestcaseStatus.Weak:
+			return 5
+		elif status is TestcaseStatus.Passed:
+			return 7
+		elif status is TestcaseStatus.Failed:
+			return 6
+		elif status & TestcaseStatus.Mask is not TestcaseStatus.Unknown:
+			raise UnittestException(f"Found testcase '{testcaseName}' with unsupported state '{status}'.")
+		else:
+			raise UnittestException(f"Internal error for testcase '{testcaseName}', field '_status' is '{status}'.")
+
+	@staticmethod
+	def _Duration(column: array, index: int) -> Nullable[timedelta]:
+		"""
+		Read a nullable duration from a duration column.
+
+		:param column: Duration column in microseconds.
+		:param index:  Index of the row.
+		:returns:      The duration or ``None``, if unknown.
+		"""
+		if (microseconds := column[index]) == _UNKNOWN_DURATION:
+			return None
+
+		return timedelta(microseconds=microseconds)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of rows (test cases).
+
+		:returns: Number of test cases.
+		"""
+		return len(self._names)
+
+	def __getitem__(self, index: int) -> "TestcaseView":
+		"""
+		Returns a view on a row.
+
+		:param index:       Index of the row.
+		:returns:           View on the test case's results.
+		:raises IndexError: If the index is out of range.
+		"""
+		if index < 0:
+			index += len(self._names)
+		if not (0 <= index < len(self._names)):
+			raise IndexError(f"Test case index {index} out of range.")
+
+		return TestcaseView(self, index)
+
+	def __iter__(self) -> Iterator["TestcaseView"]:
+		"""
+		Iterate views on all rows.
+
+		:returns: Iterator of views on test case results.
+		"""
+		return (TestcaseView(self, index) for index in range(len(self._names)))
+
+
+@export
+class TestcaseView(metaclass=ExtendedType, slots=True):
+	"""
+	A lightweight view on a row of a :class:`TestcaseColumns` store.
+
+	The view provides the same read-only properties as :class:`Testcase`. Values are read from the columns on access.
+	"""
+
+	_columns: TestcaseColumns  #: Referenced columnar store.
+	_index:   int              #: Index of the row.
+
+	def __init__(self, columns: TestcaseColumns, index: int) -> None:
+		"""
+		Initializes a view on a row.
+
+		:param columns: Columnar store.
+		:param index:   Index of the row.
+		"""
+		self._columns = columns
+		self._index =   index
+
+	@readonly
+	def Index(self) -> int:
+		"""
+		Read-only property to access the row's index (:attr:`_index`).
+
+		:returns: Index of the row.
+		"""
+		return self._index
+
+	@readonly
+	def Name(self) -> str:
+		"""
+		Read-only property returning the test case's name.
+
+		:returns: Name of the test case.
+		"""
+		return self._columns._names[self._index]
+
+	@readonly
+	def Parent(self) -> Testsuite:
+		"""
+		Read-only property returning the test suite containing the test case.
+
+		:returns: The test case's test suite.
+		"""
+		return self._columns._testsuites[self._columns._testsuite[self._index]]
+
+	@readonly
+	def Status(self) -> TestcaseStatus:
+		"""
+		Read-only property returning the test case's status.
+
+		:returns: Status of the test case.
+		"""
+		return TestcaseStatus(self._columns._status[self._index])
+
+	@readonly
+	def StartTime(self) -> Nullable[datetime]:
+		"""
+		Read-only property returning the time when the test case was started.
+
+		:returns: Time when the test case was started.
+		"""
+		return self._columns._startTime[self._index]
+
+	@readonly
+	def SetupDuration(self) -> Nullable[timedelta]:
+		"""
+		Read-only property returning the duration of the test case's setup.
+
+		:returns: Duration it took to set up the test case.
+		"""
+		return self._columns._Duration(self._columns._setupDuration, self._index)
+
+	@readonly
+	def TestDuration(self) -> Nullable[timedelta]:
+		"""
+		Read-only property returning the duration of the test case's test run.
+
+		:returns: Duration of the test case's test run.
+		"""
+		return self._columns._Duration(self._columns._testDuration, self._index)
+
+	@readonly
+	def TeardownDuration(self) -> Nullable[timedelta]:
+		"""
+		Read-only property returning the duration of the test case's teardown.
+
+		:returns: Duration it took to tear down the test case.
+		"""
+		return self._columns._Duration(self._columns._teardownDuration, self._index)
+
+	@readonly
+	def TotalDuration(self) -> timedelta:
+		"""
+		Read-only property returning the test case's total duration.
+
+		:returns: Total duration of the test case.
+		"""
+		return timedelta(microseconds=self._columns._totalDuration[self._index])
+
+	@readonly
+	def AssertionCount(self) -> int:
+		"""
+		Read-only property returning the number of assertions.
+
+		:returns: Number of assertions. Like :data:`Testcase.AssertionCount`, zero if unknown.
+		"""
+		return self._columns._assertionCount[self._index]
+
+	@readonly
+	def PassedAssertionCount(self) -> Nullable[int]:
+		"""
+		Read-only property returning the number of passed assertions.
+
+		:returns: Number of passed assertions or ``None``, if the assertion count is unknown.
+		"""
+		if not self._columns._hasAssertionCount[self._index]:
+			return None
+
+		return self._columns._passedAssertionCount[self._index]
+
+	@readonly
+	def FailedAssertionCount(self) -> Nullable[int]:
+		"""
+		Read-only property returning the number of failed assertions.
+
+		:returns: Number of failed assertions or ``None``, if the assertion count is unknown.
+		"""
+		if not self._columns._hasAssertionCount[self._index]:
+			return None
+
+		return self._columns._assertionCount[self._index] - self._columns._passedAssertionCount[self._index]
+
+	@readonly
+	def RequirementsCount(self) -> Nullable[int]:
+		"""
+		Read-only property returning the number of requirements.
+
+		:returns: Count of requirements or ``None``, if unknown.
+		"""
+		if not self._columns._hasRequirementsCount[self._index]:
+			return None
+
+		return self._columns._requirementsCount[self._index]
+
+	@readonly
+	def PassedRequirementsCount(self) -> Nullable[int]:
+		"""
+		Read-only property returning the number of passed requirements.
+
+		:returns: Count of passed requirements or ``None``, if unknown.
+		"""
+		if not self._columns._hasRequirementsCount[self._index]:
+			return None
+
+		return self._columns._passedRequirementsCount[self._index]
+
+	@readonly
+	def FailedRequirementsCount(self) -> Nullable[int]:
+		"""
+		Read-only property returning the number of failed requirements.
+
+		:returns: Count of failed requirements or ``None``, if unknown.
+		"""
+		if not self._columns._hasRequirementsCount[self._index]:
+			return None
+
+		return self._columns._requirementsCount[self._index] - self._columns._passedRequirementsCount[self._index]
+
+	@readonly
+	def FunctionalCoverage(self) -> Nullable[float]:
+		"""
+		Read-only property returning the functional coverage.
+
+		:returns: Functional coverage or ``None``, if unknown.
+		"""
+		if isnan(coverage := self._columns._functionalCoverage[self._index]):
+			return None
+
+		return coverage
+
+	@readonly
+	def WarningCount(self) -> int:
+		"""
+		Read-only property returning the number of warnings.
+
+		:returns: Count of warnings.
+		"""
+		return self._columns._warningCount[self._index]
+
+	@readonly
+	def ErrorCount(self) -> int:
+		"""
+		Read-only property returning the number of errors.
+
+		:returns: Count of errors.
+		"""
+		return self._columns._errorCount[self._index]
+
+	@readonly
+	def FatalCount(self) -> int:
+		"""
+		Read-only property returning the number of fatal errors.
+
+		:returns: Count of fatal errors.
+		"""
+		return self._columns._fatalCount[self._index]
+
+	@readonly
+	def DisabledWarningCount(self) -> int:
+		"""
+		Read-only property returning the number of disabled warnings.
+
+		:returns: Count of disabled warnings.
+		"""
+		return self._columns._disabledWarningCount[self._index]
+
+	@readonly
+	def DisabledErrorCount(self) -> int:
+		"""
+		Read-only property returning the number of disabled errors.
+
+		:returns: Count of disabled errors.
+		"""
+		return self._columns._disabledErrorCount[self._index]
+
+	@readonly
+	def DisabledFatalCount(self) -> int:
+		"""
+		Read-only property returning the number of disabled fatal errors.
+
+		:returns: Count of disabled fatal errors.
+		"""
+		return self._columns._disabledFatalCount[self._index]
+
+	@readonly
+	def ExpectedWarningCount(self) -> int:
+		"""
+		Read-only property returning the number of expected warnings.
+
+		:returns: Count of expected warnings.
+		"""
+		return self._columns._expectedWarningCount[self._index]
+
+	@readonly
+	def ExpectedErrorCount(self) -> int:
+		"""
+		Read-only property returning the number of expected errors.
+
+		:returns: Count of expected errors.
+		"""
+		return self._columns._expectedErrorCount[self._index]
+
+	@readonly
+	def ExpectedFatalCount(self) -> int:
+		"""
+		Read-only property returning the number of expected fatal errors.
+
+		:returns: Count of expected fatal errors.
+		"""
+		return self._columns._expectedFatalCount[self._index]
+
+	def ToTestcase(self, parent: Nullable[Testsuite] = None) -> Testcase:
+		"""
+		Materialize the row as a :class:`Testcase` object.
+
+		:param parent: Optional reference to the new test case's parent test suite.
+		:returns:      A new test case.
+		"""
+		columns = self._columns
+		index = self._index
+		hasAssertionCount = columns._hasAssertionCount[index]
+
+		return Testcase(
+			columns._names[index],
+			startTime=columns._startTime[index],
+			setupDuration=self.SetupDuration,
+			testDuration=self.TestDuration,
+			teardownDuration=self.TeardownDuration,
+			totalDuration=timedelta(microseconds=columns._totalDuration[index]),
+			status=TestcaseStatus(columns._status[index]),
+			assertionCount=columns._assertionCount[index] if hasAssertionCount else None,
+			passedAssertionCount=columns._passedAssertionCount[index] if hasAssertionCount else None,
+			requirementsCount=self.RequirementsCount,
+			passedRequirementsCount=self.PassedRequirementsCount,
+			functionalCoverage=self.FunctionalCoverage,
+			warningCount=columns._warningCount[index],
+			errorCount=columns._errorCount[index],
+			fatalCount=columns._fatalCount[index],
+			disabledWarningCount=columns._disabledWarningCount[index],
+			disabledErrorCount=columns._disabledErrorCount[index],
+			disabledFatalCount=columns._disabledFatalCount[index],
+			expectedWarningCount=columns._expectedWarningCount[index],
+			expectedErrorCount=columns._expectedErrorCount[index],
+			expectedFatalCount=columns._expectedFatalCount[index],
+			parent=parent
+		)
+
+	def __str__(self) -> str:
+		return f"<TestcaseView {self.Name}: {self.Status.name}>"
+
+
 @export
 class BuildInformation(metaclass=ExtendedType, slots=True):
 	_startTime:          datetime
@@ -317,7 +1211,7 @@ class Settings(metaclass=ExtendedType, slots=True):
 class TestsuiteSummary(ut_TestsuiteSummary):
 	"""@InheritDocString(ut_TestsuiteSummary)"""
 
-	_datetime: datetime
+	_datetime: Nullable[datetime]
 
 	def __init__(
 		self,
@@ -362,20 +1256,109 @@ class TestsuiteSummary(ut_TestsuiteSummary):
 			parent
 		)
 
+		self._datetime = None
+
 
 @export
 class BuildSummaryDocument(TestsuiteSummary, Document):
+	_loader:       YAMLLoader                 #: YAML loader used for analysis.
 	_yamlDocument: Nullable[YAML]             #: Internal YAML document instance.
 	_version:      Nullable[SemanticVersion]  #: YAML data structure version.
+	_columns:      Nullable[TestcaseColumns]  #: Columnar test case store, if test cases are converted in columnar mode.
+
+	_testsuiteHashes:     Dict[str, str]                                #: Content hash of each test suite's YAML node by name.
+	_testsuiteAggregates: Dict[str, TestsuiteAggregateReturnType]       #: Aggregated statistics of each test suite by name.
 
-	def __init__(self, yamlReportFile: Path, analyzeAndConvert: bool = False) -> None:
+	def __init__(
+		self,
+		yamlReportFile: Path,
+		analyzeAndConvert: bool = False,
+		loader: YAMLLoader | str = YAMLLoader.RoundTrip,
+		columnar: bool = False
+	) -> None:
+		"""
+		Initializes an OSVVM build summary YAML document.
+
+		In columnar mode, test cases are stored in a :class:`TestcaseColumns` store accessible via :data:`Columns` instead
+		of :class:`Testcase` objects. Test suites are still created, but contain no test case objects. The document's
+		:data:`TestcaseCount`, :data:`AssertionCount`, :meth:`IterateTestcases` and :meth:`ToTree` read from the columnar
+		store, but these members of the contained test suites don't see any test cases.
+
+		:param yamlReportFile:    Path to the YAML file.
+		:param analyzeAndConvert: If true, analyze the YAML document and convert the content to a test entity hierarchy.
+		:param loader:            YAML loader used for analysis (:class:`~pyEDAA.OSVVM.YAMLLoader` or its value, e.g. ``"fast"``).
+		:param columnar:          If true, convert test cases into a columnar store.
+		:raises ValueError:       When parameter 'loader' is not a known YAML loader.
+		"""
 		super().__init__("Unprocessed OSVVM YAML file")
 
+		self._loader =       YAMLLoader(loader)
 		self._yamlDocument = None
 		self._version =      None
+		self._columns =      TestcaseColumns() if columnar else None
+
+		self._testsuiteHashes =     {}
+		self._testsuiteAggregates = {}
 
 		Document.__init__(self, yamlReportFile, analyzeAndConvert)
 
+	@classmethod
+	def Load(
+		cls,
+		yamlReportFile: Path,
+		loader: YAMLLoader | str = YAMLLoader.RoundTrip,
+		cache: Nullable[CacheDirectory] = None
+	) -> "BuildSummaryDocument":
+		"""
+		Load an OSVVM build summary YAML document, analyze it and convert the content to a test entity hierarchy.
+
+		If a cache is given, the converted test entity hierarchy is looked up in the cache by the YAML file's content hash,
+		modification time and pyEDAA.OSVVM's version. On a cache miss, the YAML file is analyzed and converted, then the
+		result is stored in the cache.
+
+		.. note::
+
+		   The internal YAML document tree isn't cached. A document returned from the cache can't be converted again.
+
+		:param yamlReportFile:     Path to the YAML file.
+		:param loader:             YAML loader used for analysis on a cache miss.
+		:param cache:              Optional on-disk cache of converted documents.
+		:returns:                  The converted build summary document.
+		:raises UnittestException: If YAML file doesn't exist.
+		"""
+		if cache is None:
+			return cls(yamlReportFile, analyzeAndConvert=True, loader=loader)
+
+		try:
+			stat = yamlReportFile.stat()
+			contentHash = sha256(yamlReportFile.read_bytes()).hexdigest()
+		except OSError as ex:
+			raise UnittestException(f"OSVVM YAML file '{yamlReportFile}' does not exist.") from ex
+
+		key = cache.CreateKey(cls.__qualname__, contentHash, stat.st_mtime_ns, __version__)
+		if (document := cache.Get(key)) is not None:
+			return document
+
+		document = cls(yamlReportFile, analyzeAndConvert=True, loader=loader)
+		cache.Put(key, document)
+
+		return document
+
+	def __getstate__(self) -> Dict[str, Any]:
+		state = super().__getstate__()
+		state["_yamlDocument"] = None
+
+		return state
+
+	@readonly
+	def Loader(self) -> YAMLLoader:
+		"""
+		Read-only property to access the YAML loader used for analysis (:attr:`_loader`).
+
+		:returns: The YAML loader.
+		"""
+		return self._loader
+
 	@readonly
 	def Version(self) -> Nullable[SemanticVersion]:
 		"""
@@ -385,6 +1368,85 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 		"""
 		return self._version
 
+	@readonly
+	def Columns(self) -> Nullable[TestcaseColumns]:
+		"""
+		Read-only property to access the columnar test case store (:attr:`_columns`).
+
+		:returns: The columnar test case store or ``None``, if the document isn't converted in columnar mode.
+		"""
+		return self._columns
+
+	@readonly
+	def TestcaseCount(self) -> int:
+		"""
+		Read-only property returning the number of all test cases in the test entity hierarchy.
+
+		In columnar mode, the number of rows in the columnar store is returned.
+
+		:returns: Number of test cases.
+		"""
+		if self._columns is None:
+			return super().TestcaseCount
+
+		return len(self._columns)
+
+	@readonly
+	def AssertionCount(self) -> int:
+		"""
+		Read-only property returning the number of all assertions in all test cases in the test entity hierarchy.
+
+		In columnar mode, the assertion count column is summed up.
+
+		:returns: Number of assertions in all test cases.
+		"""
+		if self._columns is None:
+			return super().AssertionCount
+
+		return sum(self._columns._assertionCount)
+
+	def IterateTestcases(self, scheme: IterationScheme = IterationScheme.TestcaseDefault) -> Iterator[Testcase | TestcaseView]:
+		"""
+		Iterate all test cases in the test entity hierarchy.
+
+		In columnar mode, views on all rows of the columnar store are returned in order of conversion and the iteration
+		scheme is ignored.
+
+		:param scheme: Iteration scheme.
+		:returns:      Iterator of test cases or views on test case results.
+		"""
+		if self._columns is None:
+			return super().IterateTestcases(scheme)
+
+		return iter(self._columns)
+
+	def ToTree(self) -> Node:
+		"""
+		Convert the test entity hierarchy to a tree of names.
+
+		In columnar mode, test case nodes are created from the rows of the columnar store.
+
+		:returns: Root node of the tree.
+		"""
+		if self._columns is None:
+			return super().ToTree()
+
+		rootNode = Node(value=self._name)
+		testsuiteNodes = {}
+
+		def convertTestsuite(testsuite: Testsuite, parentNode: Node) -> None:
+			testsuiteNode = testsuiteNodes[testsuite] = Node(value=testsuite._name, parent=parentNode)
+			for ts in testsuite._testsuites.values():
+				convertTestsuite(ts, testsuiteNode)
+
+		for testsuite in self._testsuites.values():
+			convertTestsuite(testsuite, rootNode)
+
+		for view in self._columns:
+			_ = Node(value=view.Name, parent=testsuiteNodes[view.Parent])
+
+		return rootNode
+
 	def Analyze(self) -> None:
 		"""
 		Analyze the YAML file, parse the content into an YAML data structure.
@@ -398,14 +1460,24 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 				from FileNotFoundError(f"File '{self._path}' not found.")
 
 		with Stopwatch() as sw:
-			try:
-				yamlReader = YAML()
-				self._yamlDocument = yamlReader.load(self._path)
-			except Exception as ex:
-				raise UnittestException(f"Couldn't open '{self._path}'.") from ex
+			self._yamlDocument = self._LoadYAML(self._loader)
 
 		self._analysisDuration = sw.Duration
 
+	def _LoadYAML(self, loader: YAMLLoader) -> Dict:
+		"""
+		Read the YAML file with the given YAML loader.
+
+		:param loader:             YAML loader to use.
+		:returns:                  The YAML document's root node.
+		:raises UnittestException: If YAML file can't be opened.
+		"""
+		try:
+			yamlReader = YAML(typ="safe") if loader is YAMLLoader.Fast else YAML()
+			return yamlReader.load(self._path)
+		except Exception as ex:
+			raise UnittestException(f"Couldn't open '{self._path}'.") from ex
+
 	@notimplemented
 	def Write(self, path: Nullable[Path] = None, overwrite: bool = False) -> None:
 		"""
@@ -436,48 +1508,73 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 		# 	self._yamlDocument.writexml(file, addindent="\t", encoding="utf-8", newl="\n")
 
 	@staticmethod
-	def _ParseSequenceFromYAML(node: CommentedMap, fieldName: str) -> Nullable[CommentedSeq]:
+	def _NodeLocation(node: Dict) -> str:
+		"""
+		Format the location of a YAML node, if line information is available (round-trip loader).
+
+		:param node: YAML node.
+		:returns:    Location suffix for exception messages.
+		"""
+		if isinstance(node, CommentedMap):
+			return f" starting at line {node.lc.line + 1}"
+
+		return ""
+
+	@staticmethod
+	def _FieldLocation(node: Dict, fieldName: str) -> str:
+		"""
+		Format the location of a YAML node's field, if line information is available (round-trip loader).
+
+		:param node:      YAML node.
+		:param fieldName: Name of the field.
+		:returns:         Location suffix for exception notes.
+		"""
+		if isinstance(node, CommentedMap):
+			return f" at line {node.lc.data[fieldName][0] + 1}"
+
+		return ""
+
+	@classmethod
+	def _ParseSequenceFromYAML(cls, node: Dict, fieldName: str) -> Nullable[List]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = UnittestException(f"Sequence field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = UnittestException(f"Sequence field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
 		if value is None:
 			return ()
-		elif not isinstance(value, CommentedSeq):
-			line = node._yaml_line_col.data[fieldName][0] + 1
+		elif not isinstance(value, list):
 			ex = UnittestException(f"Field '{fieldName}' is not a sequence.")  # TODO: from TypeError??
-			ex.add_note(f"Found type {value.__class__.__name__} at line {line}.")
+			ex.add_note(f"Found type {value.__class__.__name__}{cls._FieldLocation(node, fieldName)}.")
 			raise ex
 
 		return value
 
-	@staticmethod
-	def _ParseMapFromYAML(node: CommentedMap, fieldName: str) -> Nullable[CommentedMap]:
+	@classmethod
+	def _ParseMapFromYAML(cls, node: Dict, fieldName: str) -> Nullable[Dict]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = UnittestException(f"Dictionary field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = UnittestException(f"Dictionary field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
 		if value is None:
 			return {}
-		elif not isinstance(value, CommentedMap):
-			line = node._yaml_line_col.data[fieldName][0] + 1
+		elif not isinstance(value, dict):
 			ex = UnittestException(f"Field '{fieldName}' is not a list.")  # TODO: from TypeError??
-			ex.add_note(f"Type mismatch found for line {line}.")
+			ex.add_note(f"Type mismatch found{cls._FieldLocation(node, fieldName)}.")
 			raise ex
 		return value
 
-	@staticmethod
-	def _ParseStrFieldFromYAML(node: CommentedMap, fieldName: str) -> Nullable[str]:
+	@classmethod
+	def _ParseStrFieldFromYAML(cls, node: Dict, fieldName: str) -> Nullable[str]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = UnittestException(f"String field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = UnittestException(f"String field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
@@ -486,12 +1583,12 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 
 		return value
 
-	@staticmethod
-	def _ParseIntFieldFromYAML(node: CommentedMap, fieldName: str) -> Nullable[int]:
+	@classmethod
+	def _ParseIntFieldFromYAML(cls, node: Dict, fieldName: str) -> Nullable[int]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = UnittestException(f"Integer field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = UnittestException(f"Integer field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
@@ -500,12 +1597,12 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 
 		return value
 
-	@staticmethod
-	def _ParseDateFieldFromYAML(node: CommentedMap, fieldName: str) -> Nullable[datetime]:
+	@classmethod
+	def _ParseDateFieldFromYAML(cls, node: Dict, fieldName: str) -> Nullable[datetime]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = UnittestException(f"Date field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = UnittestException(f"Date field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
@@ -514,12 +1611,12 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 
 		return value
 
-	@staticmethod
-	def _ParseDurationFieldFromYAML(node: CommentedMap, fieldName: str) -> Nullable[timedelta]:
+	@classmethod
+	def _ParseDurationFieldFromYAML(cls, node: Dict, fieldName: str) -> Nullable[timedelta]:
 		try:
 			value = node[fieldName]
 		except KeyError as ex:
-			newEx = UnittestException(f"Duration field '{fieldName}' not found in node starting at line {node.lc.line + 1}.")
+			newEx = UnittestException(f"Duration field '{fieldName}' not found in node{cls._NodeLocation(node)}.")
 			newEx.add_note(f"Available fields: {', '.join(key for key in node)}")
 			raise newEx from ex
 
@@ -538,6 +1635,9 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 
 		   The time spend for model conversion will be made available via property :data:`ModelConversionDuration`.
 
+		If the document was analyzed by the fast YAML loader and the conversion fails, the YAML file is re-analyzed by the
+		round-trip loader and converted again, so the raised exception carries line numbers.
+
 		:raises UnittestException: If XML was not read and parsed before.
 		"""
 		if self._yamlDocument is None:
@@ -546,26 +1646,173 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 			raise ex
 
 		with Stopwatch() as sw:
-			self._version = SemanticVersion.Parse(self._yamlDocument["Version"])
-			if not (self._version >> "0.1"):
-				ex = UnittestException(f"Unsupported YAML data structure version {self._version} for file '{self._path}'.")
-				ex.add_note("Supported versions are: 1.0")
+			try:
+				self._Convert(self._yamlDocument)
+			except UnittestException as ex:
+				if self._loader is not YAMLLoader.Fast:
+					raise ex
+
+				self._testsuites = {}
+				if self._columns is not None:
+					self._columns = TestcaseColumns()
+				self._Convert(self._LoadYAML(YAMLLoader.RoundTrip))
 				raise ex
 
-			self._name = self._yamlDocument["Name"]
-			buildInfo = self._ParseMapFromYAML(self._yamlDocument, "BuildInfo")
-			self._startTime = self._ParseDateFieldFromYAML(buildInfo, "StartTime")
-			self._totalDuration = self._ParseDurationFieldFromYAML(buildInfo, "ElapsedTime")
+		self._modelConversion = sw.Duration
+
+	def _Convert(self, yamlDocument: Dict) -> None:
+		"""
+		Convert the YAML data structure's root node into a test entity hierarchy.
 
-			if "TestSuites" in self._yamlDocument:
-				for yamlTestsuite in self._ParseSequenceFromYAML(self._yamlDocument, "TestSuites"):
-					self._ConvertTestsuite(self, yamlTestsuite)
+		:param yamlDocument:       The YAML document's root node.
+		:raises UnittestException: If the YAML data structure version is unsupported.
+		"""
+		self._ConvertBuildInformation(yamlDocument)
+
+		self._testsuiteHashes = {}
+		self._testsuiteAggregates = {}
+		if "TestSuites" in yamlDocument:
+			for yamlTestsuite in self._ParseSequenceFromYAML(yamlDocument, "TestSuites"):
+				self._ConvertTestsuite(self, yamlTestsuite)
 
+		if self._columns is None:
 			self.Aggregate()
+		else:
+			self._columns.Aggregate(self)
 
+	def _ConvertBuildInformation(self, yamlDocument: Dict) -> None:
+		"""
+		Convert the YAML data structure's version, name and build information.
+
+		:param yamlDocument:       The YAML document's root node.
+		:raises UnittestException: If the YAML data structure version is unsupported.
+		"""
+		self._version = SemanticVersion.Parse(yamlDocument["Version"])
+		if not (self._version >> "0.1"):
+			ex = UnittestException(f"Unsupported YAML data structure version {self._version} for file '{self._path}'.")
+			ex.add_note("Supported versions are: 1.0")
+			raise ex
+
+		self._name = yamlDocument["Name"]
+		buildInfo = self._ParseMapFromYAML(yamlDocument, "BuildInfo")
+		self._startTime = self._ParseDateFieldFromYAML(buildInfo, "StartTime")
+		self._totalDuration = self._ParseDurationFieldFromYAML(buildInfo, "ElapsedTime")
+
+	def Refresh(self) -> Set[str]:
+		"""
+		Re-analyze the YAML file and incrementally update the test entity hierarchy.
+
+		Only test suites which are new or whose YAML content changed (by name and content hash) are converted. Unchanged
+		:class:`Testsuite` objects are reused and their aggregated statistics are taken from the previous refresh, so only
+		affected test suites are re-aggregated. Test suites no longer listed in the YAML file are removed.
+
+		The YAML file is re-read by the fast YAML loader regardless of :data:`Loader`, because reading dominates the
+		duration of a refresh. If the conversion fails and the document uses the round-trip loader, the file is re-read by
+		the round-trip loader, so the raised exception carries line numbers. If the conversion fails, the test entity
+		hierarchy is left unchanged.
+
+		If the document wasn't converted before, was loaded from a cache or uses columnar mode, the whole document is
+		analyzed and converted again.
+
+		:returns:                  Names of added, changed or removed test suites.
+		:raises UnittestException: If the YAML file can't be read or converted.
+		"""
+		if self._yamlDocument is None or self._columns is not None:
+			oldNames = set(self._testsuites)
+			self._testsuites = {}
+			if self._columns is not None:
+				self._columns = TestcaseColumns()
+
+			self.Analyze()
+			self.Convert()
+			return oldNames | set(self._testsuites)
+
+		if not self._testsuiteHashes and "TestSuites" in self._yamlDocument:
+			for yamlTestsuite in self._ParseSequenceFromYAML(self._yamlDocument, "TestSuites"):
+				self._testsuiteHashes[self._ParseStrFieldFromYAML(yamlTestsuite, "Name")] = self._HashYAMLNode(yamlTestsuite)
+
+		with Stopwatch() as sw:
+			yamlDocument = self._LoadYAML(YAMLLoader.Fast)
+
+		self._analysisDuration = sw.Duration
+
+		with Stopwatch() as sw:
+			try:
+				changed = self._Refresh(yamlDocument)
+			except UnittestException as ex:
+				if self._loader is YAMLLoader.Fast:
+					raise ex
+
+				yamlDocument = self._LoadYAML(YAMLLoader.RoundTrip)
+				changed = self._Refresh(yamlDocument)
+
+		self._yamlDocument = yamlDocument
 		self._modelConversion = sw.Duration
 
-	def _ConvertTestsuite(self, parentTestsuite: Testsuite, yamlTestsuite: CommentedMap) -> None:
+		return changed
+
+	def _Refresh(self, yamlDocument: Dict) -> Set[str]:
+		"""
+		Update the test entity hierarchy from a new YAML data structure.
+
+		All new and changed test suites are converted and aggregated before the hierarchy is updated, so the hierarchy is
+		left unchanged, if the conversion fails.
+
+		:param yamlDocument:       The new YAML document's root node.
+		:returns:                  Names of added, changed or removed test suites.
+		:raises UnittestException: If the YAML data structure can't be converted.
+		"""
+		changed = set()
+		hashes = {}
+		testsuites = {}
+		aggregates = {}
+		if "TestSuites" in yamlDocument:
+			for yamlTestsuite in self._ParseSequenceFromYAML(yamlDocument, "TestSuites"):
+				name = self._ParseStrFieldFromYAML(yamlTestsuite, "Name")
+				hashes[name] = self._HashYAMLNode(yamlTestsuite)
+
+				testsuite = self._testsuites.get(name)
+				if testsuite is not None and self._testsuiteHashes.get(name) == hashes[name]:
+					testsuites[name] = testsuite
+					aggregates[name] = self._testsuiteAggregates.get(name)
+					continue
+
+				testsuite = testsuites[name] = self._ConvertTestsuite(None, yamlTestsuite)
+				aggregates[name] = testsuite.Aggregate()
+				changed.add(name)
+
+		self._ConvertBuildInformation(yamlDocument)
+
+		for name, testsuite in self._testsuites.items():
+			if testsuites.get(name) is not testsuite:
+				testsuite._parent = None
+				changed.add(name)
+
+		for testsuite in testsuites.values():
+			testsuite._parent = self
+
+		self._testsuites = testsuites
+		self._testsuiteHashes = hashes
+		self._testsuiteAggregates = {
+			name: testsuite.Aggregate() if (aggregate := aggregates[name]) is None else aggregate
+			for name, testsuite in testsuites.items()
+		}
+
+		_ApplyAggregate(self, _SumAggregates(self._testsuiteAggregates.values()), isSummary=True)
+
+		return changed
+
+	@staticmethod
+	def _HashYAMLNode(node: Any) -> str:
+		"""
+		Compute a content hash of a YAML node independent of the YAML loader's node types.
+
+		:param node: YAML node.
+		:returns:    Hexadecimal hash.
+		"""
+		return sha256(json_dumps(node, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+	def _ConvertTestsuite(self, parentTestsuite: Nullable[Testsuite], yamlTestsuite: Dict) -> Testsuite:
 		testsuiteName = self._ParseStrFieldFromYAML(yamlTestsuite, "Name")
 		totalDuration = self._ParseDurationFieldFromYAML(yamlTestsuite, "ElapsedTime")
 
@@ -579,7 +1826,23 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 		for yamlTestcase in self._ParseSequenceFromYAML(yamlTestsuite, 'TestCases'):
 			self._ConvertTestcase(testsuite, yamlTestcase)
 
-	def _ConvertTestcase(self, parentTestsuite: Testsuite, yamlTestcase: CommentedMap) -> None:
+		return testsuite
+
+	def _ConvertTestcase(self, parentTestsuite: Testsuite, yamlTestcase: Dict) -> None:
+		fields = self._ParseTestcase(yamlTestcase)
+		if self._columns is not None:
+			self._columns.Append(parentTestsuite, **fields)
+		else:
+			_ = Testcase(**fields, parent=parentTestsuite)
+
+	def _ParseTestcase(self, yamlTestcase: Dict) -> Dict[str, Any]:
+		"""
+		Parse a test case's YAML node into the keyword arguments of :class:`Testcase` and :meth:`TestcaseColumns.Append`.
+
+		:param yamlTestcase:       The test case's YAML node.
+		:returns:                  Test case fields by parameter name.
+		:raises UnittestException: If a field is missing or has a wrong type.
+		"""
 		testcaseName = self._ParseStrFieldFromYAML(yamlTestcase, "TestCaseName")
 		totalDuration = self._ParseDurationFieldFromYAML(yamlTestcase, "ElapsedTime")
 		yamlStatus = self._ParseStrFieldFromYAML(yamlTestcase, "Status").lower()
@@ -629,23 +1892,22 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 		else:
 			status |= TestcaseStatus.Inconsistent
 
-		_ = Testcase(
-			testcaseName,
-			totalDuration=totalDuration,
-			status=status,
-			assertionCount=assertionCount,
-			passedAssertionCount=passedAssertionCount,
-			warningCount=warningCount,
-			errorCount=errorCount,
-			fatalCount=failureCount,
-			disabledWarningCount=disabledWarningCount,
-			disabledErrorCount=disabledErrorCount,
-			disabledFatalCount=disabledFailureCount,
-			expectedWarningCount=expectedWarningCount,
-			expectedErrorCount=expectedErrorCount,
-			expectedFatalCount=expectedFailureCount,
-			parent=parentTestsuite
-		)
+		return {
+			"name":                 testcaseName,
+			"totalDuration":        totalDuration,
+			"status":               status,
+			"assertionCount":       assertionCount,
+			"passedAssertionCount": passedAssertionCount,
+			"warningCount":         warningCount,
+			"errorCount":           errorCount,
+			"fatalCount":           failureCount,
+			"disabledWarningCount": disabledWarningCount,
+			"disabledErrorCount":   disabledErrorCount,
+			"disabledFatalCount":   disabledFailureCount,
+			"expectedWarningCount": expectedWarningCount,
+			"expectedErrorCount":   expectedErrorCount,
+			"expectedFatalCount":   expectedFailureCount
+		}
 
 	def __contains__(self, key: str) -> bool:
 		return key in self._testsuites
@@ -658,3 +1920,67 @@ class BuildSummaryDocument(TestsuiteSummary, Document):
 
 	def __len__(self) -> int:
 		return self._testsuites.__len__()
+
+
+@export
+def LoadBuildSummaries(
+	paths: Iterable[Path],
+	workers: Nullable[int] = None,
+	loader: YAMLLoader | str = YAMLLoader.RoundTrip
+) -> BatchResult:
+	"""
+	Load many OSVVM build summary YAML files concurrently.
+
+	Each file is analyzed and converted in a worker process. The resulting :class:`BuildSummaryDocument` is shipped back
+	without its internal YAML document tree. If the process pool can't be used, files are loaded in a thread pool. Files
+	failing to load are collected in :data:`~pyEDAA.OSVVM.Batch.BatchResult.Failures`.
+
+	:param paths:       Paths to build summary YAML files.
+	:param workers:     Number of worker processes or threads. If ``None``, the executor's default is used.
+	:param loader:      YAML loader used for analysis.
+	:returns:           Loaded build summary documents and collected failures.
+	:raises ValueError: When parameter 'loader' is not a known YAML loader.
+	"""
+	return LoadBatch(partial(BuildSummaryDocument, analyzeAndConvert=True, loader=YAMLLoader(loader)), paths, workers)
+
+
+@export
+def MergeBuildSummaries(summaries: Iterable[TestsuiteSummary], name: str = "Merged") -> TestsuiteSummary:
+	"""
+	Merge many converted build summaries (e.g. from a sharded regression) into a single test summary.
+
+	Test suites are de-duplicated by name. Test cases with the same name in the same test suite are merged by summing up
+	their counts and durations (see :meth:`Testcase.Merge`), all other test cases are copied. Test suite and build
+	durations are summed up and the earliest start time becomes the merged start time. The given summaries aren't
+	modified.
+
+	All summaries are merged in a single pass, then :meth:`~TestsuiteSummary.Aggregate` is called once.
+
+	:param summaries: Converted build summaries to merge.
+	:param name:      Name of the merged test summary.
+	:returns:         The merged and aggregated test summary.
+	"""
+	merged = TestsuiteSummary(name)
+	mergedTestsuites = merged._testsuites
+
+	for summary in summaries:
+		if summary._startTime is not None and (merged._startTime is None or summary._startTime < merged._startTime):
+			merged._startTime = summary._startTime
+		merged._totalDuration = _SumNullable(merged._totalDuration, summary._totalDuration)
+
+		for testsuite in summary._testsuites.values():
+			if (mergedTestsuite := mergedTestsuites.get(testsuite._name)) is None:
+				mergedTestsuite = Testsuite(testsuite._name, totalDuration=testsuite._totalDuration, parent=merged)
+			else:
+				mergedTestsuite._totalDuration = _SumNullable(mergedTestsuite._totalDuration, testsuite._totalDuration)
+
+			mergedTestcases = mergedTestsuite._testcases
+			for testcase in testsuite._testcases.values():
+				if (mergedTestcase := mergedTestcases.get(testcase._name)) is None:
+					testcase.Copy(parent=mergedTestsuite)
+				else:
+					mergedTestcase.Merge(testcase)
+
+	merged.Aggregate()
+
+	return merged
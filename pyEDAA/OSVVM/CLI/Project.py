@@ -41,8 +41,10 @@ from pyTooling.Attributes.ArgParse.Flag       import LongFlag
 from pyTooling.Attributes.ArgParse.ValuedFlag import LongValuedFlag
 from pyTooling.Stopwatch                      import Stopwatch
 
-from pyEDAA.OSVVM.Project     import VHDLSourceFile
-from pyEDAA.OSVVM.Project.TCL import OsvvmProFileProcessor
+from pyEDAA.OSVVM.Cache            import CacheDirectory
+from pyEDAA.OSVVM.Project          import VHDLSourceFile
+from pyEDAA.OSVVM.Project.Profiler import ProcessingProfiler
+from pyEDAA.OSVVM.Project.TCL      import OsvvmProFileProcessor
 
 
 class ProjectHandlers(metaclass=ExtendedType, mixin=True):
@@ -51,6 +53,10 @@ class ProjectHandlers(metaclass=ExtendedType, mixin=True):
 	@LongValuedFlag("--regressionTCL", dest="regressionTCL", metaName='TCL file', optional=True, help="Regression file (TCL).")
 	@LongValuedFlag("--buildPro", dest="buildPro", metaName='PRO file', optional=True, help="OSVVM build file (PRO).")
 	@LongValuedFlag("--render", dest="render", metaName='format', optional=True, help="Render unit testing results to <format>.")
+	@LongValuedFlag("--cache", dest="cache", metaName='directory', optional=True, help="Cache evaluated builds and regressions in <directory>.")
+	@LongFlag("--profile", dest="profile", help="Report time spent per *.pro file and procedure.")
+	@LongFlag("--deferValidation", dest="deferValidation", help="Check referenced source files after parsing and report all missing files.")
+	@LongValuedFlag("--prefetch", dest="prefetch", metaName='directory', optional=True, help="Scan source files in <directory> before parsing.")
 	def HandleUnittest(self, args: Namespace) -> None:
 		"""Handle program calls with command ``unittest``."""
 		self._PrintHeadline()
@@ -64,7 +70,11 @@ class ProjectHandlers(metaclass=ExtendedType, mixin=True):
 			self.Exit(returnCode)
 
 		sw = Stopwatch(preferPause=True)
-		processor = OsvvmProFileProcessor()
+		profiler = ProcessingProfiler() if args.profile else None
+		processor = OsvvmProFileProcessor(profiler=profiler, deferValidation=args.deferValidation)
+		cache = CacheDirectory(Path(args.cache)) if args.cache is not None else None
+		if args.prefetch is not None:
+			processor.Context.FileSystem.Prefetch(Path(args.prefetch))
 
 		if args.stdin is True:
 			self.WriteNormal(f"Reading TCL code from STDIN ...")
@@ -72,6 +82,7 @@ class ProjectHandlers(metaclass=ExtendedType, mixin=True):
 
 			with sw:
 				processor.EvaluateTclCode(tclCode)
+				processor.Context.ValidateReferencedFiles()
 
 			osvvmProject = processor.Context.ToProject("unnamed")
 
@@ -79,7 +90,7 @@ class ProjectHandlers(metaclass=ExtendedType, mixin=True):
 			self.WriteNormal(f"Reading regression TCL file ...")
 
 			with sw:
-				osvvmProject = processor.LoadRegressionFile(Path(args.regressionTCL))
+				osvvmProject = processor.LoadRegressionFile(Path(args.regressionTCL), cache=cache)
 
 		elif args.buildPro is not None:
 			for proFile in args.buildPro.split(":"):
@@ -87,7 +98,7 @@ class ProjectHandlers(metaclass=ExtendedType, mixin=True):
 				self.WriteNormal(f"Reading OSVVM build file '{file}' ...")
 
 				with sw:
-					processor.LoadBuildFile(file)
+					processor.LoadBuildFile(file, cache=cache)
 
 			osvvmProject = processor.Context.ToProject("unnamed")
 
@@ -98,6 +109,10 @@ class ProjectHandlers(metaclass=ExtendedType, mixin=True):
 		self.WriteNormal(f"  Builds:           {len(osvvmProject.Builds)}")
 		self.WriteNormal(f"  Processed files:  {count(osvvmProject.IncludedFiles)}")
 
+		if profiler is not None:
+			self.WriteNormal(f"Profile:")
+			self.WriteNormal(profiler.Report())
+
 		if args.render == "all":
 			for build in osvvmProject.Builds.values():
 				print(f"Build: {build.Name}")
@@ -0,0 +1,266 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2021-2026 Electronic Design Automation Abstraction (EDA²)                                                  #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""An on-disk cache for converted OSVVM data models."""
+from enum                  import Enum, auto
+from hashlib               import sha256
+from os                    import utime
+from pathlib               import Path
+from pickle                import dumps as pickle_dumps, loads as pickle_loads, HIGHEST_PROTOCOL
+from typing                import Any, Callable, Optional as Nullable
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.OSVVM          import OSVVMException
+
+
+@export
+class CacheException(OSVVMException):
+	"""Exception raised by an on-disk cache."""
+
+
+@export
+class EvictionPolicy(Enum):
+	"""Selects which cache entries are evicted first, when a cache exceeds its size limit."""
+	LeastRecentlyUsed = auto()  #: Evict entries which weren't read or written for the longest time.
+	FirstInFirstOut =   auto()  #: Evict entries which were written first, regardless of reads.
+
+
+@export
+class CacheDirectory(metaclass=ExtendedType, slots=True):
+	"""
+	An on-disk cache of converted data models.
+
+	Each cache entry is a file containing a data model serialized by :mod:`pickle`. Entries are identified by a key
+	created by :meth:`CreateKey` from all properties which invalidate an entry (e.g. file content hash, modification time
+	and package version). The total size of all entries is limited by :attr:`MaxSize`. When the limit is exceeded,
+	entries are evicted according to the :class:`EvictionPolicy`. Usage is tracked by the entry file's modification time.
+
+	.. warning::
+
+	   Cache entries are deserialized using :mod:`pickle`. Don't point a cache to a directory writable by untrusted users.
+	"""
+
+	_directory:  Path            #: Directory containing the cache entries.
+	_maxSize:    int             #: Maximum size of all cache entries in bytes.
+	_policy:     EvictionPolicy  #: Policy selecting entries to evict.
+	_hitCount:   int             #: Number of cache hits.
+	_missCount:  int             #: Number of cache misses.
+
+	_ENTRY_SUFFIX = ".pickle"
+
+	def __init__(
+		self,
+		directory: Path,
+		maxSize: int = 256 * 1024**2,
+		policy: EvictionPolicy = EvictionPolicy.LeastRecentlyUsed
+	) -> None:
+		"""
+		Initializes an on-disk cache. If the cache directory doesn't exist, it's created.
+
+		:param directory:       Directory containing the cache entries.
+		:param maxSize:         Maximum size of all cache entries in bytes.
+		:param policy:          Policy selecting entries to evict, when the size limit is exceeded.
+		:raises TypeError:      When parameter 'directory' is not of type Path.
+		:raises ValueError:     When parameter 'maxSize' is not a positive integer.
+		:raises CacheException: When the cache directory can't be created.
+		"""
+		if not isinstance(directory, Path):
+			ex = TypeError(f"Parameter 'directory' is not of type Path.")
+			ex.add_note(f"Got type '{directory.__class__.__name__}'.")
+			raise ex
+		elif maxSize <= 0:
+			raise ValueError(f"Parameter 'maxSize' must be a positive integer.")
+
+		try:
+			directory.mkdir(parents=True, exist_ok=True)
+		except OSError as ex:
+			raise CacheException(f"Couldn't create cache directory '{directory}'.") from ex
+
+		self._directory = directory
+		self._maxSize =   maxSize
+		self._policy =    policy
+		self._hitCount =  0
+		self._missCount = 0
+
+	@readonly
+	def Directory(self) -> Path:
+		"""
+		Read-only property to access the cache's directory (:attr:`_directory`).
+
+		:returns: Directory containing the cache entries.
+		"""
+		return self._directory
+
+	@readonly
+	def MaxSize(self) -> int:
+		"""
+		Read-only property to access the cache's size limit in bytes (:attr:`_maxSize`).
+
+		:returns: Maximum size of all cache entries in bytes.
+		"""
+		return self._maxSize
+
+	@readonly
+	def Policy(self) -> EvictionPolicy:
+		"""
+		Read-only property to access the cache's eviction policy (:attr:`_policy`).
+
+		:returns: Policy selecting entries to evict.
+		"""
+		return self._policy
+
+	@readonly
+	def Size(self) -> int:
+		"""
+		Read-only property returning the current size of all cache entries in bytes.
+
+		:returns: Size of all cache entries in bytes.
+		"""
+		return sum(entry.stat().st_size for entry in self._directory.glob(f"*{self._ENTRY_SUFFIX}"))
+
+	@readonly
+	def HitCount(self) -> int:
+		"""
+		Read-only property to access the number of cache hits (:attr:`_hitCount`).
+
+		:returns: Number of cache hits.
+		"""
+		return self._hitCount
+
+	@readonly
+	def MissCount(self) -> int:
+		"""
+		Read-only property to access the number of cache misses (:attr:`_missCount`).
+
+		:returns: Number of cache misses.
+		"""
+		return self._missCount
+
+	@staticmethod
+	def CreateKey(*parts: Any) -> str:
+		"""
+		Create a cache key from all properties identifying a cache entry.
+
+		:param parts: Properties identifying a cache entry.
+		:returns:     Hexadecimal key.
+		"""
+		return sha256("\x00".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+	def _EntryPath(self, key: str) -> Path:
+		return self._directory / f"{key}{self._ENTRY_SUFFIX}"
+
+	def Get(self, key: str, validate: Nullable[Callable[[Any], bool]] = None) -> Nullable[Any]:
+		"""
+		Lookup a cache entry and deserialize its data model.
+
+		With :attr:`EvictionPolicy.LeastRecentlyUsed`, a hit marks the entry as most recently used. Unreadable entries and
+		entries rejected by ``validate`` are removed and counted as a miss.
+
+		:param key:      Key of the cache entry.
+		:param validate: Optional callable checking, if a deserialized data model is still valid.
+		:returns:        The cached data model or ``None`` on a cache miss.
+		"""
+		entryPath = self._EntryPath(key)
+		try:
+			value = pickle_loads(entryPath.read_bytes())
+			isValid = validate is None or validate(value)
+			if isValid and self._policy is EvictionPolicy.LeastRecentlyUsed:
+				utime(entryPath)
+		except FileNotFoundError:
+			self._missCount += 1
+			return None
+		except Exception:
+			isValid = False
+
+		if not isValid:
+			entryPath.unlink(missing_ok=True)
+			self._missCount += 1
+			return None
+
+		self._hitCount += 1
+		return value
+
+	def Put(self, key: str, value: Any) -> None:
+		"""
+		Serialize a data model into a cache entry and evict entries if the size limit is exceeded.
+
+		:param key:             Key of the cache entry.
+		:param value:           Data model to cache.
+		:raises CacheException: When the cache entry can't be written.
+		"""
+		entryPath = self._EntryPath(key)
+		temporaryPath = entryPath.with_suffix(".tmp")
+		try:
+			temporaryPath.write_bytes(pickle_dumps(value, protocol=HIGHEST_PROTOCOL))
+			temporaryPath.replace(entryPath)
+		except Exception as ex:
+			temporaryPath.unlink(missing_ok=True)
+			raise CacheException(f"Couldn't write cache entry '{entryPath}'.") from ex
+
+		self.Evict()
+
+	def Evict(self) -> None:
+		"""Remove cache entries according to the eviction policy until all entries fit into the size limit."""
+		entries = []
+		for entryPath in self._directory.glob(f"*{self._ENTRY_SUFFIX}"):
+			try:
+				stat = entryPath.stat()
+			except FileNotFoundError:
+				continue
+			entries.append((stat.st_mtime_ns, stat.st_size, entryPath))
+
+		size = sum(entry[1] for entry in entries)
+		for _, entrySize, entryPath in sorted(entries, key=lambda entry: entry[0]):
+			if size <= self._maxSize:
+				break
+
+			entryPath.unlink(missing_ok=True)
+			size -= entrySize
+
+	def Clear(self) -> None:
+		"""Remove all cache entries and reset the hit and miss counters."""
+		for entryPath in self._directory.glob(f"*{self._ENTRY_SUFFIX}"):
+			entryPath.unlink(missing_ok=True)
+
+		self._hitCount = 0
+		self._missCount = 0
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of cache entries.
+
+		:returns: Number of cache entries.
+		"""
+		return sum(1 for _ in self._directory.glob(f"*{self._ENTRY_SUFFIX}"))
+
+	def __str__(self) -> str:
+		return f"Cache '{self._directory}': {self._hitCount} hits, {self._missCount} misses"
@@ -0,0 +1,372 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2025-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+A pure-Python parser and evaluator for the common subset of OSVVM's ``*.pro`` file syntax.
+
+Most ``*.pro`` files only call OSVVM procedures like ``library``, ``analyze`` or ``TestSuite`` with literal arguments.
+Such files are parsed into a list of :class:`Command` objects, which call the Python implementations of these procedures
+(see :mod:`~pyEDAA.OSVVM.Project.Procedures`) directly, without passing through a TCL interpreter. An evaluating
+processor passes its currently registered procedures, so replaced procedures (e.g. while discovering builds) are called.
+
+.. rubric:: Supported syntax:
+
+* Commands separated by newlines or ``;``.
+* Comments starting with ``#`` at the beginning of a command.
+* Bare words, braced words (``{...}``) and quoted words (``"..."``) without substitutions.
+* Command substitution (``[...]``) of option procedures (e.g. ``generic`` or ``BuildName``), if it forms a whole word.
+
+Any other construct (e.g. ``proc``, ``if``, variable substitution or backslash substitution) or unknown command raises
+:exc:`UnsupportedConstruct`, so the caller can fall back to a TCL interpreter.
+"""
+from pathlib               import Path
+from re                    import compile as re_compile
+from typing                import Any, Callable, ClassVar, Dict, Iterator, List, Mapping, Union, Optional as Nullable
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.OSVVM                    import OSVVMException
+from pyEDAA.OSVVM.Project            import Context
+from pyEDAA.OSVVM.Project.Profiler   import ProcessingProfiler
+from pyEDAA.OSVVM.Project.Procedures import build, include, library, analyze, simulate, generic, BuildName
+from pyEDAA.OSVVM.Project.Procedures import NoNullRangeWarning, TestSuite, TestName, RunTest
+from pyEDAA.OSVVM.Project.Procedures import ConstraintFile, ScopeToRef, ScopeToCell
+
+
+@export
+class UnsupportedConstruct(OSVVMException):
+	"""Raised by :class:`ProFileParser`, when a ``*.pro`` file contains syntax not supported by the native parser."""
+
+
+@export
+class Command(metaclass=ExtendedType, slots=True):
+	"""
+	A parsed OSVVM procedure call.
+
+	Arguments are either literal strings or nested commands (command substitution), which are evaluated before the
+	command itself.
+	"""
+
+	_name:      str                             #: Name of the called procedure.
+	_procedure: Callable                        #: Python implementation of the procedure.
+	_arguments: List[Union[str, "Command"]]     #: Literal arguments or nested commands.
+	_line:      int                             #: Line number of the command in the source code.
+
+	def __init__(self, name: str, procedure: Callable, arguments: List[Union[str, "Command"]], line: int) -> None:
+		"""
+		Initializes a parsed procedure call.
+
+		:param name:      Name of the called procedure.
+		:param procedure: Python implementation of the procedure.
+		:param arguments: Literal arguments or nested commands.
+		:param line:      Line number of the command in the source code.
+		"""
+		self._name =      name
+		self._procedure = procedure
+		self._arguments = arguments
+		self._line =      line
+
+	@readonly
+	def Name(self) -> str:
+		"""
+		Read-only property to access the name of the called procedure (:attr:`_name`).
+
+		:returns: Name of the called procedure.
+		"""
+		return self._name
+
+	@readonly
+	def Arguments(self) -> List[Union[str, "Command"]]:
+		"""
+		Read-only property to access the command's arguments (:attr:`_arguments`).
+
+		:returns: List of literal arguments or nested commands.
+		"""
+		return self._arguments
+
+	@readonly
+	def Line(self) -> int:
+		"""
+		Read-only property to access the command's line number (:attr:`_line`).
+
+		:returns: Line number of the command in the source code.
+		"""
+		return self._line
+
+	def IterateNames(self) -> Iterator[str]:
+		"""
+		Iterate the names of this command's procedure and of all procedures called by nested commands.
+
+		:returns: Generator of procedure names.
+		"""
+		yield self._name
+		for argument in self._arguments:
+			if isinstance(argument, Command):
+				yield from argument.IterateNames()
+
+	def Evaluate(
+		self,
+		context:    Context,
+		profiler:   Nullable[ProcessingProfiler] = None,
+		procedures: Nullable[Mapping[str, Callable]] = None
+	) -> Any:
+		"""
+		Evaluate nested commands, then call the procedure's Python implementation.
+
+		:param context:    The TCL execution context.
+		:param profiler:   Optional, profiler recording the procedure calls.
+		:param procedures: Optional, procedures by name, which are already bound to a context (e.g. the procedures
+		                   registered by a processor). If ``None``, the procedure's default implementation is called with
+		                   the given context.
+		:returns:          The procedure's return value (e.g. an option ID).
+		"""
+		arguments = [
+			argument.Evaluate(context, profiler, procedures) if isinstance(argument, Command) else argument
+			for argument in self._arguments
+		]
+		if procedures is None:
+			procedure = self._procedure
+			arguments.insert(0, context)
+		else:
+			procedure = procedures[self._name]
+
+		if profiler is None:
+			return procedure(*arguments)
+
+		return profiler.Call(self._name, procedure, *arguments)
+
+	def __repr__(self) -> str:
+		return f"Command: {self._name} (line {self._line})"
+
+
+@export
+class ProFileParser(metaclass=ExtendedType, slots=True):
+	"""
+	A parser for the literal subset of OSVVM's ``*.pro`` file syntax.
+
+	.. rubric:: Usage:
+
+	.. code-block:: Python
+
+	   commands = ProFileParser.ParseFile(Path("build.pro"))
+	   for command in commands:
+	     command.Evaluate(context)
+	"""
+
+	PROCEDURES: ClassVar[Dict[str, Callable]] = {
+		"build":     build,
+		"include":   include,
+		"library":   library,
+		"analyze":   analyze,
+		"simulate":  simulate,
+		"TestSuite": TestSuite,
+		"TestName":  TestName,
+		"RunTest":   RunTest,
+	}  #: Procedures supported as commands.
+
+	OPTIONS: ClassVar[Dict[str, Callable]] = {
+		"BuildName":          BuildName,
+		"generic":            generic,
+		"NoNullRangeWarning": NoNullRangeWarning,
+		"ConstraintFile":     ConstraintFile,
+		"ScopeToRef":         ScopeToRef,
+		"ScopeToCell":        ScopeToCell,
+	}  #: Option procedures supported in command substitutions.
+
+	_SEPARATORS =     re_compile(r"(?:[ \t\r\n;]|\\\n)*")     #: Whitespace, newlines, ``;`` and line continuations.
+	_BLANKS =         re_compile(r"(?:[ \t\r]|\\\n)*")         #: Whitespace and line continuations.
+	_BARE_WORD =      re_compile(r"[^ \t\r\n;\\$\[]+")         #: Characters of a bare word.
+	_NESTED_WORD =    re_compile(r"[^ \t\r\n;\\$\[\]]+")       #: Characters of a bare word in a command substitution.
+	_BRACED_SPECIAL = re_compile(r"[{}\\]")                     #: Characters with special meaning in a braced word.
+	_QUOTED_SPECIAL = re_compile(r"[\"\\$\[]")                   #: Characters with special meaning in a quoted word.
+
+	_code:     str  #: Source code to parse.
+	_position: int  #: Current position in the source code.
+	_line:     int  #: Line number at position :attr:`_counted`.
+	_counted:  int  #: Position up to which newlines were counted.
+
+	def __init__(self, code: str) -> None:
+		"""
+		Initializes a parser for the given source code.
+
+		:param code: Source code of a ``*.pro`` file.
+		"""
+		self._code =     code
+		self._position = 0
+		self._line =     1
+		self._counted =  0
+
+	@classmethod
+	def ParseFile(cls, path: Path) -> List[Command]:
+		"""
+		Read and parse a ``*.pro`` file.
+
+		:param path:                  Path to the ``*.pro`` file.
+		:returns:                     List of parsed commands.
+		:raises UnsupportedConstruct: When the file contains syntax not supported by the native parser.
+		"""
+		return cls(path.read_text(encoding="utf-8")).Parse()
+
+	def Parse(self) -> List[Command]:
+		"""
+		Parse the source code.
+
+		:returns:                     List of parsed commands.
+		:raises UnsupportedConstruct: When the source code contains syntax not supported by the native parser.
+		"""
+		code = self._code
+		commands = []
+		while True:
+			self._position = self._SEPARATORS.match(code, self._position).end()
+			if self._position >= len(code):
+				return commands
+			elif code[self._position] == "#":
+				self._SkipComment()
+			else:
+				commands.append(self._ParseCommand(nested=False))
+
+	def _Line(self) -> int:
+		self._line += self._code.count("\n", self._counted, self._position)
+		self._counted = self._position
+		return self._line
+
+	def _Unsupported(self, construct: str) -> UnsupportedConstruct:
+		ex = UnsupportedConstruct(f"Unsupported construct '{construct}' in line {self._Line()}.")
+		ex.add_note(f"Use a TCL interpreter to evaluate this code.")
+		return ex
+
+	def _SkipComment(self) -> None:
+		end = self._code.find("\n", self._position)
+		if end == -1:
+			end = len(self._code)
+		elif self._code[end - 1] == "\\":
+			raise self._Unsupported("comment continued by \\")
+
+		self._position = end
+
+	def _IsWordEnd(self, nested: bool) -> bool:
+		code = self._code
+		if self._position >= len(code):
+			return True
+
+		char = code[self._position]
+		return char in " \t\r\n;" or (nested and char == "]") or code.startswith("\\\n", self._position)
+
+	def _ParseCommand(self, nested: bool) -> Command:
+		code = self._code
+		line = self._Line()
+		words = []
+		while True:
+			self._position = self._BLANKS.match(code, self._position).end()
+			if self._position >= len(code):
+				if nested:
+					raise self._Unsupported("[")
+				break
+
+			char = code[self._position]
+			if char in "\n;":
+				if nested:
+					raise self._Unsupported(f"multiple commands in [...]")
+				break
+			elif nested and char == "]":
+				self._position += 1
+				break
+
+			words.append(self._ParseWord(nested))
+
+		if len(words) == 0:
+			raise self._Unsupported("[]")
+
+		name = words[0]
+		procedures = self.OPTIONS if nested else self.PROCEDURES
+		if not isinstance(name, str):
+			raise self._Unsupported("[...] as command name")
+		elif name not in procedures:
+			raise self._Unsupported(name)
+
+		return Command(name, procedures[name], words[1:], line)
+
+	def _ParseWord(self, nested: bool) -> Union[str, Command]:
+		code = self._code
+		char = code[self._position]
+		if char == "{":
+			word = self._ParseBraced()
+		elif char == "\"":
+			word = self._ParseQuoted()
+		elif char == "[":
+			self._position += 1
+			word = self._ParseCommand(nested=True)
+		else:
+			match = (self._NESTED_WORD if nested else self._BARE_WORD).match(code, self._position)
+			if match is None:
+				raise self._Unsupported(char)
+
+			word = match.group()
+			self._position = match.end()
+
+		if not self._IsWordEnd(nested):
+			raise self._Unsupported(code[self._position])
+
+		return word
+
+	def _ParseBraced(self) -> str:
+		code = self._code
+		start = self._position + 1
+		depth = 1
+		position = start
+		while (match := self._BRACED_SPECIAL.search(code, position)) is not None:
+			char = match.group()
+			position = match.end()
+			if char == "\\":
+				self._position = match.start()
+				raise self._Unsupported(char)
+			elif char == "{":
+				depth += 1
+			else:
+				depth -= 1
+				if depth == 0:
+					self._position = position
+					return code[start:position - 1]
+
+		raise self._Unsupported("{")
+
+	def _ParseQuoted(self) -> str:
+		code = self._code
+		start = self._position + 1
+		match = self._QUOTED_SPECIAL.search(code, start)
+		if match is None:
+			raise self._Unsupported("\"")
+		elif (char := match.group()) != "\"":
+			self._position = match.start()
+			raise self._Unsupported(char)
+
+		self._position = match.end()
+		return code[start:match.start()]
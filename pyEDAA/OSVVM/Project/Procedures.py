@@ -32,8 +32,9 @@
 This module implements OSVVM's TCL procedures (used in OSVVM's ``*.pro`` files) as Python functions.
 
 These functions are then registered at the :class:`TCL processor <pyEDAA.OSVVM.Project.TCL.OsvvmProFileProcessor>`, so
-procedure calls within TCL code get "redirected" to these Python functions. Each Python function has access to a global
-variable :data:`~pyEDAA.OSVVM.Project.osvvmContext` to preserve its state or modify the context.
+procedure calls within TCL code get "redirected" to these Python functions. Each Python function receives the
+processor's :class:`~pyEDAA.OSVVM.Project.Context` as first parameter to preserve its state or modify the context. The
+processor binds its own context when registering these functions, so multiple processors can run side by side.
 
 .. important::
 
@@ -42,12 +43,12 @@ variable :data:`~pyEDAA.OSVVM.Project.osvvmContext` to preserve its state or mod
 
    .. code-block:: Python
 
-      def myTclProcedure(....) -> ...:
+      def myTclProcedure(context: Context, ....) -> ...:
         try:
           # do something
 
         except Exception as ex:       # pragma: no cover
-          osvvmContext.RaiseException(ex)
+          context.RaiseException(ex)
 """
 from pathlib               import Path
 from typing                import Optional as Nullable
@@ -57,31 +58,32 @@ from pyTooling.Common      import getFullyQualifiedName
 from pyVHDLModel           import VHDLVersion
 
 from pyEDAA.OSVVM          import OSVVMException
-from pyEDAA.OSVVM.Project  import osvvmContext, VHDLSourceFile, GenericValue, ConstraintFile as OSVVM_ConstraintFile
+from pyEDAA.OSVVM.Project  import Context, VHDLSourceFile, GenericValue, ConstraintFile as OSVVM_ConstraintFile
 from pyEDAA.OSVVM.Project  import XDCConstraintFile, ScopeToRef as OSVVM_ScopeToRef, ScopeToCell as OSVVM_ScopeToCell
 from pyEDAA.OSVVM.Project  import BuildName as OSVVM_BuildName, NoNullRangeWarning as OSVVM_NoNullRangeWarning
 
 
 @export
-def BuildName(name: str) -> int:
+def BuildName(context: Context, name: str) -> int:
 	"""
 	This function implements the behavior of OSVVM's ``BuildName`` procedure.
 
 	Create and register a :class:`~pyEDAA.OSVVM.Project.BuildName` option and return the options unique ID.
 
-	:param name: Name of the build.
-	:returns:    The option's unique ID.
+	:param context: The TCL execution context.
+	:param name:    Name of the build.
+	:returns:       The option's unique ID.
 	"""
 	try:
 		buildName = OSVVM_BuildName(name)
-		return osvvmContext.AddOption(buildName)
+		return context.AddOption(buildName)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def build(file: str, *options: int) -> None:
+def build(context: Context, file: str, *options: int) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``build`` procedure.
 
@@ -101,6 +103,7 @@ def build(file: str, *options: int) -> None:
 	1. The option :class:`~pyEDAA.OSVVM.Project.BuildName` was gives (indirectly via option ID) as parameter.
 	2. It's derived from the current directory name.
 
+	:param context:         The TCL execution context.
 	:param file:            Explicit path to a ``*.pro`` file or a directory containing an implicitly searched ``*.pro``
 	                        file.
 	:param options:         Optional, list of option IDs.
@@ -118,42 +121,42 @@ def build(file: str, *options: int) -> None:
 		buildName = None
 
 		# Preserve current directory
-		currentDirectory = osvvmContext._currentDirectory
+		currentDirectory = context._currentDirectory
 
 		for optionID in options:
 			try:
-				option = osvvmContext._options[int(optionID)]
+				option = context.ConsumeOption(int(optionID))
 			except KeyError as e:  # pragma: no cover
-				ex = OSVVMException(f"Option {optionID} not found in option dictionary.")
+				ex = OSVVMException(f"Option {optionID} not found or already consumed.")
 				ex.__cause__ = e
-				osvvmContext.RaiseException(ex)
+				context.RaiseException(ex)
 
 			if isinstance(option, OSVVM_BuildName):
 				buildName = option.Name
 			else:  # pragma: no cover
 				ex = OSVVMException(f"Option {optionID} is not a BuildName.")
 				ex.__cause__ = TypeError()
-				osvvmContext.LastException = ex
+				context.LastException = ex
 				raise ex
 
 		# If no build name was specified, derive a name from *.pro file.
 		if buildName is None:
 			buildName = file.stem
 
-		osvvmContext.BeginBuild(buildName)
-		includeFile = osvvmContext.IncludeFile(file)
-		osvvmContext.EvaluateFile(includeFile)
-		osvvmContext.EndBuild()
+		context.BeginBuild(buildName)
+		includeFile = context.IncludeFile(file)
+		context.EvaluateFile(includeFile)
+		context.EndBuild()
 
 		# Restore current directory after recursively evaluating *.pro files.
-		osvvmContext._currentDirectory = currentDirectory
+		context._currentDirectory = currentDirectory
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def include(file: str) -> None:
+def include(context: Context, file: str) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``include`` procedure.
 
@@ -168,6 +171,7 @@ def include(file: str) -> None:
 	2. If the path references a directory, it checks implicitly for a ``build.pro`` file, otherwise
 	3. it checks implicitly for a ``<path>.pro`` file, named like the directories name.
 
+	:param context:         The TCL execution context.
 	:param file:            Explicit path to a ``*.pro`` file or a directory containing an implicitly searched ``*.pro``
 	                        file.
 
@@ -178,20 +182,20 @@ def include(file: str) -> None:
 	"""
 	try:
 		# Preserve current directory
-		currentDirectory = osvvmContext._currentDirectory
+		currentDirectory = context._currentDirectory
 
-		includeFile = osvvmContext.IncludeFile(Path(file))
-		osvvmContext.EvaluateFile(includeFile)
+		includeFile = context.IncludeFile(Path(file))
+		context.EvaluateFile(includeFile)
 
 		# Restore current directory after recursively evaluating *.pro files.
-		osvvmContext._currentDirectory = currentDirectory
+		context._currentDirectory = currentDirectory
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def library(libraryName: str, libraryPath: Nullable[str] = None) -> None:
+def library(context: Context, libraryName: str, libraryPath: Nullable[str] = None) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``library`` procedure.
 
@@ -206,6 +210,7 @@ def library(libraryName: str, libraryPath: Nullable[str] = None) -> None:
 
 	   Parameter `libraryPath` is not yet implemented.
 
+	:param context:              The TCL execution context.
 	:param libraryName:          Name of the VHDL library.
 	:param libraryPath:          Optional, path where to create that VHDL library.
 	:raises NotImplementedError: When parameter 'libraryPath' is not None.
@@ -219,31 +224,32 @@ def library(libraryName: str, libraryPath: Nullable[str] = None) -> None:
 		if libraryPath is not None:
 			raise NotImplementedError(f"Optional parameter 'libraryPath' not yet supported.")
 
-		osvvmContext.SetLibrary(libraryName)
+		context.SetLibrary(libraryName)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def NoNullRangeWarning() -> int:
+def NoNullRangeWarning(context: Context) -> int:
 	"""
 	This function implements the behavior of OSVVM's ``NoNullRangeWarning`` procedure.
 
 	Create and register a :class:`~pyEDAA.OSVVM.Project.NoNullRangeWarning` option and return the options unique ID.
 
-	:returns: The option's unique ID.
+	:param context: The TCL execution context.
+	:returns:       The option's unique ID.
 	"""
 	try:
 		option = OSVVM_NoNullRangeWarning()
-		return osvvmContext.AddOption(option)
+		return context.AddOption(option)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def analyze(file: str, *options: int) -> None:
+def analyze(context: Context, file: str, *options: int) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``analyze`` procedure.
 
@@ -254,6 +260,7 @@ def analyze(file: str, *options: int) -> None:
   * :func:`NoNullRangeWarning` - disable null-range warnings when analyzing.
   * :func:`ConstraintFile` - associated constraint file
 
+	:param context:         The TCL execution context.
 	:param file:            Path of the VHDL source file.
 	:param options:         Optional, list of option IDs.
 	:raises OSVVMException: When the referenced source file doesn't exist.
@@ -270,15 +277,15 @@ def analyze(file: str, *options: int) -> None:
 	"""
 	try:
 		file = Path(file)
-		fullPath = (osvvmContext._currentDirectory / file).resolve()
+		path = context._currentDirectory / file
 
 		noNullRangeWarning = None
 		associatedConstraintFiles = []
 		for optionID in options:
 			try:
-				option = osvvmContext._options[int(optionID)]
+				option = context.ConsumeOption(int(optionID))
 			except KeyError as ex:  # pragma: no cover
-				osvvmContext.RaiseException(OSVVMException(f"Option {optionID} not found in option dictionary."), ex)
+				context.RaiseException(OSVVMException(f"Option {optionID} not found or already consumed."), ex)
 
 			if isinstance(option, OSVVM_NoNullRangeWarning):
 				noNullRangeWarning = True
@@ -291,27 +298,27 @@ def analyze(file: str, *options: int) -> None:
 			else:  # pragma: no cover
 				ex = TypeError(f"Option {optionID} is not a NoNullRangeWarning or ConstraintFile.")
 				ex.add_note(f"Got type '{getFullyQualifiedName(option)}'.")
-				osvvmContext.RaiseException(OSVVMException(f"Dereferenced option ID is not a NoNullRangeWarning or ConstraintFile object"), ex)
+				context.RaiseException(OSVVMException(f"Dereferenced option ID is not a NoNullRangeWarning or ConstraintFile object"), ex)
 
-		if not fullPath.exists():  # pragma: no cover
-			osvvmContext.RaiseException(OSVVMException(f"Path '{fullPath}' can't be analyzed."), FileNotFoundError(fullPath))
+		if (fullPath := context.CheckReferencedFile(path)) is None:  # pragma: no cover
+			context.RaiseException(OSVVMException(f"Path '{path}' can't be analyzed."), FileNotFoundError(path))
 
 		if fullPath.suffix in (".vhd", ".vhdl"):
 			vhdlFile = VHDLSourceFile(
-				fullPath.relative_to(osvvmContext._workingDirectory, walk_up=True),
+				fullPath,
 				noNullRangeWarning=noNullRangeWarning,
 				associatedFiles=associatedConstraintFiles
 			)
-			osvvmContext.AddVHDLFile(vhdlFile)
+			context.AddVHDLFile(context.ReferenceSourceFile(vhdlFile))
 		else:  # pragma: no cover
-			osvvmContext.RaiseException(OSVVMException(f"Path '{fullPath}' is no VHDL file (*.vhd, *.vhdl)."))
+			context.RaiseException(OSVVMException(f"Path '{fullPath}' is no VHDL file (*.vhd, *.vhdl)."))
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def simulate(toplevelName: str, *options: int) -> None:
+def simulate(context: Context, toplevelName: str, *options: int) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``simulate`` procedure.
 
@@ -321,6 +328,7 @@ def simulate(toplevelName: str, *options: int) -> None:
 
   * :func:`generic` - specify generic values.
 
+	:param context:         The TCL execution context.
 	:param toplevelName:    Name of the toplevel.
 	:param options:         Optional, list of option IDs.
 	:raises ValueError:     When parameter 'toplevelName' is empty.
@@ -336,77 +344,80 @@ def simulate(toplevelName: str, *options: int) -> None:
 		if toplevelName == "":
 			raise ValueError(f"Parameter 'toplevelName' is empty.")
 
-		testcase = osvvmContext.SetTestcaseToplevel(toplevelName)
+		testcase = context.SetTestcaseToplevel(toplevelName)
 		for optionID in options:
 			try:
-				option = osvvmContext._options[int(optionID)]
+				option = context.ConsumeOption(int(optionID))
 			except KeyError as ex:  # pragma: no cover
-				osvvmContext.RaiseException(OSVVMException(f"Option {optionID} not found in option dictionary."), ex)
+				context.RaiseException(OSVVMException(f"Option {optionID} not found or already consumed."), ex)
 
 			if isinstance(option, GenericValue):
 				testcase.AddGeneric(option)
 			else:  # pragma: no cover
 				ex = TypeError(f"Option {optionID} is not a GenericValue.")
 				ex.add_note(f"Got type '{getFullyQualifiedName(option)}'.")
-				osvvmContext.RaiseException(OSVVMException(f"Dereferenced option ID is not a GenericValue object"), ex)
+				context.RaiseException(OSVVMException(f"Dereferenced option ID is not a GenericValue object"), ex)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def generic(name: str, value: str) -> int:
+def generic(context: Context, name: str, value: str) -> int:
 	"""
 	This function implements the behavior of OSVVM's ``generic`` procedure.
 
 	Create and register a :class:`~pyEDAA.OSVVM.Project.GenericValue` option and return the options unique ID.
 
-	:param name:  Name of the generic.
-	:param value: Value of the generic.
-	:returns:     The option's unique ID.
+	:param context: The TCL execution context.
+	:param name:    Name of the generic.
+	:param value:   Value of the generic.
+	:returns:       The option's unique ID.
 	"""
 	try:
 		genericValue = GenericValue(name, value)
-		return osvvmContext.AddOption(genericValue)
+		return context.AddOption(genericValue)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def TestSuite(name: str) -> None:
+def TestSuite(context: Context, name: str) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``TestSuite`` procedure.
 
 	Set or create the currently active :class:`~pyEDAA.OSVVM.Project.Testsuite`.
 
-	:param name: Name of the OSVVM testsuite.
+	:param context: The TCL execution context.
+	:param name:    Name of the OSVVM testsuite.
 	"""
 	try:
-		osvvmContext.SetTestsuite(name)
+		context.SetTestsuite(name)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def TestName(name: str) -> None:
+def TestName(context: Context, name: str) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``TestName`` procedure.
 
 	Create a new :class:`~pyEDAA.OSVVM.Project.Testcase`.
 
-	:param name: Name of the OSVVM testcase.
+	:param context: The TCL execution context.
+	:param name:    Name of the OSVVM testcase.
 	"""
 	try:
-		osvvmContext.AddTestcase(name)
+		context.AddTestcase(name)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def RunTest(file: str, *options: int) -> None:
+def RunTest(context: Context, file: str, *options: int) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``RunTest`` procedure.
 
@@ -416,6 +427,7 @@ def RunTest(file: str, *options: int) -> None:
 
   * :func:`generic` - specify generic values.
 
+	:param context:         The TCL execution context.
 	:param file:            Path of the VHDL source file containing the toplevel.
 	:param options:         Optional, list of option IDs.
 	:raises OSVVMException: When the referenced source file doesn't exist.
@@ -433,55 +445,59 @@ def RunTest(file: str, *options: int) -> None:
 		testName = file.stem
 
 		# Analyze file
-		fullPath = (osvvmContext._currentDirectory / file).resolve()
+		path = context._currentDirectory / file
 
-		if not fullPath.exists():  # pragma: no cover
-			osvvmContext.RaiseException(OSVVMException(f"Path '{fullPath}' can't be analyzed."), FileNotFoundError(fullPath))
+		if (fullPath := context.CheckReferencedFile(path)) is None:  # pragma: no cover
+			context.RaiseException(OSVVMException(f"Path '{path}' can't be analyzed."), FileNotFoundError(path))
 
 		if fullPath.suffix in (".vhd", ".vhdl"):
-			vhdlFile = VHDLSourceFile(fullPath.relative_to(osvvmContext._workingDirectory, walk_up=True))
-			osvvmContext.AddVHDLFile(vhdlFile)
+			vhdlFile = VHDLSourceFile(fullPath)
+			context.AddVHDLFile(context.ReferenceSourceFile(vhdlFile))
 		else:  # pragma: no cover
-			osvvmContext.RaiseException(OSVVMException(f"Path '{fullPath}' is no VHDL file (*.vhd, *.vhdl)."))
+			context.RaiseException(OSVVMException(f"Path '{fullPath}' is no VHDL file (*.vhd, *.vhdl)."))
 
 		# Add testcase
-		testcase = osvvmContext.AddTestcase(testName)
+		testcase = context.AddTestcase(testName)
 		testcase.SetToplevel(testName)
 		for optionID in options:
 			try:
-				option = osvvmContext._options[int(optionID)]
+				option = context.ConsumeOption(int(optionID))
 			except KeyError as ex:  # pragma: no cover
-				osvvmContext.RaiseException(OSVVMException(f"Option {optionID} not found in option dictionary."), ex)
+				context.RaiseException(OSVVMException(f"Option {optionID} not found or already consumed."), ex)
 
 			if isinstance(option, GenericValue):
 				testcase.AddGeneric(option)
 			else:  # pragma: no cover
 				ex = TypeError(f"Option {optionID} is not a GenericValue.")
 				ex.add_note(f"Got type '{getFullyQualifiedName(option)}'.")
-				osvvmContext.RaiseException(OSVVMException(f"Dereferenced option ID is not a GenericValue object"), ex)
+				context.RaiseException(OSVVMException(f"Dereferenced option ID is not a GenericValue object"), ex)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def LinkLibrary(libraryName: str, libraryPath: Nullable[str] = None):
+def LinkLibrary(context: Context, libraryName: str, libraryPath: Nullable[str] = None):
 	"""
 	Not implemented by pyEDAA.OSVVM.
+
+	:param context: The TCL execution context.
 	"""
-	osvvmContext.RaiseException(NotImplementedError(f"Procedure 'LinkLibrary' is not implemented."))
+	context.RaiseException(NotImplementedError(f"Procedure 'LinkLibrary' is not implemented."))
 
 
 @export
-def LinkLibraryDirectory(libraryDirectory: str):
+def LinkLibraryDirectory(context: Context, libraryDirectory: str):
 	"""
 	Not implemented by pyEDAA.OSVVM.
+
+	:param context: The TCL execution context.
 	"""
-	osvvmContext.RaiseException(NotImplementedError(f"Procedure 'LinkLibraryDirectory' is not implemented."))
+	context.RaiseException(NotImplementedError(f"Procedure 'LinkLibraryDirectory' is not implemented."))
 
 
 @export
-def SetVHDLVersion(value: str) -> None:
+def SetVHDLVersion(context: Context, value: str) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``SetVHDLVersion`` procedure.
 
@@ -491,6 +507,7 @@ def SetVHDLVersion(value: str) -> None:
 
 	   All following ``analyze`` calls will use this VHDL revision.
 
+	:param context:         The TCL execution context.
 	:param value:           The VHDL language revision's release year.
 	:raises ValueError:     When parameter 'value' is not an integer value.
 	:raises OSVVMException: When parameter 'value' is not a known VHDL revision's release year.
@@ -505,33 +522,34 @@ def SetVHDLVersion(value: str) -> None:
 		except ValueError as e:  # pragma: no cover
 			ex = ValueError(f"Parameter 'value' is not an integer value.")
 			ex.add_note(f"Got '{value}'.")
-			osvvmContext.RaiseException(ex, e)
+			context.RaiseException(ex, e)
 
 		match value:
 			case 1987:
-				osvvmContext.VHDLVersion = VHDLVersion.VHDL87
+				context.VHDLVersion = VHDLVersion.VHDL87
 			case 1993:
-				osvvmContext.VHDLVersion = VHDLVersion.VHDL93
+				context.VHDLVersion = VHDLVersion.VHDL93
 			case 2002:
-				osvvmContext.VHDLVersion = VHDLVersion.VHDL2002
+				context.VHDLVersion = VHDLVersion.VHDL2002
 			case 2008:
-				osvvmContext.VHDLVersion = VHDLVersion.VHDL2008
+				context.VHDLVersion = VHDLVersion.VHDL2008
 			case 2019:
-				osvvmContext.VHDLVersion = VHDLVersion.VHDL2019
+				context.VHDLVersion = VHDLVersion.VHDL2019
 			case _:  # pragma: no cover
-				osvvmContext.RaiseException(OSVVMException(f"Unsupported VHDL version '{value}'."))
+				context.RaiseException(OSVVMException(f"Unsupported VHDL version '{value}'."))
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def GetVHDLVersion() -> int:
+def GetVHDLVersion(context: Context) -> int:
 	"""
 	This function implements the behavior of OSVVM's ``GetVHDLVersion`` procedure.
 
 	Returns the currently set VHDL language revision.
 
+	:param context:         The TCL execution context.
 	:returns:               The VHDL language revision's release year.
 	:raises OSVVMException: When the currently set VHDL language revision is unknown in this decoding function.
 
@@ -540,46 +558,51 @@ def GetVHDLVersion() -> int:
 	   * :func:`SetVHDLVersion`
 	"""
 	try:
-		if osvvmContext.VHDLVersion is VHDLVersion.VHDL87:
+		if context.VHDLVersion is VHDLVersion.VHDL87:
 			return 1987
-		elif osvvmContext.VHDLVersion is VHDLVersion.VHDL93:
+		elif context.VHDLVersion is VHDLVersion.VHDL93:
 			return 1993
-		elif osvvmContext.VHDLVersion is VHDLVersion.VHDL2002:
+		elif context.VHDLVersion is VHDLVersion.VHDL2002:
 			return 2002
-		elif osvvmContext.VHDLVersion is VHDLVersion.VHDL2008:
+		elif context.VHDLVersion is VHDLVersion.VHDL2008:
 			return 2008
-		elif osvvmContext.VHDLVersion is VHDLVersion.VHDL2019:
+		elif context.VHDLVersion is VHDLVersion.VHDL2019:
 			return 2019
 		else:  # pragma: no cover
-			osvvmContext.RaiseException(OSVVMException(f"Unsupported VHDL version '{osvvmContext.VHDLVersion}'."))
+			context.RaiseException(OSVVMException(f"Unsupported VHDL version '{context.VHDLVersion}'."))
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def SetCoverageAnalyzeEnable(value: bool) -> None:
+def SetCoverageAnalyzeEnable(context: Context, value: bool) -> None:
 	"""
 	Not implemented by pyEDAA.OSVVM.
+
+	:param context: The TCL execution context.
 	"""
-	osvvmContext.RaiseException(NotImplementedError(f"Procedure 'SetCoverageAnalyzeEnable' is not implemented."))
+	context.RaiseException(NotImplementedError(f"Procedure 'SetCoverageAnalyzeEnable' is not implemented."))
 
 
 @export
-def SetCoverageSimulateEnable(value: bool) -> None:
+def SetCoverageSimulateEnable(context: Context, value: bool) -> None:
 	"""
 	Not implemented by pyEDAA.OSVVM.
+
+	:param context: The TCL execution context.
 	"""
-	osvvmContext.RaiseException(NotImplementedError(f"Procedure 'SetCoverageSimulateEnable' is not implemented."))
+	context.RaiseException(NotImplementedError(f"Procedure 'SetCoverageSimulateEnable' is not implemented."))
 
 
 @export
-def FileExists(file: str) -> bool:
+def FileExists(context: Context, file: str) -> bool:
 	"""
 	This function implements the behavior of OSVVM's ``FileExists`` procedure.
 
 	Check if the given file exists.
 
+	:param context:     The TCL execution context.
 	:param file:        File name.
 	:returns:           True, if file exists, otherwise False.
 	:raises ValueError: When parameter 'file' is empty.
@@ -592,19 +615,20 @@ def FileExists(file: str) -> bool:
 		if file == "":
 			raise ValueError(f"Parameter 'file' is empty.")
 
-		return (osvvmContext._currentDirectory / file).is_file()
+		return context._fileSystem.IsFile(context._currentDirectory / file)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def DirectoryExists(directory: str) -> bool:
+def DirectoryExists(context: Context, directory: str) -> bool:
 	"""
 	This function implements the behavior of OSVVM's ``DirectoryExists`` procedure.
 
 	Check if the given directory exists.
 
+	:param context:     The TCL execution context.
 	:param directory:   Directory name.
 	:returns:           True, if directory exists, otherwise False.
 	:raises ValueError: When parameter 'directory' is empty.
@@ -617,19 +641,20 @@ def DirectoryExists(directory: str) -> bool:
 		if directory == "":
 			raise ValueError(f"Parameter 'directory' is empty.")
 
-		return (osvvmContext._currentDirectory / directory).is_dir()
+		return context._fileSystem.IsDirectory(context._currentDirectory / directory)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def ChangeWorkingDirectory(directory: str) -> None:
+def ChangeWorkingDirectory(context: Context, directory: str) -> None:
 	"""
 	This function implements the behavior of OSVVM's ``ChangeWorkingDirectory`` procedure.
 
 	Change the current directory (virtual working directory) to the given directory.
 
+	:param context:         The TCL execution context.
 	:param directory:       Directory name.
 	:raises ValueError:     When parameter 'directory' is empty.
 	:raises OSVVMException: When the referenced directory doesn't exist.
@@ -643,22 +668,24 @@ def ChangeWorkingDirectory(directory: str) -> None:
 		if directory == "":
 			raise ValueError(f"Parameter 'directory' is empty.")
 
-		osvvmContext._currentDirectory = (newDirectory := osvvmContext._currentDirectory / directory)
-		if not newDirectory.is_dir():  # pragma: no cover
-			osvvmContext.RaiseException(OSVVMException(f"Directory '{newDirectory}' doesn't exist."), NotADirectoryError(newDirectory))
+		context._currentDirectory = (newDirectory := context._currentDirectory / directory)
+		if not context._fileSystem.IsDirectory(newDirectory):  # pragma: no cover
+			context.RaiseException(OSVVMException(f"Directory '{newDirectory}' doesn't exist."), NotADirectoryError(newDirectory))
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def FindOsvvmSettingsDirectory(*args) -> str:
+def FindOsvvmSettingsDirectory(context: Context, *args) -> str:
 	"""
 	.. todo::
 
 	   Needs documentation.
+
+	:param context: The TCL execution context.
 	"""
-	return osvvmContext.CurrentDirectory.as_posix()
+	return context.CurrentDirectory.as_posix()
 
 
 @export
@@ -666,7 +693,7 @@ def CreateOsvvmScriptSettingsPkg(*args) -> None:
 	"""
 	Not implemented by pyEDAA.OSVVM.
 	"""
-	# osvvmContext.RaiseException(NotImplementedError(f"Procedure 'CreateOsvvmScriptSettingsPkg' is not implemented."))
+	# context.RaiseException(NotImplementedError(f"Procedure 'CreateOsvvmScriptSettingsPkg' is not implemented."))
 
 
 @export
@@ -679,12 +706,13 @@ def noop(*args) -> None:
 
 
 @export
-def ConstraintFile(file: str, *options: int) -> int:
+def ConstraintFile(context: Context, file: str, *options: int) -> int:
 	"""
 	This function implements the behavior of pyEDAA's ``ConstraintFile`` procedure.
 
 	Create and register a :class:`~pyEDAA.OSVVM.Project.ConstraintFile` option and return the options unique ID.
 
+	:param context:         The TCL execution context.
 	:param file:            Path to the constraint file.
 	:param options:         Optional, list of option IDs.
 	:returns:               The option's unique ID.
@@ -696,14 +724,14 @@ def ConstraintFile(file: str, *options: int) -> int:
 	"""
 	try:
 		file = Path(file)
-		fullPath = (osvvmContext._currentDirectory / file).resolve()
+		path = context._currentDirectory / file
 
 		properties = {}
 		for optionID in options:
 			try:
-				option = osvvmContext._options[int(optionID)]
+				option = context.ConsumeOption(int(optionID))
 			except KeyError as ex:  # pragma: no cover
-				osvvmContext.RaiseException(OSVVMException(f"Option {optionID} not found in option dictionary."), ex)
+				context.RaiseException(OSVVMException(f"Option {optionID} not found or already consumed."), ex)
 
 			if isinstance(option, OSVVM_ScopeToRef):
 				properties["scopeToRef"] = option.Reference
@@ -712,28 +740,29 @@ def ConstraintFile(file: str, *options: int) -> int:
 			else:  # pragma: no cover
 				ex = TypeError(f"Option {optionID} is not a ScopeToRef or ScopeToCell.")
 				ex.add_note(f"Got type '{getFullyQualifiedName(option)}'.")
-				osvvmContext.RaiseException(OSVVMException(f"Dereferenced option ID is not a ScopeToRef or ScopeToCell object"), ex)
+				context.RaiseException(OSVVMException(f"Dereferenced option ID is not a ScopeToRef or ScopeToCell object"), ex)
 
-		if not fullPath.exists():  # pragma: no cover
-			osvvmContext.RaiseException(OSVVMException(f"Constraint file '{fullPath}' can't be found."), FileNotFoundError(fullPath))
+		if (fullPath := context.CheckReferencedFile(path)) is None:  # pragma: no cover
+			context.RaiseException(OSVVMException(f"Constraint file '{path}' can't be found."), FileNotFoundError(path))
 
 		if not fullPath.suffix in (".sdc", ".xdc"):
-			osvvmContext.RaiseException(OSVVMException(f"Path '{fullPath}' is no constraint file (*.sdc, *.xdc)."))
+			context.RaiseException(OSVVMException(f"Path '{fullPath}' is no constraint file (*.sdc, *.xdc)."))
 
 		constraint = OSVVM_ConstraintFile(Path(file), **properties)
-		return osvvmContext.AddOption(constraint)
+		return context.AddOption(constraint)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def ScopeToRef(refName: str) -> int:
+def ScopeToRef(context: Context, refName: str) -> int:
 	"""
 	This function implements the behavior of pyEDAA's ``ScopeToRef`` procedure.
 
 	Create and register a :class:`~pyEDAA.OSVVM.Project.ScopeToRef` option and return the options unique ID.
 
+	:param context:     The TCL execution context.
 	:param refName:     Reference name.
 	:returns:           The option's unique ID.
 	:raises ValueError: When parameter 'refName' is empty.
@@ -743,19 +772,20 @@ def ScopeToRef(refName: str) -> int:
 			raise ValueError("Parameter 'refName' is a empty string.")
 
 		ref = OSVVM_ScopeToRef(refName)
-		return osvvmContext.AddOption(ref)
+		return context.AddOption(ref)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
 
 
 @export
-def ScopeToCell(cellName: str) -> int:
+def ScopeToCell(context: Context, cellName: str) -> int:
 	"""
 	This function implements the behavior of pyEDAA's ``ScopeToCell`` procedure.
 
 	Create and register a :class:`~pyEDAA.OSVVM.Project.ScopeToCell` option and return the options unique ID.
 
+	:param context:     The TCL execution context.
 	:param cellName:    Cell name.
 	:returns:           The option's unique ID.
 	:raises ValueError: When parameter 'cellName' is empty.
@@ -765,7 +795,7 @@ def ScopeToCell(cellName: str) -> int:
 			raise ValueError("Parameter 'cellName' is a empty string.")
 
 		ref = OSVVM_ScopeToCell(cellName)
-		return osvvmContext.AddOption(ref)
+		return context.AddOption(ref)
 
 	except Exception as ex:       # pragma: no cover
-		osvvmContext.RaiseException(ex)
+		context.RaiseException(ex)
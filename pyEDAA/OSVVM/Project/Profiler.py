@@ -0,0 +1,250 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2025-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+A profiler recording the time spent per ``*.pro`` file and per OSVVM procedure while evaluating ``*.pro`` files.
+
+Evaluations of ``*.pro`` files and procedure calls form a stack: an included file is evaluated within the ``include``
+procedure, which is called within the including file. For each file and procedure, the total time (including nested
+evaluations) and the self time (excluding nested evaluations) are accumulated. Recursive evaluations are counted only
+once for the total time.
+"""
+from datetime              import timedelta
+from pathlib               import Path
+from time                  import perf_counter_ns
+from typing                import Any, Callable, Dict, List
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+
+@export
+class ProfileRecord(metaclass=ExtendedType, slots=True):
+	"""
+	Call statistics of a profiled ``*.pro`` file or procedure.
+	"""
+
+	_name:        str  #: Name of the file or procedure.
+	_callCount:   int  #: Number of evaluations or calls.
+	_totalTime:   int  #: Accumulated time including nested evaluations in nanoseconds.
+	_selfTime:    int  #: Accumulated time excluding nested evaluations in nanoseconds.
+	_activeCount: int  #: Number of currently active (possibly recursive) evaluations.
+
+	def __init__(self, name: str) -> None:
+		"""
+		Initializes empty call statistics.
+
+		:param name: Name of the file or procedure.
+		"""
+		self._name =        name
+		self._callCount =   0
+		self._totalTime =   0
+		self._selfTime =    0
+		self._activeCount = 0
+
+	@readonly
+	def Name(self) -> str:
+		"""
+		Read-only property to access the name of the file or procedure (:attr:`_name`).
+
+		:returns: Name of the file or procedure.
+		"""
+		return self._name
+
+	@readonly
+	def CallCount(self) -> int:
+		"""
+		Read-only property to access the number of evaluations or calls (:attr:`_callCount`).
+
+		:returns: Number of evaluations or calls.
+		"""
+		return self._callCount
+
+	@readonly
+	def TotalDuration(self) -> timedelta:
+		"""
+		Read-only property returning the accumulated time including nested evaluations (:attr:`_totalTime`).
+
+		:returns: Accumulated time including nested evaluations.
+		"""
+		return timedelta(microseconds=self._totalTime / 1000)
+
+	@readonly
+	def SelfDuration(self) -> timedelta:
+		"""
+		Read-only property returning the accumulated time excluding nested evaluations (:attr:`_selfTime`).
+
+		:returns: Accumulated time excluding nested evaluations.
+		"""
+		return timedelta(microseconds=self._selfTime / 1000)
+
+	def __repr__(self) -> str:
+		return f"ProfileRecord: {self._name} ({self._callCount} calls)"
+
+
+@export
+class ProcessingProfiler(metaclass=ExtendedType, slots=True):
+	"""
+	Records call counts, total and self times per ``*.pro`` file and per procedure.
+
+	.. rubric:: Usage:
+
+	.. code-block:: Python
+
+	   profiler = ProcessingProfiler()
+	   processor = OsvvmProFileProcessor(profiler=profiler)
+	   processor.LoadRegressionFile(Path("RunAllTests.pro"))
+	   print(profiler.Report())
+	"""
+
+	_files:      Dict[str, ProfileRecord]  #: Statistics per ``*.pro`` file.
+	_procedures: Dict[str, ProfileRecord]  #: Statistics per procedure.
+	_stack:      List[List[Any]]           #: Active evaluations as ``[record, start time, time spent in nested evaluations]``.
+
+	def __init__(self) -> None:
+		"""
+		Initializes an empty profiler.
+		"""
+		self._files =      {}
+		self._procedures = {}
+		self._stack =      []
+
+	@readonly
+	def Files(self) -> Dict[str, ProfileRecord]:
+		"""
+		Read-only property to access the statistics per ``*.pro`` file (:attr:`_files`).
+
+		:returns: Dictionary of statistics by file path.
+		"""
+		return self._files
+
+	@readonly
+	def Procedures(self) -> Dict[str, ProfileRecord]:
+		"""
+		Read-only property to access the statistics per procedure (:attr:`_procedures`).
+
+		:returns: Dictionary of statistics by procedure name.
+		"""
+		return self._procedures
+
+	def Clear(self) -> None:
+		"""
+		Discard all recorded statistics.
+		"""
+		self._files =      {}
+		self._procedures = {}
+		self._stack =      []
+
+	def _Enter(self, record: ProfileRecord) -> None:
+		record._activeCount += 1
+		self._stack.append([record, perf_counter_ns(), 0])
+
+	def _Leave(self) -> None:
+		record, start, nestedTime = self._stack.pop()
+		elapsed = perf_counter_ns() - start
+
+		record._callCount += 1
+		record._selfTime += elapsed - nestedTime
+		record._activeCount -= 1
+		if record._activeCount == 0:
+			record._totalTime += elapsed
+
+		if self._stack:
+			self._stack[-1][2] += elapsed
+
+	def EnterFile(self, file: Path) -> None:
+		"""
+		Mark the begin of a ``*.pro`` file evaluation.
+
+		Each call must be followed by a call to :meth:`LeaveFile`.
+
+		:param file: Path of the evaluated ``*.pro`` file.
+		"""
+		name = file.as_posix()
+		try:
+			record = self._files[name]
+		except KeyError:
+			record = self._files[name] = ProfileRecord(name)
+
+		self._Enter(record)
+
+	def LeaveFile(self) -> None:
+		"""
+		Mark the end of the ``*.pro`` file evaluation started last by :meth:`EnterFile`.
+		"""
+		self._Leave()
+
+	def Call(self, name: str, function: Callable, *args: Any) -> Any:
+		"""
+		Call a procedure and record its statistics.
+
+		:param name:     Name of the procedure.
+		:param function: Python implementation of the procedure.
+		:param args:     Arguments passed to the procedure.
+		:returns:        The procedure's return value.
+		"""
+		try:
+			record = self._procedures[name]
+		except KeyError:
+			record = self._procedures[name] = ProfileRecord(name)
+
+		self._Enter(record)
+		try:
+			return function(*args)
+		finally:
+			self._Leave()
+
+	def WrapProcedure(self, name: str, function: Callable) -> Callable:
+		"""
+		Wrap a procedure, so each call records statistics.
+
+		:param name:     Name of the procedure.
+		:param function: Python implementation of the procedure.
+		:returns:        A callable forwarding all arguments to the procedure.
+		"""
+		def profiledProcedure(*args: Any) -> Any:
+			return self.Call(name, function, *args)
+
+		return profiledProcedure
+
+	def Report(self) -> str:
+		"""
+		Format the recorded statistics as text tables sorted by total time.
+
+		:returns: Report listing files and procedures.
+		"""
+		lines = []
+		for title, records in (("File", self._files), ("Procedure", self._procedures)):
+			lines.append(f"{'Calls':>7}  {'Total [ms]':>11}  {'Self [ms]':>11}  {title}")
+			for record in sorted(records.values(), key=lambda r: r._totalTime, reverse=True):
+				lines.append(f"{record._callCount:>7}  {record._totalTime / 1e6:>11.3f}  {record._selfTime / 1e6:>11.3f}  {record._name}")
+			lines.append("")
+
+		return "\n".join(lines[:-1])
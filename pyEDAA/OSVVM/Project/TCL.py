@@ -31,18 +31,30 @@
 """
 A TCL execution environment for OSVVM's ``*.pro`` files.
 """
+from concurrent.futures              import ProcessPoolExecutor, BrokenExecutor
+from contextlib                      import contextmanager
+from datetime                        import timedelta
+from functools                       import partial
+from hashlib                         import sha256
+from multiprocessing                 import get_context
 from pathlib                         import Path
 from textwrap                        import dedent
+from threading                       import get_ident
 from tkinter                         import Tk, Tcl, TclError
-from typing                          import Any, Dict, Callable, Optional as Nullable
+from typing                          import Any, Dict, Iterator, List, Set, Tuple, Callable, Optional as Nullable
 
 from pyTooling.Decorators            import export, readonly
 from pyTooling.MetaClasses           import ExtendedType
+from pyTooling.Stopwatch             import Stopwatch
 from pyTooling.Versioning            import YearMonthVersion
 from pyVHDLModel                     import VHDLVersion
 
-from pyEDAA.OSVVM                    import OSVVMException
-from pyEDAA.OSVVM.Project            import Context, osvvmContext, Build, Project
+from pyEDAA.OSVVM                    import __version__, OSVVMException
+from pyEDAA.OSVVM.Cache              import CacheDirectory
+from pyEDAA.OSVVM.Project            import Context, IncludeGraph, SourceFile, Build, Project
+from pyEDAA.OSVVM.Project            import BuildName as OSVVM_BuildName
+from pyEDAA.OSVVM.Project.Parser     import Command, ProFileParser, UnsupportedConstruct
+from pyEDAA.OSVVM.Project.Profiler   import ProcessingProfiler
 from pyEDAA.OSVVM.Project.Procedures import noop, NoNullRangeWarning
 from pyEDAA.OSVVM.Project.Procedures import FileExists, DirectoryExists, FindOsvvmSettingsDirectory
 from pyEDAA.OSVVM.Project.Procedures import build, BuildName, include, library, analyze, simulate, generic
@@ -53,27 +65,100 @@ from pyEDAA.OSVVM.Project.Procedures import SetCoverageAnalyzeEnable, SetCoverag
 from pyEDAA.OSVVM.Project.Procedures import ConstraintFile, ScopeToRef, ScopeToCell
 
 
+BuildJob = Tuple[str, str, Path, VHDLVersion, Nullable[Path]]
+"""
+Arguments of a discovered ``build`` call: ``*.pro`` file, build name, current directory, VHDL revision and the resolved
+path of the file calling ``build``.
+"""
+
+FileFingerprint = Tuple[int, int, str]
+"""Modification time in nanoseconds, size and SHA-256 content hash of a file."""
+
+
+def _FingerprintFile(file: Path) -> FileFingerprint:
+	"""
+	Create a fingerprint of a file.
+
+	:param file: Absolute path of a file.
+	:returns:    The file's fingerprint.
+	"""
+	stat = file.stat()
+	return stat.st_mtime_ns, stat.st_size, sha256(file.read_bytes()).hexdigest()
+
+
+def _FingerprintFiles(files: List[Path]) -> Dict[Path, FileFingerprint]:
+	"""
+	Create fingerprints of files.
+
+	:param files: Absolute paths of files.
+	:returns:     Dictionary of fingerprints by path.
+	"""
+	return {file: _FingerprintFile(file) for file in files}
+
+
+def _IsFileUnchanged(file: Path, fingerprint: FileFingerprint) -> bool:
+	"""
+	Check if a file still matches its fingerprint.
+
+	The content hash is only compared, if the file's modification time or size changed.
+
+	:param file:        Absolute path of a file.
+	:param fingerprint: The file's fingerprint.
+	:returns:           True, if the file exists and its content is unchanged.
+	"""
+	mtime, size, contentHash = fingerprint
+	try:
+		stat = file.stat()
+	except OSError:
+		return False
+
+	if stat.st_mtime_ns == mtime and stat.st_size == size:
+		return True
+
+	return stat.st_size == size and sha256(file.read_bytes()).hexdigest() == contentHash
+
+
+def _IsUnchanged(fingerprints: Dict[Path, FileFingerprint]) -> bool:
+	"""
+	Check if files still match their fingerprints.
+
+	:param fingerprints: Dictionary of fingerprints by path.
+	:returns:            True, if all files exist and their content is unchanged.
+	"""
+	return all(_IsFileUnchanged(file, fingerprint) for file, fingerprint in fingerprints.items())
+
+
 @export
 class TclEnvironment(metaclass=ExtendedType, slots=True):
 	"""
 	A TCL execution environment wrapping an embedded TCL interpreter based on :class:`tkinter.Tcl`.
 	"""
-	_tcl:        Tk                   #: The embedded TCL interpreter instance.
-	_procedures: Dict[str, Callable]  #: A dictionary of registered TCL procedures implemented by Python functions.
-	_context:    Context              #: The TCL execution context.
+	_tcl:                Tk                            #: The embedded TCL interpreter instance.
+	_procedures:         Dict[str, Callable]           #: A dictionary of registered TCL procedures implemented by Python functions.
+	_context:            Context                       #: The TCL execution context.
+	_profiler:           Nullable[ProcessingProfiler]  #: Optional profiler recording time spent per file and procedure.
+
+	_baselineVariables:  Set[str]                      #: Global TCL variables existing when the baseline was captured.
+	_baselineCommands:   Set[str]                      #: Global TCL commands existing when the baseline was captured.
+	_baselineNamespaces: Set[str]                      #: TCL namespaces existing when the baseline was captured.
+	_baselineProcedures: Dict[str, Callable]           #: Registered TCL procedures when the baseline was captured.
 
-	def __init__(self, context: Context) -> None:
+	def __init__(self, context: Context, profiler: Nullable[ProcessingProfiler] = None) -> None:
 		"""
 		Initialize a TCL execution environment.
 
-		:param context: The TCL execution context.
+		:param context:  The TCL execution context.
+		:param profiler: Optional, profiler recording time spent per file and procedure.
 		"""
 		self._context = context
+		self._profiler = profiler
 		context._processor = self
 
 		self._tcl = Tcl()
 		self._procedures = {}
 
+		self.CaptureBaseline()
+
 	@readonly
 	def TCL(self) -> Tk:
 		"""
@@ -83,6 +168,15 @@ class TclEnvironment(metaclass=ExtendedType, slots=True):
 		"""
 		return self._tcl
 
+	@readonly
+	def Profiler(self) -> Nullable[ProcessingProfiler]:
+		"""
+		Read-only property to access the profiler (:attr:`_profiler`).
+
+		:returns: The profiler, if profiling is enabled, otherwise ``None``.
+		"""
+		return self._profiler
+
 	@readonly
 	def Procedures(self) -> Dict[str, Callable]:
 		"""
@@ -105,6 +199,8 @@ class TclEnvironment(metaclass=ExtendedType, slots=True):
 		"""
 		Register a Python function as TCL procedure.
 
+		If a profiler is set, calls of the procedure are recorded by the profiler.
+
 		:param pythonFunction:   The Python function to be registered.
 		:param tclProcedureName: Optional, name of the TCl procedure. |br|
 		                         Default: derived the TCL procedure name from Python function name.
@@ -112,9 +208,68 @@ class TclEnvironment(metaclass=ExtendedType, slots=True):
 		if tclProcedureName is None:
 			tclProcedureName = pythonFunction.__name__
 
-		self._tcl.createcommand(tclProcedureName, pythonFunction)
+		if self._profiler is None:
+			self._tcl.createcommand(tclProcedureName, pythonFunction)
+		else:
+			self._tcl.createcommand(tclProcedureName, self._profiler.WrapProcedure(tclProcedureName, pythonFunction))
 		self._procedures[tclProcedureName] = pythonFunction
 
+	def RegisterContextBoundProcedure(self, pythonFunction: Callable, tclProcedureName: Nullable[str] = None) -> None:
+		"""
+		Register a Python function as TCL procedure, which receives this environment's context as first parameter.
+
+		Binding the context per environment (instead of using a global context) allows multiple environments to evaluate
+		TCL code independently, e.g. in different threads.
+
+		:param pythonFunction:   The Python function to be registered. Its first parameter accepts a :class:`Context`.
+		:param tclProcedureName: Optional, name of the TCl procedure. |br|
+		                         Default: derived the TCL procedure name from Python function name.
+		"""
+		if tclProcedureName is None:
+			tclProcedureName = pythonFunction.__name__
+
+		self.RegisterPythonFunctionAsTclProcedure(partial(pythonFunction, self._context), tclProcedureName)
+
+	def _ListTclNames(self, *command: str) -> Set[str]:
+		return {str(name) for name in self._tcl.splitlist(self._tcl.call(*command))}
+
+	def CaptureBaseline(self) -> None:
+		"""
+		Record the interpreter's current global variables, commands, namespaces and registered procedures.
+
+		:meth:`ResetInterpreter` restores the interpreter to this state.
+		"""
+		self._baselineVariables =  self._ListTclNames("info", "globals")
+		self._baselineCommands =   self._ListTclNames("info", "commands", "::*")
+		self._baselineNamespaces = self._ListTclNames("namespace", "children", "::")
+		self._baselineProcedures = self._procedures.copy()
+
+	def ResetInterpreter(self) -> None:
+		"""
+		Reset the embedded TCL interpreter to the state recorded by :meth:`CaptureBaseline`.
+
+		Global variables, commands and namespaces created afterwards are deleted. Registered procedures, which were
+		redefined by TCL code (e.g. by ``proc``) or removed in the meantime, are registered again.
+		"""
+		for variable in self._ListTclNames("info", "globals") - self._baselineVariables:
+			self._tcl.call("unset", "-nocomplain", f"::{variable}")
+
+		for command in self._ListTclNames("info", "commands", "::*") - self._baselineCommands:
+			self._tcl.call("rename", command, "")
+
+		for namespace in self._ListTclNames("namespace", "children", "::") - self._baselineNamespaces:
+			self._tcl.call("namespace", "delete", namespace)
+
+		tclProcedures = self._ListTclNames("info", "procs", "::*")
+		for procedureName in self._procedures.keys() - self._baselineProcedures.keys():
+			del self._procedures[procedureName]
+		for procedureName, pythonFunction in self._baselineProcedures.items():
+			if (
+				self._procedures.get(procedureName) is not pythonFunction or f"::{procedureName}" in tclProcedures or
+				not self._ListTclNames("info", "commands", f"::{procedureName}")
+			):
+				self.RegisterPythonFunctionAsTclProcedure(pythonFunction, procedureName)
+
 	def EvaluateTclCode(self, tclCode: str) -> None:
 		"""
 		Evaluate TCL source code.
@@ -400,18 +555,48 @@ class OsvvmVariables(metaclass=ExtendedType, slots=True):
 class OsvvmProFileProcessor(TclEnvironment):
 	"""
 	An OSVVM-specific TCL execution environment for ``*.pro`` files.
+
+	Loaded builds and regressions can be cached on disk (see :meth:`LoadBuildFile` and :meth:`LoadRegressionFile`). A
+	cache entry is reused, if none of the evaluated ``*.pro`` files changed, so no TCL code is evaluated at all.
+
+	Each evaluated ``*.pro`` file is recorded in the context's :class:`~pyEDAA.OSVVM.Project.IncludeGraph`, so
+	:meth:`Reload` can re-evaluate only builds affected by changed files.
+
+	If native parsing is enabled, ``*.pro`` files using only the literal subset of OSVVM's syntax are evaluated by
+	:class:`~pyEDAA.OSVVM.Project.Parser.ProFileParser` without the TCL interpreter. Other files are evaluated by TCL.
+	Parse results are kept by content hash, so evaluating an unchanged file again (e.g. after :meth:`Reset`) skips
+	parsing.
+
+	If validation is deferred, procedures neither resolve nor check referenced VHDL and constraint files. Instead, all
+	referenced files are resolved and checked in one pass after a build or regression file was evaluated, optionally by
+	multiple threads, and all missing files are reported at once (see :meth:`~pyEDAA.OSVVM.Project.Context.ValidateReferencedFiles`).
 	"""
 
+	_osvvmVariables:    OsvvmVariables                      #: OSVVM default settings.
+	_nativeParsing:     bool                                #: If true, ``*.pro`` files are evaluated by the native parser, if possible.
+	_parsedFiles:       Dict[str, Nullable[List[Command]]]  #: Parsed commands (or ``None`` if unsupported) by content hash.
+	_validationWorkers: Nullable[int]                       #: Number of worker threads validating referenced files.
+
 	def __init__(
 		self,
-		context:        Nullable[Context] = None,
-		osvvmVariables: Nullable[OsvvmVariables] = None
+		context:           Nullable[Context] = None,
+		osvvmVariables:    Nullable[OsvvmVariables] = None,
+		nativeParsing:     bool = False,
+		profiler:          Nullable[ProcessingProfiler] = None,
+		deferValidation:   bool = False,
+		validationWorkers: Nullable[int] = 1
 	) -> None:
 		"""
 		Initialize an OSVVM-specific TCL execution environment.
 
-		:param context:        The TCL execution context.
-		:param osvvmVariables: OSVVM default settings.
+		:param context:           Optional, the TCL execution context. |br|
+		                          Default: a new context owned by this processor.
+		:param osvvmVariables:    OSVVM default settings.
+		:param nativeParsing:     If true, ``*.pro`` files are evaluated by the native parser, if possible.
+		:param profiler:          Optional, profiler recording time spent per ``*.pro`` file and procedure.
+		:param deferValidation:   If true, referenced files are validated after evaluating a build or regression file.
+		:param validationWorkers: Number of worker threads validating referenced files. If ``None``, the executor's
+		                          default is used.
 
 		.. rubric:: Initialization steps:
 
@@ -420,18 +605,80 @@ class OsvvmProFileProcessor(TclEnvironment):
 		3. Overwrite predefined TCL procedures. |br|
 		   Avoid harmful or disturbing actions caused by these procedures.
 		4. Register Python functions as TCL procedures.
+		5. Capture the interpreter's state as baseline for :meth:`Reset`.
 		"""
 		if context is None:
-			context = osvvmContext
+			context = Context()
 
-		super().__init__(context)
+		context._deferValidation = deferValidation
+		super().__init__(context, profiler)
 
 		if osvvmVariables is None:
 			osvvmVariables = OsvvmVariables()
 
+		self._osvvmVariables =    osvvmVariables
+		self._nativeParsing =     nativeParsing
+		self._parsedFiles =       {}
+		self._validationWorkers = validationWorkers
 		self.LoadOsvvmDefaults(osvvmVariables)
 		self.OverwriteTclProcedures()
 		self.RegisterTclProcedures()
+		self.CaptureBaseline()
+
+	@readonly
+	def OSVVMVariables(self) -> OsvvmVariables:
+		"""
+		Read-only property to access the OSVVM default settings (:attr:`_osvvmVariables`).
+
+		:returns: OSVVM default settings.
+		"""
+		return self._osvvmVariables
+
+	@readonly
+	def NativeParsing(self) -> bool:
+		"""
+		Read-only property to access, if ``*.pro`` files are evaluated by the native parser (:attr:`_nativeParsing`).
+
+		:returns: True, if ``*.pro`` files are evaluated by the native parser, if possible.
+		"""
+		return self._nativeParsing
+
+	@readonly
+	def DeferValidation(self) -> bool:
+		"""
+		Read-only property to access, if referenced files are validated after evaluation.
+
+		:returns: True, if referenced files are validated after evaluating a build or regression file.
+		"""
+		return self._context._deferValidation
+
+	@readonly
+	def ValidationWorkers(self) -> Nullable[int]:
+		"""
+		Read-only property to access the number of worker threads validating referenced files (:attr:`_validationWorkers`).
+
+		:returns: Number of worker threads, or ``None`` for the executor's default.
+		"""
+		return self._validationWorkers
+
+	def Reset(self) -> None:
+		"""
+		Reset this processor for reuse, e.g. by a :class:`OsvvmProFileProcessorPool`.
+
+		The TCL interpreter is reset to its state after initialization (see :meth:`ResetInterpreter`), the OSVVM default
+		settings in namespace ``::osvvm`` are reloaded and the context is cleared.
+		"""
+		self.ResetInterpreter()
+		self._tcl.call("namespace", "delete", "::osvvm")
+		self.LoadOsvvmDefaults(self._osvvmVariables)
+		self._ResetContext()
+
+	def _ResetContext(self) -> None:
+		self._context.Clear()
+		self._context._processor = self
+
+	def _ValidateReferencedFiles(self) -> None:
+		self._context.ValidateReferencedFiles(self._validationWorkers)
 
 	def LoadOsvvmDefaults(self, osvvmVariables: OsvvmVariables) -> None:
 		"""
@@ -516,6 +763,8 @@ class OsvvmProFileProcessor(TclEnvironment):
 		"""
 		Register Python functions as TCL procedures.
 
+		Procedures accessing the context are bound to this processor's context (see :meth:`RegisterContextBoundProcedure`).
+
 		.. rubric:: List of registered procedures:
 
 		* ``build`` |rarr| :func:`~pyEDAA.OSVVM.Project.Procedures.build`
@@ -547,35 +796,35 @@ class OsvvmProFileProcessor(TclEnvironment):
 		* ``SetSimulatorResolution`` |rarr| :func:`~pyEDAA.OSVVM.Project.Procedures.noop`
 		* ``GetSimulatorResolution`` |rarr| :func:`~pyEDAA.OSVVM.Project.Procedures.noop`
 		"""
-		self.RegisterPythonFunctionAsTclProcedure(build)
-		self.RegisterPythonFunctionAsTclProcedure(include)
-		self.RegisterPythonFunctionAsTclProcedure(library)
-		self.RegisterPythonFunctionAsTclProcedure(analyze)
-		self.RegisterPythonFunctionAsTclProcedure(simulate)
-		self.RegisterPythonFunctionAsTclProcedure(generic)
+		self.RegisterContextBoundProcedure(build)
+		self.RegisterContextBoundProcedure(include)
+		self.RegisterContextBoundProcedure(library)
+		self.RegisterContextBoundProcedure(analyze)
+		self.RegisterContextBoundProcedure(simulate)
+		self.RegisterContextBoundProcedure(generic)
 
-		self.RegisterPythonFunctionAsTclProcedure(BuildName)
-		self.RegisterPythonFunctionAsTclProcedure(NoNullRangeWarning)
+		self.RegisterContextBoundProcedure(BuildName)
+		self.RegisterContextBoundProcedure(NoNullRangeWarning)
 
-		self.RegisterPythonFunctionAsTclProcedure(TestSuite)
-		self.RegisterPythonFunctionAsTclProcedure(TestName)
-		self.RegisterPythonFunctionAsTclProcedure(RunTest)
+		self.RegisterContextBoundProcedure(TestSuite)
+		self.RegisterContextBoundProcedure(TestName)
+		self.RegisterContextBoundProcedure(RunTest)
 
-		self.RegisterPythonFunctionAsTclProcedure(SetVHDLVersion)
-		self.RegisterPythonFunctionAsTclProcedure(GetVHDLVersion)
-		self.RegisterPythonFunctionAsTclProcedure(SetCoverageAnalyzeEnable)
-		self.RegisterPythonFunctionAsTclProcedure(SetCoverageSimulateEnable)
+		self.RegisterContextBoundProcedure(SetVHDLVersion)
+		self.RegisterContextBoundProcedure(GetVHDLVersion)
+		self.RegisterContextBoundProcedure(SetCoverageAnalyzeEnable)
+		self.RegisterContextBoundProcedure(SetCoverageSimulateEnable)
 
-		self.RegisterPythonFunctionAsTclProcedure(FileExists)
-		self.RegisterPythonFunctionAsTclProcedure(DirectoryExists)
-		self.RegisterPythonFunctionAsTclProcedure(ChangeWorkingDirectory)
+		self.RegisterContextBoundProcedure(FileExists)
+		self.RegisterContextBoundProcedure(DirectoryExists)
+		self.RegisterContextBoundProcedure(ChangeWorkingDirectory)
 
-		self.RegisterPythonFunctionAsTclProcedure(FindOsvvmSettingsDirectory)
+		self.RegisterContextBoundProcedure(FindOsvvmSettingsDirectory)
 		self.RegisterPythonFunctionAsTclProcedure(CreateOsvvmScriptSettingsPkg)
 
-		self.RegisterPythonFunctionAsTclProcedure(ConstraintFile)
-		self.RegisterPythonFunctionAsTclProcedure(ScopeToRef)
-		self.RegisterPythonFunctionAsTclProcedure(ScopeToCell)
+		self.RegisterContextBoundProcedure(ConstraintFile)
+		self.RegisterContextBoundProcedure(ScopeToRef)
+		self.RegisterContextBoundProcedure(ScopeToCell)
 
 		self.RegisterPythonFunctionAsTclProcedure(noop, "OpenBuildHtml")
 		self.RegisterPythonFunctionAsTclProcedure(noop, "SetTranscriptType")
@@ -583,6 +832,209 @@ class OsvvmProFileProcessor(TclEnvironment):
 		self.RegisterPythonFunctionAsTclProcedure(noop, "SetSimulatorResolution")
 		self.RegisterPythonFunctionAsTclProcedure(noop, "GetSimulatorResolution")
 
+	def EvaluateProFile(self, path: Path) -> None:
+		"""
+		Evaluate an OSVVM ``*.pro`` file and record it in the context's include graph and profiler (if set).
+
+		If native parsing is enabled and the file uses only syntax supported by the native parser, the file's commands are
+		evaluated directly by calling the currently registered procedures. Otherwise, or if a called procedure was redefined
+		by TCL code, the file is evaluated by TCL.
+
+		:param path:            Path to a ``*.pro`` file for evaluation.
+		:raises OSVVMException: When a :exc:`~tkinter.TclError` is caught while executing the TCL source code.
+		:raises OSVVMException: When an exception is caught while evaluating natively parsed commands.
+		"""
+		context = self._context
+		file = self._ResolveEvaluatedFile(path)
+		try:
+			fingerprint = _FingerprintFile(file)
+		except OSError:
+			fingerprint = None
+
+		includeGraph = context._includeGraph
+		includeGraph.Enter(file, fingerprint, context._build, context._vhdlversion)
+		if self._profiler is not None:
+			self._profiler.EnterFile(file)
+		try:
+			if (
+				self._nativeParsing and fingerprint is not None and
+				(commands := self._ParseProFile(file, fingerprint)) is not None and self._CanEvaluateNatively(commands)
+			):
+				self._EvaluateCommands(path, commands)
+			else:
+				super().EvaluateProFile(path)
+		finally:
+			if self._profiler is not None:
+				self._profiler.LeaveFile()
+			includeGraph.Leave()
+
+	def _ParseProFile(self, file: Path, fingerprint: FileFingerprint) -> Nullable[List[Command]]:
+		contentHash = fingerprint[2]
+		try:
+			return self._parsedFiles[contentHash]
+		except KeyError:
+			pass
+
+		try:
+			commands = ProFileParser.ParseFile(file)
+		except (UnsupportedConstruct, UnicodeDecodeError):
+			commands = None
+		except OSError:
+			return None
+
+		self._parsedFiles[contentHash] = commands
+		return commands
+
+	def _CanEvaluateNatively(self, commands: List[Command]) -> bool:
+		"""
+		Check if all procedures called by parsed commands are registered Python functions, which weren't redefined by TCL
+		code (e.g. by ``proc``).
+
+		:param commands: Parsed commands.
+		:returns:        True, if the commands can be evaluated without TCL.
+		"""
+		names = {name for command in commands for name in command.IterateNames()}
+		if not names <= self._procedures.keys():
+			return False
+
+		tclProcedures = self._ListTclNames("info", "procs", "::*")
+		return not any(f"::{name}" in tclProcedures for name in names)
+
+	def _EvaluateCommands(self, path: Path, commands: List[Command]) -> None:
+		for command in commands:
+			try:
+				command.Evaluate(self._context, self._profiler, self._procedures)
+			except Exception as e:
+				self._context.ClearLastException()
+				ex = OSVVMException(f"Caught exception while processing '{self._context.WorkingDirectory / path}'.")
+				ex.add_note(f"Command '{command.Name}' in line {command.Line}.")
+				raise ex from e
+
+	def Reload(self, project: Project) -> Set[str]:
+		"""
+		Re-evaluate builds affected by changed ``*.pro`` files and replace them in the project.
+
+		Changed files are detected by comparing the fingerprints recorded in the context's include graph. For each build
+		containing a changed file, the build's entry file is evaluated again starting with the VHDL language revision set
+		when the build was evaluated first. A changed file included by multiple builds causes all these builds to be
+		evaluated again. The new build replaces the old one in the context and in the given project at
+		the same position.
+
+		If a changed file was evaluated outside of a build (e.g. the regression file itself), all builds are evaluated
+		again by evaluating the top-level files.
+
+		Before any re-evaluation, the context's file system cache is invalidated, because changed files might reference
+		added, moved or deleted source files.
+
+		.. note::
+
+		   Builds and projects restored from a cache have no include graph records, thus they are not reloaded.
+
+		:param project: Project created by this processor, e.g. by :meth:`LoadRegressionFile`.
+		:returns:       Names of re-evaluated builds.
+		"""
+		context = self._context
+		includeGraph = context._includeGraph
+		changedFiles = [
+			file for file, fingerprint in includeGraph.Files.items()
+			if fingerprint is None or not _IsFileUnchanged(file, fingerprint)
+		]
+		if len(changedFiles) == 0:
+			return set()
+
+		context._fileSystem.Invalidate()
+		changedBuilds = set()
+		for file in changedFiles:
+			changedBuilds.update(includeGraph.BuildsOf(file))
+
+		if None in changedBuilds:
+			reloadedBuilds = self._ReloadAll(project)
+			self._ValidateReferencedFiles()
+			return reloadedBuilds
+
+		for buildName in [name for name in project._builds if name in changedBuilds]:
+			self._ReloadBuild(project, buildName)
+
+		self._ValidateReferencedFiles()
+		return changedBuilds
+
+	def _ReloadBuild(self, project: Project, buildName: str) -> None:
+		"""
+		Re-evaluate a single build and replace it in the context and project.
+
+		:param project:   Project containing the build.
+		:param buildName: Name of the build.
+		"""
+		context = self._context
+		includeGraph = context._includeGraph
+		entryFile, vhdlVersion = includeGraph.BuildEntry(buildName)
+		oldFiles = includeGraph.RemoveBuild(buildName)
+		context._includedFiles = [
+			file for file in context._includedFiles if self._ResolveEvaluatedFile(file) not in oldFiles
+		]
+
+		previousVHDLVersion = context._vhdlversion
+		build = self._EvaluateBuild(buildName, entryFile, vhdlVersion)
+		context._vhdlversion = previousVHDLVersion
+
+		build._parent = project
+		project._builds[buildName] = build
+
+	def _EvaluateBuild(self, buildName: str, entryFile: Path, vhdlVersion: VHDLVersion) -> Build:
+		"""
+		Evaluate a build's entry file in a new build context.
+
+		The context's current directory is restored afterwards.
+
+		:param buildName:   Name of the build.
+		:param entryFile:   Resolved path of the build's entry file.
+		:param vhdlVersion: VHDL language revision to start with.
+		:returns:           The evaluated build.
+		"""
+		context = self._context
+		context._vhdlversion = vhdlVersion
+		context.BeginBuild(buildName)
+		currentDirectory = context._currentDirectory
+		context._currentDirectory = entryFile.parent.relative_to(context._workingDirectory, walk_up=True)
+		try:
+			proFile = context._currentDirectory / entryFile.name
+			context._includedFiles.append(proFile)
+			self.EvaluateProFile(proFile)
+			return context.EndBuild()
+		finally:
+			context._currentDirectory = currentDirectory
+
+	def _ReloadAll(self, project: Project) -> Set[str]:
+		"""
+		Re-evaluate all top-level files and replace all builds in the project.
+
+		:param project: Project to update.
+		:returns:       Names of all builds.
+		"""
+		context = self._context
+		includeGraph = context._includeGraph
+		topLevel = [(file, vhdlVersion, includeGraph.EntryBuildsOf(file)) for file, vhdlVersion in includeGraph.TopLevel().items()]
+
+		context._includeGraph = IncludeGraph()
+		context._includedFiles = []
+		context._builds = {}
+		context._options.Clear()
+		context._currentDirectory = context._workingDirectory
+
+		for file, vhdlVersion, buildNames in topLevel:
+			if len(buildNames) == 0:
+				context._vhdlversion = vhdlVersion
+				self.EvaluateProFile(file.relative_to(context._workingDirectory, walk_up=True))
+			else:
+				for buildName in buildNames:
+					self._EvaluateBuild(buildName, file, vhdlVersion)
+
+		project._builds = {}
+		for build in context._builds.values():
+			project.AddBuild(build)
+
+		return set(project._builds)
+
 	def LoadIncludeFile(self, path: Path) -> None:
 		"""
 		Load an OSVVM ``*.pro`` file for inclusion (not as a root level build, see :meth:`LoadBuildFile`).
@@ -596,8 +1048,9 @@ class OsvvmProFileProcessor(TclEnvironment):
 		# TODO: should a context be used with _context to restore _currentDirectory?
 		includeFile = self._context.IncludeFile(path)
 		self.EvaluateProFile(includeFile)
+		self._ValidateReferencedFiles()
 
-	def LoadBuildFile(self, buildFile: Path, buildName: Nullable[str] = None) -> Build:
+	def LoadBuildFile(self, buildFile: Path, buildName: Nullable[str] = None, cache: Nullable[CacheDirectory] = None) -> Build:
 		"""
 		Load an OSVVM ``*.pro`` file as build creating a new build context.
 
@@ -606,8 +1059,13 @@ class OsvvmProFileProcessor(TclEnvironment):
 		1. From optional parameter ``buildName``.
 		2. From ``*.pro`` file's filename.
 
-		:param path: Path to the ``*.pro`` file.
-		:returns:    The created build object.
+		If a cache is given, the build is restored from the cache, if none of the ``*.pro`` files included while
+		evaluating the build changed. Otherwise, the build is evaluated and stored in the cache.
+
+		:param buildFile: Path to the ``*.pro`` file.
+		:param buildName: Optional, name of the build.
+		:param cache:     Optional, on-disk cache of evaluated builds.
+		:returns:         The created build object.
 
 		.. seealso::
 
@@ -616,6 +1074,25 @@ class OsvvmProFileProcessor(TclEnvironment):
 		if buildName is None:
 			buildName = buildFile.stem
 
+		if cache is None:
+			build = self._LoadBuildFile(buildFile, buildName)
+			self._ValidateReferencedFiles()
+			return build
+
+		_, proFile = self._context._LocateIncludeFile(buildFile)
+		key = self._CreateCacheKey("build", self._ResolveEvaluatedFile(proFile), buildName)
+		if (build := self._RestoreFromCache(cache, key)) is not None:
+			self._context._builds[build._name] = build
+			return build
+
+		start = len(self._context._includedFiles)
+		build = self._LoadBuildFile(buildFile, buildName)
+		self._ValidateReferencedFiles()
+		self._StoreInCache(cache, key, self._context._includedFiles[start:], build)
+
+		return build
+
+	def _LoadBuildFile(self, buildFile: Path, buildName: str) -> Build:
 		self._context.BeginBuild(buildName)
 		includeFile = self._context.IncludeFile(buildFile)
 		self.EvaluateProFile(includeFile)
@@ -623,7 +1100,7 @@ class OsvvmProFileProcessor(TclEnvironment):
 		# TODO: should a context be used with _context to restore _currentDirectory?
 		return self._context.EndBuild()
 
-	def LoadRegressionFile(self, regressionFile: Path, projectName: Nullable[str] = None) -> Project:
+	def LoadRegressionFile(self, regressionFile: Path, projectName: Nullable[str] = None, cache: Nullable[CacheDirectory] = None) -> Project:
 		"""
 		Load a TCL file as a regression file and create a project from it.
 
@@ -632,16 +1109,472 @@ class OsvvmProFileProcessor(TclEnvironment):
 		1. From optional parameter ``projectName``.
 		2. From ``*.pro`` file's filename.
 
-		:param regressionFile:
-		:param projectName:
-		:return:
+		If a cache is given and the context contains no builds yet, the project is restored from the cache, if neither the
+		regression file nor any ``*.pro`` file included while evaluating it changed. Otherwise, the regression file is
+		evaluated and the resulting project is stored in the cache.
+
+		.. note::
+
+		   Only ``*.pro`` files are fingerprinted. Referenced VHDL and constraint files are checked for existence only,
+		   when the regression file is evaluated.
+
+		:param regressionFile: Path to the regression file.
+		:param projectName:    Optional, name of the project.
+		:param cache:          Optional, on-disk cache of evaluated projects.
+		:returns:              The created project.
 		"""
 		if projectName is None:
 			projectName = regressionFile.stem
 
+		if cache is None or len(self._context._builds) > 0:
+			self.EvaluateProFile(regressionFile)
+			self._ValidateReferencedFiles()
+			return self._context.ToProject(projectName)
+
+		key = self._CreateCacheKey("regression", self._ResolveEvaluatedFile(regressionFile), projectName)
+		if (project := self._RestoreFromCache(cache, key)) is not None:
+			self._context._builds.update(project._builds)
+			return project
+
+		start = len(self._context._includedFiles)
 		self.EvaluateProFile(regressionFile)
+		self._ValidateReferencedFiles()
+		project = self._context.ToProject(projectName)
+		self._StoreInCache(cache, key, self._context._includedFiles[start:], project, regressionFile)
+
+		return project
+
+	def LoadRegressionFileParallel(
+		self,
+		regressionFile: Path,
+		projectName:    Nullable[str] = None,
+		workers:        Nullable[int] = None
+	) -> Project:
+		"""
+		Load a TCL file as a regression file and evaluate its builds in parallel worker processes.
+
+		At first, the regression file is evaluated with a ``build`` procedure, which only records the arguments of each
+		``build`` call (discovery). Then, each discovered build is evaluated in its own process with its own context and
+		processor. Finally, the resulting builds are added to this processor's context in order of discovery, so the
+		created project doesn't depend on the order in which workers finish. The include records of each build are merged
+		into this processor's include graph, so the project can be updated by :meth:`Reload`.
+
+		Worker processes are started by the ``spawn`` method, so they don't inherit this process' TCL interpreter.
+
+		If ``workers`` is ``1``, at most one build was discovered or the process pool can't be used, builds are evaluated
+		one after another in this processor.
+
+		.. note::
+
+		   Builds are assumed to be independent: changes to the context's state made by one build (e.g. the VHDL revision)
+		   aren't visible to following builds.
+
+		:param regressionFile: Path to the regression file.
+		:param projectName:    Optional, name of the project.
+		:param workers:        Number of worker processes. If ``None``, the executor's default is used.
+		:returns:              The created project.
+		:raises ValueError:    When parameter 'workers' is not a positive integer.
+		"""
+		if workers is not None and workers < 1:
+			raise ValueError(f"Parameter 'workers' must be a positive integer.")
+
+		if projectName is None:
+			projectName = regressionFile.stem
+
+		jobs = self._DiscoverBuilds(regressionFile)
+		context = self._context
+
+		results = None
+		if workers != 1 and len(jobs) > 1:
+			try:
+				with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+					futures = [
+						executor.submit(
+							_EvaluateBuildJob, job, context._workingDirectory, self._osvvmVariables, self._nativeParsing, context._deferValidation
+						)
+						for job in jobs
+					]
+					results = [future.result() for future in futures]
+			except (OSError, NotImplementedError, BrokenExecutor):
+				results = None
+
+		if results is None:
+			currentDirectory = context._currentDirectory
+			includeGraph = context._includeGraph
+			for file, buildName, buildDirectory, vhdlVersion, includingFile in jobs:
+				context._currentDirectory = buildDirectory
+				context._vhdlversion = vhdlVersion
+				context._includeGraph = IncludeGraph()
+				try:
+					self._LoadBuildFile(Path(file), buildName)
+				finally:
+					buildIncludeGraph, context._includeGraph = context._includeGraph, includeGraph
+				includeGraph.Merge(buildIncludeGraph, includingFile)
+			context._currentDirectory = currentDirectory
+		else:
+			for (build, includedFiles, referencedFiles, deferredSources, buildIncludeGraph), job in zip(results, jobs):
+				context._builds[build._name] = build
+				context._includedFiles.extend(includedFiles)
+				context._includeGraph.Merge(buildIncludeGraph, job[4])
+				context._deferredSources.extend(deferredSources)
+				for file, proFile in referencedFiles.items():
+					context._referencedFiles.setdefault(file, proFile)
+
+		self._ValidateReferencedFiles()
+		return context.ToProject(projectName)
+
+	def _DiscoverBuilds(self, regressionFile: Path) -> List[BuildJob]:
+		"""
+		Evaluate a regression file, but only record the arguments of ``build`` calls instead of evaluating builds.
+
+		:param regressionFile: Path to the regression file.
+		:returns:              List of discovered builds in order of their ``build`` calls.
+		"""
+		context = self._context
+		jobs = []
+
+		def build(file: str, *options: int) -> None:
+			try:
+				buildName = Path(file).stem
+				for optionID in options:
+					try:
+						option = context.ConsumeOption(int(optionID))
+					except KeyError as ex:  # pragma: no cover
+						context.RaiseException(OSVVMException(f"Option {optionID} not found or already consumed."), ex)
+
+					if isinstance(option, OSVVM_BuildName):
+						buildName = option.Name
+					else:  # pragma: no cover
+						context.RaiseException(OSVVMException(f"Option {optionID} is not a BuildName."), TypeError())
+
+				jobs.append((file, buildName, context._currentDirectory, context._vhdlversion, context._includeGraph.Current))
+
+			except Exception as ex:  # pragma: no cover
+				context.RaiseException(ex)
+
+		originalBuild = self._procedures["build"]
+		self.RegisterPythonFunctionAsTclProcedure(build)
+		try:
+			self.EvaluateProFile(regressionFile)
+		finally:
+			self.RegisterPythonFunctionAsTclProcedure(originalBuild, "build")
+
+		return jobs
+
+	def _ResolveEvaluatedFile(self, path: Path) -> Path:
+		"""
+		Resolve the path of a file passed to :meth:`EvaluateProFile` like it's resolved when evaluated.
+
+		:param path: Path to a ``*.pro`` file, relative to the working directory.
+		:returns:    Resolved absolute path.
+		"""
+		context = self._context
+		return context._fileSystem.Resolve(context._workingDirectory / path)
+
+	def _CreateCacheKey(self, kind: str, file: Path, name: str) -> str:
+		"""
+		Create a cache key from all inputs of an evaluation, except for the evaluated files' content.
+
+		:param kind: Kind of evaluation.
+		:param file: Resolved path of the evaluated file (see :meth:`_ResolveEvaluatedFile`).
+		:param name: Name of the created build or project.
+		:returns:    Cache key.
+		"""
+		context = self._context
+		osvvmVariables = tuple(
+			(slot, getattr(self._osvvmVariables, slot)) for slot in sorted(self._osvvmVariables.__allSlots__)
+		)
+		return CacheDirectory.CreateKey(
+			self.__class__.__qualname__, kind, name, file, context._workingDirectory,
+			context._currentDirectory, context._vhdlversion, osvvmVariables, __version__
+		)
+
+	def _RestoreFromCache(self, cache: CacheDirectory, key: str) -> Nullable[Build | Project]:
+		"""
+		Restore an evaluation result from the cache, if none of the evaluated files changed.
+
+		A stale entry is removed from the cache and counted as a miss. On success, the context's list of included files and
+		VHDL revision are updated as if the files were evaluated.
+
+		:param cache: On-disk cache of evaluated builds and projects.
+		:param key:   Cache key.
+		:returns:     The cached build or project, or ``None`` if there is no valid cache entry.
+		"""
+		if (entry := cache.Get(key, validate=lambda entry: _IsUnchanged(entry[0]))) is None:
+			return None
+
+		_, includedFiles, vhdlVersion, result = entry
+		self._context._includedFiles.extend(includedFiles)
+		self._context._vhdlversion = vhdlVersion
+		return result
+
+	def _StoreInCache(
+		self,
+		cache:         CacheDirectory,
+		key:           str,
+		includedFiles: List[Path],
+		result:        Build | Project,
+		evaluatedFile: Nullable[Path] = None
+	) -> None:
+		"""
+		Store an evaluation result together with fingerprints of all evaluated files in the cache.
+
+		:param cache:         On-disk cache of evaluated builds and projects.
+		:param key:           Cache key.
+		:param includedFiles: Files included while evaluating, relative to the working directory.
+		:param result:        The evaluated build or project.
+		:param evaluatedFile: Optional, evaluated file which isn't part of the included files.
+		"""
+		evaluatedFiles = includedFiles if evaluatedFile is None else [evaluatedFile] + includedFiles
+		fingerprints = _FingerprintFiles([self._ResolveEvaluatedFile(file) for file in evaluatedFiles])
+		cache.Put(key, (fingerprints, list(includedFiles), self._context._vhdlversion, result))
+
+
+@export
+class OsvvmProFileProcessorPool(metaclass=ExtendedType, slots=True):
+	"""
+	A pool of pre-initialized :class:`OsvvmProFileProcessor` instances.
+
+	Creating a processor is expensive, because a TCL interpreter is created and initialized with OSVVM's default settings
+	and procedures. A pool keeps processors warm: a processor handed out by :meth:`Acquire` is reset by
+	:meth:`OsvvmProFileProcessor.Reset` when it's returned, so the next user gets a processor in its initial state.
+
+	.. important::
+
+	   An embedded TCL interpreter can only be used and deleted by the thread, which created it. Therefore, a pool is bound
+	   to the thread creating the pool. Create one pool per thread, when processors are needed in multiple threads.
+
+	.. rubric:: Usage:
+
+	.. code-block:: Python
+
+	   pool = OsvvmProFileProcessorPool()
+	   with pool.Acquire() as processor:
+	     project = processor.LoadRegressionFile(Path("RunAllTests.pro"))
+	"""
+
+	_osvvmVariables: OsvvmVariables                #: OSVVM default settings used for all processors.
+	_nativeParsing:  bool                          #: If true, processors evaluate ``*.pro`` files by the native parser, if possible.
+	_maxIdle:        int                           #: Maximum number of idle processors kept by the pool.
+	_threadID:       int                           #: Identifier of the thread owning the pool.
+	_idle:           List[OsvvmProFileProcessor]   #: Idle processors ready for use.
+	_hitCount:       int                           #: Number of requests served by an idle processor.
+	_missCount:      int                           #: Number of requests served by creating a new processor.
+	_resetCount:     int                           #: Number of processor resets.
+	_resetDuration:  timedelta                     #: Accumulated time spent for resetting processors.
+
+	def __init__(
+		self,
+		osvvmVariables: Nullable[OsvvmVariables] = None,
+		maxIdle:        int = 4,
+		nativeParsing:  bool = False
+	) -> None:
+		"""
+		Initializes a processor pool bound to the current thread.
+
+		:param osvvmVariables: Optional, OSVVM default settings used for all processors.
+		:param maxIdle:        Maximum number of idle processors kept by the pool.
+		:param nativeParsing:  If true, processors evaluate ``*.pro`` files by the native parser, if possible.
+		:raises ValueError:    When parameter 'maxIdle' is negative.
+		"""
+		if maxIdle < 0:
+			raise ValueError(f"Parameter 'maxIdle' must not be negative.")
+
+		if osvvmVariables is None:
+			osvvmVariables = OsvvmVariables()
+
+		self._osvvmVariables = osvvmVariables
+		self._nativeParsing =  nativeParsing
+		self._maxIdle =        maxIdle
+		self._threadID =       get_ident()
+		self._idle =           []
+		self._hitCount =       0
+		self._missCount =      0
+		self._resetCount =     0
+		self._resetDuration =  timedelta()
+
+	@readonly
+	def OSVVMVariables(self) -> OsvvmVariables:
+		"""
+		Read-only property to access the OSVVM default settings used for all processors (:attr:`_osvvmVariables`).
+
+		:returns: OSVVM default settings.
+		"""
+		return self._osvvmVariables
+
+	@readonly
+	def MaxIdle(self) -> int:
+		"""
+		Read-only property to access the maximum number of idle processors (:attr:`_maxIdle`).
+
+		:returns: Maximum number of idle processors kept by the pool.
+		"""
+		return self._maxIdle
+
+	@readonly
+	def IdleCount(self) -> int:
+		"""
+		Read-only property returning the number of idle processors.
+
+		:returns: Number of idle processors ready for use.
+		"""
+		return len(self._idle)
+
+	@readonly
+	def HitCount(self) -> int:
+		"""
+		Read-only property to access the number of requests served by an idle processor (:attr:`_hitCount`).
+
+		:returns: Number of pool hits.
+		"""
+		return self._hitCount
+
+	@readonly
+	def MissCount(self) -> int:
+		"""
+		Read-only property to access the number of requests served by creating a new processor (:attr:`_missCount`).
+
+		:returns: Number of pool misses.
+		"""
+		return self._missCount
+
+	@readonly
+	def ResetCount(self) -> int:
+		"""
+		Read-only property to access the number of processor resets (:attr:`_resetCount`).
+
+		:returns: Number of processor resets.
+		"""
+		return self._resetCount
+
+	@readonly
+	def ResetDuration(self) -> timedelta:
+		"""
+		Read-only property to access the accumulated time spent for resetting processors (:attr:`_resetDuration`).
+
+		:returns: Accumulated reset duration.
+		"""
+		return self._resetDuration
+
+	@readonly
+	def AverageResetDuration(self) -> timedelta:
+		"""
+		Read-only property returning the average time spent for resetting a processor.
+
+		:returns: Average reset duration, or zero if no processor was reset yet.
+		"""
+		if self._resetCount == 0:
+			return timedelta()
+
+		return self._resetDuration / self._resetCount
+
+	def _CheckThread(self) -> None:
+		if get_ident() != self._threadID:
+			ex = OSVVMException(f"Processor pool is used by a thread not owning the pool.")
+			ex.add_note(f"TCL interpreters can only be used by the thread, which created them. Create one pool per thread.")
+			raise ex
+
+	def Warm(self, count: Nullable[int] = None) -> None:
+		"""
+		Create processors in advance, until the pool holds ``count`` idle processors.
+
+		:param count:       Optional, number of idle processors. |br|
+		                    Default: :attr:`MaxIdle`
+		:raises ValueError: When parameter 'count' exceeds :attr:`MaxIdle`.
+		"""
+		self._CheckThread()
+
+		if count is None:
+			count = self._maxIdle
+		elif count > self._maxIdle:
+			ex = ValueError(f"Parameter 'count' exceeds the maximum number of idle processors.")
+			ex.add_note(f"Got {count}, but at most {self._maxIdle} idle processors are kept.")
+			raise ex
+
+		while len(self._idle) < count:
+			self._idle.append(OsvvmProFileProcessor(osvvmVariables=self._osvvmVariables, nativeParsing=self._nativeParsing))
+
+	@contextmanager
+	def Acquire(self) -> Iterator[OsvvmProFileProcessor]:
+		"""
+		Hand out a processor for the duration of a ``with`` statement.
+
+		If an idle processor is available, it's reused (hit). Otherwise, a new processor is created (miss). When the
+		``with`` statement is left, the processor is reset and kept for reuse, unless :attr:`MaxIdle` processors are idle
+		already. A processor, which can't be reset, is discarded.
+
+		:returns:               A processor in its initial state.
+		:raises OSVVMException: When the pool is used by a thread not owning the pool.
+		"""
+		self._CheckThread()
+
+		if self._idle:
+			processor = self._idle.pop()
+			processor._ResetContext()  # pick up the current working directory
+			self._hitCount += 1
+		else:
+			processor = OsvvmProFileProcessor(osvvmVariables=self._osvvmVariables, nativeParsing=self._nativeParsing)
+			self._missCount += 1
+
+		try:
+			yield processor
+		finally:
+			self._Release(processor)
+
+	def _Release(self, processor: OsvvmProFileProcessor) -> None:
+		if len(self._idle) >= self._maxIdle:
+			return
+
+		try:
+			with Stopwatch() as sw:
+				processor.Reset()
+		except (TclError, OSVVMException):  # pragma: no cover
+			return
+
+		self._resetCount += 1
+		self._resetDuration += timedelta(seconds=sw.Duration)
+		self._idle.append(processor)
+
+	def Clear(self) -> None:
+		"""
+		Discard all idle processors.
+
+		:raises OSVVMException: When the pool is used by a thread not owning the pool.
+		"""
+		self._CheckThread()
+		self._idle.clear()
+
+
+def _EvaluateBuildJob(
+	job:              BuildJob,
+	workingDirectory: Path,
+	osvvmVariables:   OsvvmVariables,
+	nativeParsing:    bool,
+	deferValidation:  bool
+) -> Tuple[Build, List[Path], Dict[Path, Nullable[Path]], List[SourceFile], IncludeGraph]:
+	"""
+	Evaluate a discovered build in a worker process.
+
+	:param job:              Arguments of the discovered ``build`` call.
+	:param workingDirectory: Working directory of the discovering processor.
+	:param osvvmVariables:   OSVVM default settings of the discovering processor.
+	:param nativeParsing:    If true, ``*.pro`` files are evaluated by the native parser, if possible.
+	:param deferValidation:  If true, referenced files are returned for validation by the discovering processor.
+	:returns:                The evaluated build, the list of included ``*.pro`` files, the referenced files awaiting
+	                         validation, the build's source files with unresolved paths and the include records of the
+	                         build.
+	"""
+	file, buildName, currentDirectory, vhdlVersion, _ = job
+
+	context = Context()
+	context._workingDirectory = workingDirectory
+	context._currentDirectory = currentDirectory
+	context._vhdlversion = vhdlVersion
+
+	processor = OsvvmProFileProcessor(context, osvvmVariables, nativeParsing, deferValidation=deferValidation)
+	build = processor._LoadBuildFile(Path(file), buildName)
 
-		return self._context.ToProject(projectName)
+	return build, context._includedFiles, context._referencedFiles, context._deferredSources, context._includeGraph
 
 
 @export
@@ -31,8 +31,12 @@
 """
 Data model for OSVVM's ``*.pro`` files.
 """
+from concurrent.futures    import ThreadPoolExecutor
+from enum                  import Enum, auto
+from os                    import scandir
 from pathlib               import Path
-from typing                import Optional as Nullable, List, Dict, Mapping, Iterable, TypeVar, Generic, Generator, NoReturn
+from stat                  import S_ISDIR, S_ISREG
+from typing                import Optional as Nullable, Any, List, Dict, Set, Tuple, Mapping, Iterable, TypeVar, Generic, Generator, NoReturn
 
 from pyTooling.Decorators  import readonly, export
 from pyTooling.MetaClasses import ExtendedType
@@ -1164,6 +1168,677 @@ class Project(Named):
 		return f"Project: {self._name}"
 
 
+@export
+class OptionTable(metaclass=ExtendedType, slots=True):
+	"""
+	A bounded table of options registered while processing OSVVM scripts.
+
+	Each option is registered under a unique handle (integer), because TCL can't pass complex Python objects through the
+	TCL layer back to Python. Handles increase monotonically and are never reused, so a stale handle can't refer to a
+	different option. Procedures consuming options (e.g. ``analyze`` or ``simulate``) release the handles, so only options
+	not yet consumed are kept alive.
+
+	The number of live options is limited by the table's capacity. Exceeding it indicates options, which are registered
+	but never consumed, thus registering another option raises an exception instead of silently dropping an option.
+	"""
+
+	_options:      Dict[int, Option]  #: Live options by handle.
+	_capacity:     int                #: Maximum number of live options.
+	_nextHandle:   int                #: Handle assigned to the next registered option.
+	_peakCount:    int                #: Maximum number of live options seen.
+	_releaseCount: int                #: Number of released handles.
+
+	def __init__(self, capacity: int = 4096) -> None:
+		"""
+		Initializes an empty option table.
+
+		:param capacity:    Maximum number of live options.
+		:raises ValueError: When parameter 'capacity' is not a positive integer.
+		"""
+		if capacity < 1:
+			raise ValueError(f"Parameter 'capacity' must be a positive integer.")
+
+		self._options =      {}
+		self._capacity =     capacity
+		self._nextHandle =   1
+		self._peakCount =    0
+		self._releaseCount = 0
+
+	@readonly
+	def Capacity(self) -> int:
+		"""
+		Read-only property to access the maximum number of live options (:attr:`_capacity`).
+
+		:returns: Capacity of the table.
+		"""
+		return self._capacity
+
+	@readonly
+	def LiveCount(self) -> int:
+		"""
+		Read-only property to access the number of registered, but not yet released options.
+
+		:returns: Number of live options.
+		"""
+		return len(self._options)
+
+	@readonly
+	def PeakCount(self) -> int:
+		"""
+		Read-only property to access the maximum number of live options seen (:attr:`_peakCount`).
+
+		:returns: Peak number of live options.
+		"""
+		return self._peakCount
+
+	@readonly
+	def AddCount(self) -> int:
+		"""
+		Read-only property to access the number of registered options.
+
+		:returns: Number of assigned handles.
+		"""
+		return self._nextHandle - 1
+
+	@readonly
+	def ReleaseCount(self) -> int:
+		"""
+		Read-only property to access the number of released handles (:attr:`_releaseCount`).
+
+		:returns: Number of released handles.
+		"""
+		return self._releaseCount
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of live options.
+
+		:returns: Number of live options.
+		"""
+		return len(self._options)
+
+	def __contains__(self, handle: int) -> bool:
+		"""
+		Check if a handle refers to a live option.
+
+		:param handle: Handle of an option.
+		:returns:      True, if the option wasn't released yet.
+		"""
+		return handle in self._options
+
+	def __getitem__(self, handle: int) -> Option:
+		"""
+		Return a live option without releasing its handle.
+
+		:param handle:    Handle of an option.
+		:returns:         The registered option.
+		:raises KeyError: When the handle doesn't refer to a live option.
+		"""
+		return self._options[handle]
+
+	def Add(self, option: Option) -> int:
+		"""
+		Register an option and return a new handle.
+
+		:param option:          Option to register.
+		:returns:               Unique handle of the option.
+		:raises OSVVMException: When the number of live options reached the table's capacity.
+		"""
+		if len(self._options) >= self._capacity:
+			ex = OSVVMException(f"Option table capacity of {self._capacity} live options exceeded.")
+			ex.add_note(f"Options are registered, but not consumed by a procedure. Oldest live option has ID {next(iter(self._options))}.")
+			raise ex
+
+		handle = self._nextHandle
+		self._nextHandle += 1
+		self._options[handle] = option
+		if len(self._options) > self._peakCount:
+			self._peakCount = len(self._options)
+
+		return handle
+
+	def Consume(self, handle: int) -> Option:
+		"""
+		Return an option and release its handle.
+
+		:param handle:    Handle of an option.
+		:returns:         The registered option.
+		:raises KeyError: When the handle doesn't refer to a live option.
+		"""
+		option = self._options.pop(handle)
+		self._releaseCount += 1
+
+		return option
+
+	def Clear(self) -> None:
+		"""
+		Release all handles.
+
+		Handles aren't reused after clearing the table.
+		"""
+		self._releaseCount += len(self._options)
+		self._options = {}
+
+
+@export
+class PathKind(Enum):
+	"""Kind of a file system entry as recorded by :class:`FileSystemCache`."""
+	Missing =   auto()  #: No entry exists at this path.
+	File =      auto()  #: A regular file.
+	Directory = auto()  #: A directory.
+	Other =     auto()  #: Any other entry, e.g. a device or socket.
+
+
+def _StatKind(path: Path) -> PathKind:
+	"""
+	Classify a resolved path by a single system call.
+
+	:param path: Resolved path to classify.
+	:returns:    Kind of the entry.
+	"""
+	try:
+		mode = path.stat().st_mode
+	except OSError:
+		return PathKind.Missing
+
+	return PathKind.File if S_ISREG(mode) else PathKind.Directory if S_ISDIR(mode) else PathKind.Other
+
+
+def _ResolveAndStatKind(path: Path) -> Tuple[Path, PathKind]:
+	"""
+	Resolve and classify a path, e.g. in a worker thread of :meth:`FileSystemCache.Classify`.
+
+	:param path: Path to resolve and classify.
+	:returns:    Resolved path and kind of the entry.
+	"""
+	resolved = path.resolve()
+	return resolved, _StatKind(resolved)
+
+
+@export
+class FileSystemCache(metaclass=ExtendedType, slots=True):
+	"""
+	A memoizing cache of file system queries shared by all procedures during a processing session.
+
+	Resolved paths, the kind of entries (missing, file, directory) and relative paths are computed once per path. When the
+	file system changes during a session, affected entries must be dropped by :meth:`Invalidate`.
+
+	Optionally, :meth:`Prefetch` scans a whole directory tree in one pass. Afterwards, paths within this tree are resolved
+	and classified without further system calls: the kind of an entry is taken from the scan and entries missing in a
+	scanned directory are known to be missing. Symbolic links within the tree are still resolved by the operating system.
+	"""
+
+	_resolved:    Dict[Path, Path]              #: Resolved path per queried path.
+	_kinds:       Dict[Path, PathKind]          #: Kind per resolved path.
+	_relative:    Dict[Tuple[Path, Path], Path] #: Relative path per path and base directory.
+	_scanned:     Set[Path]                     #: Directories, whose entries were all recorded by :meth:`Prefetch`.
+	_links:       Set[Path]                     #: Symbolic links found by :meth:`Prefetch`.
+	_hitCount:    int                           #: Number of queries answered from the cache.
+	_missCount:   int                           #: Number of queries answered by the file system.
+
+	def __init__(self) -> None:
+		"""
+		Initializes an empty file system cache.
+		"""
+		self._resolved =  {}
+		self._kinds =     {}
+		self._relative =  {}
+		self._scanned =   set()
+		self._links =     set()
+		self._hitCount =  0
+		self._missCount = 0
+
+	@readonly
+	def HitCount(self) -> int:
+		"""
+		Read-only property to access the number of queries answered from the cache (:attr:`_hitCount`).
+
+		:returns: Number of cache hits.
+		"""
+		return self._hitCount
+
+	@readonly
+	def MissCount(self) -> int:
+		"""
+		Read-only property to access the number of queries answered by the file system (:attr:`_missCount`).
+
+		:returns: Number of cache misses.
+		"""
+		return self._missCount
+
+	def Resolve(self, path: Path) -> Path:
+		"""
+		Return the absolute path with all symbolic links and ``..`` segments resolved (see :meth:`pathlib.Path.resolve`).
+
+		:param path: Path to resolve. Relative paths are relative to the current working directory.
+		:returns:    Resolved path.
+		"""
+		try:
+			resolved = self._resolved[path]
+			self._hitCount += 1
+			return resolved
+		except KeyError:
+			pass
+
+		if (resolved := self._ResolveFromScan(path)) is None:
+			self._missCount += 1
+			resolved = path.resolve()
+		else:
+			self._hitCount += 1
+
+		self._resolved[path] = resolved
+		return resolved
+
+	def _ResolveFromScan(self, path: Path) -> Nullable[Path]:
+		if len(self._scanned) == 0:
+			return None
+
+		if not path.is_absolute():
+			path = Path.cwd() / path
+
+		# Walk along the path. Each step stays within entries recorded as real (non-link) entries by a scan, so the
+		# lexical result equals the resolved path.
+		parts = path.parts
+		current = Path(parts[0])
+		for part in parts[1:]:
+			if part == "..":
+				current = current.parent
+			else:
+				current = current / part
+				if current not in self._kinds:
+					return None
+
+		return current
+
+	def Kind(self, path: Path) -> PathKind:
+		"""
+		Return the kind of the file system entry a path refers to (following symbolic links).
+
+		:param path: Path to classify.
+		:returns:    Kind of the entry.
+		"""
+		resolved = self.Resolve(path)
+		try:
+			kind = self._kinds[resolved]
+			self._hitCount += 1
+			return kind
+		except KeyError:
+			pass
+
+		if resolved.parent in self._scanned and resolved not in self._links:
+			self._hitCount += 1
+			return PathKind.Missing
+
+		self._missCount += 1
+		kind = self._kinds[resolved] = _StatKind(resolved)
+		return kind
+
+	def _CachedKind(self, path: Path) -> Nullable[PathKind]:
+		if (resolved := self._resolved.get(path)) is None:
+			if (resolved := self._ResolveFromScan(path)) is None:
+				return None
+
+			self._resolved[path] = resolved
+
+		if (kind := self._kinds.get(resolved)) is None:
+			if resolved.parent not in self._scanned or resolved in self._links:
+				return None
+
+			kind = PathKind.Missing
+
+		self._hitCount += 1
+		return kind
+
+	def Classify(self, paths: Iterable[Path], workers: Nullable[int] = 1) -> Dict[Path, PathKind]:
+		"""
+		Return the kind of many file system entries at once (following symbolic links).
+
+		Paths known to the cache are classified without system calls. All other paths are resolved and classified one after
+		another or, if ``workers`` isn't ``1``, by a pool of worker threads. Results are recorded in the cache.
+
+		:param paths:       Paths to classify.
+		:param workers:     Number of worker threads. If ``None``, the executor's default is used.
+		:returns:           Dictionary of kinds by given path.
+		:raises ValueError: When parameter 'workers' is not a positive integer.
+		"""
+		if workers is not None and workers < 1:
+			raise ValueError(f"Parameter 'workers' must be a positive integer.")
+
+		kinds = {}
+		unknown = []
+		for path in paths:
+			if (kind := self._CachedKind(path)) is None:
+				unknown.append(path)
+			else:
+				kinds[path] = kind
+
+		if workers == 1 or len(unknown) <= 1:
+			for path in unknown:
+				kinds[path] = self.Kind(path)
+		else:
+			with ThreadPoolExecutor(max_workers=workers) as executor:
+				results = list(executor.map(_ResolveAndStatKind, unknown))
+
+			for path, (resolved, kind) in zip(unknown, results):
+				self._missCount += 1
+				self._resolved[path] = resolved
+				self._kinds[resolved] = kind
+				kinds[path] = kind
+
+		return kinds
+
+	def Exists(self, path: Path) -> bool:
+		"""
+		Check if a path refers to an existing file system entry.
+
+		:param path: Path to check.
+		:returns:    True, if the entry exists.
+		"""
+		return self.Kind(path) is not PathKind.Missing
+
+	def IsFile(self, path: Path) -> bool:
+		"""
+		Check if a path refers to a regular file.
+
+		:param path: Path to check.
+		:returns:    True, if the entry is a regular file.
+		"""
+		return self.Kind(path) is PathKind.File
+
+	def IsDirectory(self, path: Path) -> bool:
+		"""
+		Check if a path refers to a directory.
+
+		:param path: Path to check.
+		:returns:    True, if the entry is a directory.
+		"""
+		return self.Kind(path) is PathKind.Directory
+
+	def RelativeTo(self, path: Path, base: Path) -> Path:
+		"""
+		Return a path relative to a base directory, using ``..`` segments if needed (see :meth:`pathlib.PurePath.relative_to`).
+
+		:param path: Path to express relatively.
+		:param base: Base directory.
+		:returns:    Relative path.
+		"""
+		key = (path, base)
+		try:
+			relative = self._relative[key]
+			self._hitCount += 1
+			return relative
+		except KeyError:
+			pass
+
+		self._missCount += 1
+		relative = self._relative[key] = path.relative_to(base, walk_up=True)
+		return relative
+
+	def Prefetch(self, directory: Path) -> int:
+		"""
+		Scan a directory tree and record the kind of all entries in one pass.
+
+		Symbolic links aren't followed. Paths through a symbolic link are resolved and classified on demand.
+
+		:param directory: Root directory of the tree to scan.
+		:returns:         Number of recorded entries.
+		"""
+		root = directory.resolve()
+		for parent in root.parents:
+			self._kinds.setdefault(parent, PathKind.Directory)
+		self._kinds[root] = PathKind.Directory
+
+		count = 0
+		stack = [root]
+		while len(stack) > 0:
+			current = stack.pop()
+			try:
+				entries = scandir(current)
+			except OSError:
+				continue
+
+			with entries:
+				for entry in entries:
+					path = current / entry.name
+					if entry.is_symlink():
+						self._links.add(path)
+						continue
+					elif entry.is_dir(follow_symlinks=False):
+						kind = PathKind.Directory
+						stack.append(path)
+					elif entry.is_file(follow_symlinks=False):
+						kind = PathKind.File
+					else:
+						kind = PathKind.Other
+
+					self._kinds[path] = kind
+					count += 1
+
+			self._scanned.add(current)
+
+		return count
+
+	def Invalidate(self, path: Nullable[Path] = None) -> None:
+		"""
+		Drop cached results after the file system changed.
+
+		If a path is given, its recorded kind and the completeness of its parent directory's scan are dropped. In any case,
+		all resolved and relative paths are dropped, because they might depend on the changed entry.
+
+		:param path: Optional, changed path. |br|
+		             Default: drop all cached results, including prefetched entries.
+		"""
+		self._resolved = {}
+		self._relative = {}
+
+		if path is None:
+			self._kinds =   {}
+			self._scanned = set()
+			self._links =   set()
+		else:
+			resolved = path.resolve()
+			self._kinds.pop(resolved, None)
+			self._links.discard(resolved)
+			self._scanned.discard(resolved)
+			self._scanned.discard(resolved.parent)
+
+
+@export
+class IncludeGraph(metaclass=ExtendedType, slots=True):
+	"""
+	A record of evaluated ``*.pro`` files while processing OSVVM scripts.
+
+	For each evaluated file, the graph records which file included (or built) it, all builds it contributed to and a
+	fingerprint of its content at evaluation time. A file included by multiple builds (e.g. a shared ``*.pro`` file of
+	an IP core) is recorded for each of these builds. All files are identified by their resolved path.
+	"""
+	_stack:         List[Path]                             #: Stack of files currently evaluated.
+	_includes:      Dict[Nullable[Path], List[Path]]       #: Included files per including file (``None`` for top-level files).
+	_builds:        Dict[Path, Set[Nullable[str]]]         #: Names of the builds each file contributed to (``None`` outside of builds).
+	_topLevel:      Dict[Path, VHDLVersion]                #: Initial VHDL revision per top-level file.
+	_buildEntries:  Dict[str, Tuple[Path, VHDLVersion]]    #: Entry file and initial VHDL revision per build.
+	_fingerprints:  Dict[Path, Any]                        #: Content fingerprint per file at evaluation time.
+
+	def __init__(self) -> None:
+		"""
+		Initializes an empty include graph.
+		"""
+		self._stack =         []
+		self._includes =      {}
+		self._builds =        {}
+		self._topLevel =      {}
+		self._buildEntries =  {}
+		self._fingerprints =  {}
+
+	@readonly
+	def Current(self) -> Nullable[Path]:
+		"""
+		Read-only property to access the file currently evaluated.
+
+		:returns: The innermost evaluated file, or ``None`` if no file is evaluated.
+		"""
+		return self._stack[-1] if len(self._stack) > 0 else None
+
+	@readonly
+	def Files(self) -> Dict[Path, Any]:
+		"""
+		Read-only property to access all evaluated files and their fingerprints (:attr:`_fingerprints`).
+
+		:returns: Dictionary of fingerprints by evaluated file.
+		"""
+		return self._fingerprints
+
+	def Enter(self, file: Path, fingerprint: Any, build: Nullable["Build"], vhdlVersion: VHDLVersion) -> None:
+		"""
+		Record the start of a file's evaluation.
+
+		:param file:        Resolved path of the evaluated file.
+		:param fingerprint: Fingerprint of the file's content.
+		:param build:       The currently active build, if any.
+		:param vhdlVersion: The currently set VHDL language revision.
+		"""
+		if (current := self.Current) is None and file not in self._topLevel:
+			self._topLevel[file] = vhdlVersion
+
+		includes = self._includes.setdefault(current, [])
+		if file not in includes:
+			includes.append(file)
+
+		self._stack.append(file)
+		self._fingerprints[file] = fingerprint
+		if build is None:
+			self._builds.setdefault(file, set()).add(None)
+		else:
+			self._builds.setdefault(file, set()).add(build._name)
+			if build._name not in self._buildEntries:
+				self._buildEntries[build._name] = (file, vhdlVersion)
+
+	def Leave(self) -> None:
+		"""
+		Record the end of the current file's evaluation.
+		"""
+		self._stack.pop()
+
+	def Includes(self, file: Nullable[Path]) -> List[Path]:
+		"""
+		Return the files directly included by a file.
+
+		:param file: Resolved path of a file, or ``None`` for top-level files.
+		:returns:    List of included files.
+		"""
+		return self._includes.get(file, [])
+
+	def Subtree(self, file: Path) -> Set[Path]:
+		"""
+		Return a file and all files it included directly or indirectly.
+
+		:param file: Resolved path of a file.
+		:returns:    Set of files.
+		"""
+		subtree = set()
+		stack = [file]
+		while stack:
+			if (current := stack.pop()) not in subtree:
+				subtree.add(current)
+				stack.extend(self._includes.get(current, []))
+
+		return subtree
+
+	def BuildsOf(self, file: Path) -> Set[Nullable[str]]:
+		"""
+		Return the names of all builds a file contributed to.
+
+		:param file: Resolved path of a file.
+		:returns:    Set of build names. ``None`` is contained, if the file was evaluated outside of builds.
+		"""
+		return self._builds[file]
+
+	def FilesOf(self, buildName: str) -> Set[Path]:
+		"""
+		Return all files contributing to a build.
+
+		:param buildName: Name of the build.
+		:returns:         Set of resolved file paths.
+		"""
+		return {file for file, names in self._builds.items() if buildName in names}
+
+	def EntryBuildsOf(self, file: Path) -> List[str]:
+		"""
+		Return the names of all builds started by evaluating a file.
+
+		:param file: Resolved path of a file.
+		:returns:    List of build names in order of their evaluation.
+		"""
+		return [buildName for buildName, (entryFile, _) in self._buildEntries.items() if entryFile == file]
+
+	def TopLevel(self) -> Dict[Path, VHDLVersion]:
+		"""
+		Return all top-level files (files not evaluated from within another file) in evaluation order.
+
+		:returns: Dictionary of the VHDL language revision set when evaluating a top-level file by file.
+		"""
+		return self._topLevel
+
+	def BuildEntry(self, buildName: str) -> Tuple[Path, VHDLVersion]:
+		"""
+		Return a build's entry file and the VHDL language revision set when the build started.
+
+		:param buildName: Name of the build.
+		:returns:         Tuple of resolved entry file and VHDL revision.
+		"""
+		return self._buildEntries[buildName]
+
+	def Merge(self, graph: "IncludeGraph", includingFile: Nullable[Path] = None) -> None:
+		"""
+		Merge the records of another include graph, e.g. of a build evaluated in a worker process.
+
+		:param graph:         The include graph to merge.
+		:param includingFile: Optional, resolved path of the file the merged graph's top-level files are included by. If
+		                      ``None``, they stay top-level files.
+		"""
+		if includingFile is None:
+			for file, vhdlVersion in graph._topLevel.items():
+				self._topLevel.setdefault(file, vhdlVersion)
+
+		for file, includes in graph._includes.items():
+			targetIncludes = self._includes.setdefault(includingFile if file is None else file, [])
+			targetIncludes.extend(include for include in includes if include not in targetIncludes)
+
+		for file, buildNames in graph._builds.items():
+			self._builds.setdefault(file, set()).update(buildNames)
+
+		for buildName, entry in graph._buildEntries.items():
+			self._buildEntries.setdefault(buildName, entry)
+
+		self._fingerprints.update(graph._fingerprints)
+
+	def RemoveBuild(self, buildName: str) -> Set[Path]:
+		"""
+		Remove all records of files contributing to a build, e.g. before the build is re-evaluated.
+
+		Files also contributing to other builds (or evaluated outside of builds) are kept, but no longer refer to this build.
+
+		:param buildName: Name of the build.
+		:returns:         Set of files, whose records were removed completely.
+		"""
+		files = set()
+		for file in self.FilesOf(buildName):
+			names = self._builds[file]
+			names.discard(buildName)
+			if len(names) == 0:
+				files.add(file)
+				del self._builds[file]
+				del self._fingerprints[file]
+				self._topLevel.pop(file, None)
+				self._includes.pop(file, None)
+
+		for includes in self._includes.values():
+			includes[:] = [file for file in includes if file not in files]
+
+		del self._buildEntries[buildName]
+		return files
+
+
 @export
 class Context(Base):
 	"""
@@ -1181,25 +1856,30 @@ class Context(Base):
 	"""
 	# _tcl:              TclEnvironment
 
-	_processor:        "OsvvmProFileProcessor"  #: The TCL processor.
-	_lastException:    Nullable[Exception]      #: Last Python exception seen.
+	_processor:        "OsvvmProFileProcessor"     #: The TCL processor.
+	_lastException:    Nullable[Exception]         #: Last Python exception seen.
 
-	_workingDirectory: Path                     #: The working directory, where the processing started.
-	_currentDirectory: Path                     #: The virtual working directory, e.g. updated by including other ``*.pro`` files.
-	_includedFiles:    List[Path]               #: A list of used ``*.pro`` files.
+	_workingDirectory: Path                        #: The working directory, where the processing started.
+	_currentDirectory: Path                        #: The virtual working directory, e.g. updated by including other ``*.pro`` files.
+	_includedFiles:    List[Path]                  #: A list of used ``*.pro`` files.
+	_includeGraph:     IncludeGraph                #: The record of evaluated ``*.pro`` files.
+	_fileSystem:       FileSystemCache             #: Cache of file system queries of this processing session.
+	_deferValidation:  bool                        #: If true, referenced files are validated by :meth:`ValidateReferencedFiles`.
+	_referencedFiles:  Dict[Path, Nullable[Path]]  #: Unresolved referenced files awaiting validation and the ``*.pro`` file referencing them.
+	_deferredSources:  List[SourceFile]            #: Source files with an unresolved path, which is resolved by :meth:`ValidateReferencedFiles`.
 
-	_vhdlversion:      VHDLVersion              #: The currently set VHDL language revision.
+	_vhdlversion:      VHDLVersion                 #: The currently set VHDL language revision.
 
-	_vhdlLibrary:      Nullable[VHDLLibrary]    #: The currently active VHDL library.
-	_vhdlLibraries:    Dict[str, VHDLLibrary]   #: A dictionary of known VHDL libraries.
+	_vhdlLibrary:      Nullable[VHDLLibrary]       #: The currently active VHDL library.
+	_vhdlLibraries:    Dict[str, VHDLLibrary]      #: A dictionary of known VHDL libraries.
 
-	_testsuite:        Nullable[Testsuite]      #: The currently active OSVVM testsuite.
-	_testsuites:       Dict[str, Testsuite]     #: A dictionary of known testsuites.
-	_testcase:         Nullable[Testcase]       #: The currently active OSVVM testcase.
-	_options:          Dict[int, Option]        #: A dictionary of gathered options.
+	_testsuite:        Nullable[Testsuite]         #: The currently active OSVVM testsuite.
+	_testsuites:       Dict[str, Testsuite]        #: A dictionary of known testsuites.
+	_testcase:         Nullable[Testcase]          #: The currently active OSVVM testcase.
+	_options:          OptionTable                 #: The table of registered, but not yet consumed options.
 
-	_build:            Nullable[Build]          #: The currently active OSVVM build.
-	_builds:           Dict[str, Build]         #: A dictionary of known OSVVM builds.
+	_build:            Nullable[Build]             #: The currently active OSVVM build.
+	_builds:           Dict[str, Build]            #: A dictionary of known OSVVM builds.
 
 	def __init__(self) -> None:
 		"""
@@ -1213,6 +1893,11 @@ class Context(Base):
 		self._workingDirectory = Path.cwd()
 		self._currentDirectory = self._workingDirectory
 		self._includedFiles =    []
+		self._includeGraph =     IncludeGraph()
+		self._fileSystem =       FileSystemCache()
+		self._deferValidation =  False
+		self._referencedFiles =  {}
+		self._deferredSources =  []
 
 		self._vhdlversion =      VHDLVersion.VHDL2008
 
@@ -1222,7 +1907,7 @@ class Context(Base):
 		self._testcase =         None
 		self._testsuite =        None
 		self._testsuites =       {}
-		self._options =          {}
+		self._options =          OptionTable()
 
 		self._build =            None
 		self._builds =           {}
@@ -1237,6 +1922,10 @@ class Context(Base):
 		self._workingDirectory = Path.cwd()
 		self._currentDirectory = self._workingDirectory
 		self._includedFiles =    []
+		self._includeGraph =     IncludeGraph()
+		self._fileSystem =       FileSystemCache()
+		self._referencedFiles =  {}
+		self._deferredSources =  []
 
 		self._vhdlversion =      VHDLVersion.VHDL2008
 
@@ -1246,7 +1935,7 @@ class Context(Base):
 		self._testcase =         None
 		self._testsuite =        None
 		self._testsuites =       {}
-		self._options =          {}
+		self._options.Clear()
 
 		self._build =            None
 		self._builds =           {}
@@ -1315,6 +2004,55 @@ class Context(Base):
 		"""
 		return self._includedFiles
 
+	@readonly
+	def IncludeGraph(self) -> IncludeGraph:
+		"""
+		Read-only property to access the record of evaluated ``*.pro`` files (:attr:`_includeGraph`).
+
+		:returns: The include graph.
+		"""
+		return self._includeGraph
+
+	@readonly
+	def FileSystem(self) -> FileSystemCache:
+		"""
+		Read-only property to access the cache of file system queries (:attr:`_fileSystem`).
+
+		:returns: The file system cache of this processing session.
+		"""
+		return self._fileSystem
+
+	@property
+	def DeferValidation(self) -> bool:
+		"""
+		Property to access, if referenced files are validated after evaluation (:attr:`_deferValidation`).
+
+		:returns: True, if referenced files are validated by :meth:`ValidateReferencedFiles`, otherwise when referenced.
+		"""
+		return self._deferValidation
+
+	@DeferValidation.setter
+	def DeferValidation(self, value: bool) -> None:
+		self._deferValidation = value
+
+	@readonly
+	def ReferencedFiles(self) -> Dict[Path, Nullable[Path]]:
+		"""
+		Read-only property to access the referenced files awaiting validation (:attr:`_referencedFiles`).
+
+		:returns: Dictionary of referencing ``*.pro`` files by unresolved path of referenced files.
+		"""
+		return self._referencedFiles
+
+	@readonly
+	def Options(self) -> OptionTable:
+		"""
+		Read-only property to access the table of registered, but not yet consumed options (:attr:`_options`).
+
+		:returns: The option table.
+		"""
+		return self._options
+
 	@readonly
 	def VHDLLibrary(self) -> VHDLLibrary:
 		"""
@@ -1480,6 +2218,20 @@ class Context(Base):
 		:raises OSVVMException:         When the resolved path neither references a ``*.pro`` file nor an OSVVM build
 		                                directory.
 		"""
+		self._currentDirectory, proFile = self._LocateIncludeFile(proFileOrBuildDirectory)
+
+		self._includedFiles.append(proFile)
+		return proFile
+
+	def _LocateIncludeFile(self, proFileOrBuildDirectory: Path) -> Tuple[Path, Path]:
+		"""
+		Locate the ``*.pro`` file, which :meth:`IncludeFile` would include, without changing the context's state.
+
+		:param proFileOrBuildDirectory: The path to the ``*.pro`` file or directory containing a ``*.pro`` file.
+		:returns:                       A tuple of the new current directory and the path to the found ``*.pro`` file.
+		:raises TypeError:              When parameter 'proFileOrBuildDirectory' is not of type :class:`~pathlib.Path`.
+		:raises OSVVMException:         When the path can't be included (see :meth:`IncludeFile`).
+		"""
 		if not isinstance(proFileOrBuildDirectory, Path):  # pragma: no cover
 			ex = TypeError(f"Parameter 'proFileOrBuildDirectory' is not a Path.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(proFileOrBuildDirectory)}'.")
@@ -1489,27 +2241,27 @@ class Context(Base):
 			ex = OSVVMException(f"Absolute path '{proFileOrBuildDirectory}' not supported.")
 			self.RaiseException(ex)
 
-		path = (self._currentDirectory / proFileOrBuildDirectory).resolve()
-		if path.is_file():
+		fileSystem = self._fileSystem
+		path = fileSystem.Resolve(self._currentDirectory / proFileOrBuildDirectory)
+		if fileSystem.IsFile(path):
 			if path.suffix == ".pro":
-				self._currentDirectory = path.parent.relative_to(self._workingDirectory, walk_up=True)
-				proFile = self._currentDirectory / path.name
+				currentDirectory = fileSystem.RelativeTo(path.parent, self._workingDirectory)
+				proFile = currentDirectory / path.name
 			else:
 				self.RaiseException(OSVVMException(f"Path '{proFileOrBuildDirectory}' is not a *.pro file."))
-		elif path.is_dir():
-			self._currentDirectory = path
+		elif fileSystem.IsDirectory(path):
+			currentDirectory = path
 			proFile = path / "build.pro"
-			if not proFile.exists():
+			if not fileSystem.Exists(proFile):
 				proFile = path / f"{path.name}.pro"
-				if not proFile.exists():  # pragma: no cover
+				if not fileSystem.Exists(proFile):  # pragma: no cover
 					ex = OSVVMException(f"Path '{proFileOrBuildDirectory}' is not a build directory.")
 					ex.__cause__ = FileNotFoundError(path / "build.pro")
 					self.RaiseException(ex)
 		else:  # pragma: no cover
 			self.RaiseException(OSVVMException(f"Path '{proFileOrBuildDirectory}' is not a *.pro file or build directory."))
 
-		self._includedFiles.append(proFile)
-		return proFile
+		return currentDirectory, proFile
 
 	def EvaluateFile(self, proFile: Path) -> None:
 		"""
@@ -1519,6 +2271,73 @@ class Context(Base):
 		"""
 		self._processor.EvaluateProFile(proFile)
 
+	def CheckReferencedFile(self, path: Path) -> Nullable[Path]:
+		"""
+		Check if a file referenced by a procedure (e.g. a VHDL source file) exists.
+
+		If validation is deferred, the file is neither resolved nor checked, but recorded together with the currently
+		evaluated ``*.pro`` file for :meth:`ValidateReferencedFiles`.
+
+		:param path: Path of the referenced file, e.g. relative to the current directory.
+		:returns:    The resolved path, if the file exists, the given path, if its validation is deferred, otherwise ``None``.
+		"""
+		if self._deferValidation:
+			self._referencedFiles.setdefault(path, self._includeGraph.Current)
+			return path
+
+		resolved = self._fileSystem.Resolve(path)
+		return resolved if self._fileSystem.Exists(resolved) else None
+
+	def ReferenceSourceFile(self, sourceFile: SourceFile) -> SourceFile:
+		"""
+		Make a source file's path, as returned by :meth:`CheckReferencedFile`, relative to the working directory.
+
+		If validation is deferred, the path isn't resolved yet. Then, the path is updated by :meth:`ValidateReferencedFiles`.
+
+		:param sourceFile: Source file created from a path returned by :meth:`CheckReferencedFile`.
+		:returns:          The given source file.
+		"""
+		if self._deferValidation:
+			self._deferredSources.append(sourceFile)
+		else:
+			sourceFile._path = self._fileSystem.RelativeTo(sourceFile._path, self._workingDirectory)
+
+		return sourceFile
+
+	def ValidateReferencedFiles(self, workers: Nullable[int] = 1) -> None:
+		"""
+		Resolve and check all recorded referenced files in one pass and report all missing files at once.
+
+		Paths of source files recorded by :meth:`ReferenceSourceFile` are made relative to the working directory.
+		Afterwards, the records of referenced files and source files are empty.
+
+		:param workers:         Number of worker threads resolving and checking files. If ``None``, the executor's default
+		                        is used.
+		:raises OSVVMException: When referenced files don't exist.
+		"""
+		referencedFiles = self._referencedFiles
+		deferredSources = self._deferredSources
+		self._referencedFiles = {}
+		self._deferredSources = []
+
+		fileSystem = self._fileSystem
+		kinds = fileSystem.Classify(referencedFiles, workers)
+		for sourceFile in deferredSources:
+			sourceFile._path = fileSystem.RelativeTo(fileSystem.Resolve(sourceFile._path), self._workingDirectory)
+
+		missingFiles = [path for path, kind in kinds.items() if kind is PathKind.Missing]
+		if len(missingFiles) == 0:
+			return
+
+		ex = OSVVMException(f"{len(missingFiles)} referenced file(s) don't exist.")
+		for path in missingFiles:
+			if (proFile := referencedFiles[path]) is None:
+				ex.add_note(f"File '{fileSystem.Resolve(path)}'.")
+			else:
+				ex.add_note(f"File '{fileSystem.Resolve(path)}' referenced in '{proFile}'.")
+
+		self.RaiseException(ex, FileNotFoundError(fileSystem.Resolve(missingFiles[0])))
+
 	def SetLibrary(self, name: str) -> None:
 		"""
 		Set or create the currently active VHDL library.
@@ -1613,20 +2432,33 @@ class Context(Base):
 		   options are registered in a dictionary and a unique ID (integer) is returned. Back in Python, this ID can be
 		   converted back to the Python object.
 
-		   This unique ID is based on :func:`id`.
+		   This unique ID is a handle of the context's :class:`OptionTable`. It's released, when a procedure consumes the
+		   option, thus an option ID can be passed to one procedure only.
 
 		:param option: Option to register.
 		:returns:      Unique option ID.
 		"""
-		optionID = id(option)
-		self._options[optionID] = option
+		return self._options.Add(option)
 
-		return optionID
+	def ConsumeOption(self, optionID: int) -> Option:
+		"""
+		Return a registered option and release its ID.
+
+		:param optionID:  Unique option ID returned by :meth:`AddOption`.
+		:returns:         The registered option.
+		:raises KeyError: When the option ID is unknown or was released already.
+		"""
+		return self._options.Consume(optionID)
 
 
 osvvmContext: Context = Context()
 """
 Global OSVVM processing context.
 
+.. note::
+
+   Procedures are bound to their processor's context. A processor created without a context uses its own new context.
+   This global context is only used, if it's passed explicitly to a processor.
+
 :type: Context
 """
@@ -0,0 +1,542 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2021-2026 Electronic Design Automation Abstraction (EDA²)                                                  #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Watch an OSVVM reports directory and emit updated data models while a regression is running."""
+from asyncio               import to_thread
+from ctypes                import CDLL, get_errno
+from ctypes.util           import find_library
+from enum                  import Enum, auto
+from os                    import read as os_read, write as os_write, close as os_close, pipe, fsencode, fsdecode, strerror
+from pathlib               import Path
+from select                import select
+from struct                import unpack_from
+from sys                   import platform
+from threading             import Event, Lock, Thread
+from time                  import monotonic
+from typing                import Optional as Nullable, AsyncIterator, Callable, Dict, List, Set, Tuple, Union
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.OSVVM          import OSVVMException, YAMLLoader
+from pyEDAA.OSVVM.AlertLog import Document as AlertLogDocument
+from pyEDAA.OSVVM.Build    import BuildSummaryDocument, UnittestException
+
+
+@export
+class WatchBackend(Enum):
+	"""Describes how a :class:`ReportWatcher` gets notified about file system changes."""
+	Inotify = auto()  #: Linux inotify wakes up the watcher on changes.
+	Polling = auto()  #: The watcher scans the directory periodically.
+
+
+@export
+class ReportUpdate(metaclass=ExtendedType, slots=True):
+	"""An updated data model (or a failure to load it) emitted by a :class:`ReportWatcher`."""
+
+	_path:      Path                                                     #: Path to the changed YAML file.
+	_document:  Nullable[Union[BuildSummaryDocument, AlertLogDocument]]  #: Updated data model.
+	_changed:   Nullable[Set[str]]                                       #: Names of changed test suites (build summaries only).
+	_exception: Nullable[Exception]                                      #: Exception raised while loading the file.
+
+	def __init__(
+		self,
+		path: Path,
+		document: Nullable[Union[BuildSummaryDocument, AlertLogDocument]] = None,
+		changed: Nullable[Set[str]] = None,
+		exception: Nullable[Exception] = None
+	) -> None:
+		"""
+		Initializes a report update.
+
+		:param path:      Path to the changed YAML file.
+		:param document:  Updated data model.
+		:param changed:   Names of added, changed or removed test suites (build summaries only).
+		:param exception: Exception raised while loading the file.
+		"""
+		self._path =      path
+		self._document =  document
+		self._changed =   changed
+		self._exception = exception
+
+	@readonly
+	def Path(self) -> Path:
+		"""
+		Read-only property to access the path to the changed YAML file (:attr:`_path`).
+
+		:returns: Path to the YAML file.
+		"""
+		return self._path
+
+	@readonly
+	def Document(self) -> Nullable[Union[BuildSummaryDocument, AlertLogDocument]]:
+		"""
+		Read-only property to access the updated data model (:attr:`_document`).
+
+		:returns: The updated data model or ``None``, if loading failed.
+		"""
+		return self._document
+
+	@readonly
+	def Changed(self) -> Nullable[Set[str]]:
+		"""
+		Read-only property to access the names of added, changed or removed test suites (:attr:`_changed`).
+
+		:returns: Names of changed test suites or ``None`` for AlertLog documents.
+		"""
+		return self._changed
+
+	@readonly
+	def Exception(self) -> Nullable[Exception]:
+		"""
+		Read-only property to access the exception raised while loading the file (:attr:`_exception`).
+
+		:returns: The exception or ``None``, if loading succeeded.
+		"""
+		return self._exception
+
+	def __str__(self) -> str:
+		return f"<ReportUpdate {self._path}: {'failed' if self._exception is not None else 'updated'}>"
+
+
+class _Inotify(metaclass=ExtendedType, slots=True):
+	"""Minimal Linux inotify binding used to wake up a :class:`ReportWatcher` and to report changed paths."""
+
+	_IN_MODIFY =      0x00000002
+	_IN_CLOSE_WRITE = 0x00000008
+	_IN_MOVED_FROM =  0x00000040
+	_IN_MOVED_TO =    0x00000080
+	_IN_CREATE =      0x00000100
+	_IN_DELETE =      0x00000200
+	_IN_Q_OVERFLOW =  0x00004000
+	_IN_IGNORED =     0x00008000
+	_IN_ISDIR =       0x40000000
+	_IN_NONBLOCK =    0o4000
+	_IN_CLOEXEC =     0o2000000
+
+	_libc:        CDLL             #: C library providing the inotify functions.
+	_fd:          int              #: inotify file descriptor.
+	_wakeRead:    int              #: Read end of the pipe waking up :meth:`Wait`.
+	_wakeWrite:   int              #: Write end of the pipe waking up :meth:`Wait`.
+	_directories: Dict[Path, int]  #: Watch descriptor by watched directory.
+	_watches:     Dict[int, Path]  #: Watched directory by watch descriptor.
+
+	def __init__(self) -> None:
+		self._libc = CDLL(find_library("c") or "libc.so.6", use_errno=True)
+		self._fd = self._libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+		if self._fd < 0:
+			errno = get_errno()
+			raise OSError(errno, strerror(errno))
+
+		self._wakeRead, self._wakeWrite = pipe()
+		self._directories = {}
+		self._watches =     {}
+
+	def AddWatch(self, directory: Path) -> None:
+		if directory in self._directories:
+			return
+
+		mask = self._IN_MODIFY | self._IN_CLOSE_WRITE | self._IN_MOVED_FROM | self._IN_MOVED_TO | self._IN_CREATE | self._IN_DELETE
+		if (watch := self._libc.inotify_add_watch(self._fd, fsencode(directory), mask)) < 0:
+			errno = get_errno()
+			raise OSError(errno, strerror(errno), str(directory))
+
+		self._directories[directory] = watch
+		self._watches[watch] = directory
+
+	def Wait(self, timeout: float) -> bool:
+		"""
+		Wait until events are available, :meth:`Wake` was called or the timeout expired.
+
+		:param timeout: Timeout in seconds.
+		:returns:       True, if events are available.
+		"""
+		readable, _, _ = select([self._fd, self._wakeRead], [], [], timeout)
+		if self._wakeRead in readable:
+			os_read(self._wakeRead, 64)
+
+		return self._fd in readable
+
+	def Wake(self) -> None:
+		os_write(self._wakeWrite, b"\0")
+
+	def ReadEvents(self) -> Nullable[List[Tuple[Path, bool]]]:
+		"""
+		Read all available events without blocking.
+
+		:returns: List of changed paths and whether they are directories, or ``None`` if events were lost.
+		"""
+		events = []
+		overflow = False
+		try:
+			while data := os_read(self._fd, 65536):
+				offset = 0
+				while offset < len(data):
+					watch, mask, _, length = unpack_from("iIII", data, offset)
+					name = data[offset + 16:offset + 16 + length].rstrip(b"\0")
+					offset += 16 + length
+
+					if mask & self._IN_Q_OVERFLOW:
+						overflow = True
+					elif (directory := self._watches.get(watch)) is None:
+						continue
+					elif mask & self._IN_IGNORED:
+						del self._watches[watch]
+						del self._directories[directory]
+					elif name:
+						events.append((directory / fsdecode(name), bool(mask & self._IN_ISDIR)))
+		except BlockingIOError:
+			pass
+
+		return None if overflow else events
+
+	def Close(self) -> None:
+		os_close(self._fd)
+		os_close(self._wakeRead)
+		os_close(self._wakeWrite)
+
+
+@export
+class ReportWatcher(metaclass=ExtendedType, slots=True):
+	"""
+	Watches an OSVVM reports directory and emits updated data models while a regression is running.
+
+	Build summary files (``*.yml`` files directly in the watched directory) are kept as :class:`BuildSummaryDocument`
+	instances and updated via :meth:`BuildSummaryDocument.Refresh`, so only changed test suites are converted. AlertLog
+	files (``*_alerts.yml`` files in any subdirectory) are converted to new :class:`~pyEDAA.OSVVM.AlertLog.Document`
+	instances.
+
+	A file is considered changed, if its modification time or size changed. Writes are debounced: a change is emitted
+	after the file was stable for the debounce time. A file, which can't be loaded (e.g. because it's still written), is
+	reported by an update carrying the exception and loaded again on its next change.
+
+	On Linux, inotify is used to wake up the watcher on changes. After an initial scan, only paths reported by inotify
+	events are checked, so the work per update doesn't depend on the size of the directory tree. If inotify isn't
+	available, the directory is scanned periodically.
+
+	Updates are either processed synchronously by calling :meth:`Poll`, passed to a callback by a background thread
+	started with :meth:`Start`, or consumed from the asynchronous iterator :meth:`Updates`. Exceptions raised by the
+	callback don't stop the background thread; they are collected in :data:`CallbackErrors`.
+	"""
+
+	_directory:      Path                                                       #: Watched reports directory.
+	_loader:         YAMLLoader                                                 #: YAML loader used for analysis.
+	_pollInterval:   float                                                      #: Maximum time between directory scans in seconds.
+	_debounce:       float                                                      #: Time a file must be stable before it's loaded in seconds.
+	_callback:       Nullable[Callable[[ReportUpdate], None]]                   #: Callback for updates processed by the background thread.
+	_inotify:        Nullable[_Inotify]                                         #: inotify binding or ``None`` when polling.
+	_rescan:         bool                                                       #: If true, the next :meth:`Poll` scans the whole directory tree.
+	_lock:           Lock                                                       #: Guards the use of :attr:`_inotify`.
+	_wakeLock:       Lock                                                       #: Guards waking up and closing :attr:`_inotify`.
+	_signatures:     Dict[Path, Tuple[int, int]]                                #: Modification time and size of known files.
+	_pending:        Dict[Path, float]                                          #: Time of the last observed change of not yet loaded files.
+	_documents:      Dict[Path, Union[BuildSummaryDocument, AlertLogDocument]]  #: Latest data model per file.
+	_stop:           Event                                                      #: Signals the background thread or async iterator to stop.
+	_thread:         Nullable[Thread]                                           #: Background thread started by :meth:`Start`.
+	_callbackErrors: List[Tuple[ReportUpdate, Exception]]                       #: Exceptions raised by the callback per update.
+
+	def __init__(
+		self,
+		directory: Path,
+		callback: Nullable[Callable[[ReportUpdate], None]] = None,
+		pollInterval: float = 1.0,
+		debounce: float = 0.5,
+		loader: YAMLLoader | str = YAMLLoader.RoundTrip,
+		useInotify: bool = True
+	) -> None:
+		"""
+		Initializes a report watcher.
+
+		:param directory:    Reports directory to watch.
+		:param callback:     Callback for updates processed by the background thread (see :meth:`Start`).
+		:param pollInterval: Maximum time between directory scans in seconds.
+		:param debounce:     Time a file must be stable before it's loaded in seconds.
+		:param loader:       YAML loader used for analysis.
+		:param useInotify:   If false, always scan the directory periodically.
+		:raises ValueError:  When parameter 'pollInterval' or 'debounce' is negative.
+		"""
+		if pollInterval <= 0.0:
+			raise ValueError(f"Parameter 'pollInterval' must be positive.")
+		elif debounce < 0.0:
+			raise ValueError(f"Parameter 'debounce' must not be negative.")
+
+		self._directory =      directory
+		self._loader =         YAMLLoader(loader)
+		self._pollInterval =   pollInterval
+		self._debounce =       debounce
+		self._callback =       callback
+		self._signatures =     {}
+		self._pending =        {}
+		self._documents =      {}
+		self._stop =           Event()
+		self._thread =         None
+		self._callbackErrors = []
+		self._rescan =         True
+		self._lock =           Lock()
+		self._wakeLock =       Lock()
+
+		self._inotify = None
+		if useInotify and platform.startswith("linux"):
+			try:
+				self._inotify = _Inotify()
+			except (OSError, AttributeError):
+				self._inotify = None
+
+	@readonly
+	def Directory(self) -> Path:
+		"""
+		Read-only property to access the watched reports directory (:attr:`_directory`).
+
+		:returns: The watched directory.
+		"""
+		return self._directory
+
+	@readonly
+	def Backend(self) -> WatchBackend:
+		"""
+		Read-only property returning how the watcher gets notified about changes.
+
+		:returns: The watcher's backend.
+		"""
+		return WatchBackend.Polling if self._inotify is None else WatchBackend.Inotify
+
+	@readonly
+	def Documents(self) -> Dict[Path, Union[BuildSummaryDocument, AlertLogDocument]]:
+		"""
+		Read-only property to access the latest data model per file (:attr:`_documents`).
+
+		:returns: Latest data models by path.
+		"""
+		return self._documents
+
+	@readonly
+	def CallbackErrors(self) -> List[Tuple[ReportUpdate, Exception]]:
+		"""
+		Read-only property to access the exceptions raised by the callback (:attr:`_callbackErrors`).
+
+		The list is cleared by :meth:`Start`.
+
+		:returns: List of updates and the exception the callback raised for it.
+		"""
+		return self._callbackErrors
+
+	def Poll(self) -> List[ReportUpdate]:
+		"""
+		Check the watched directory once and load all files, which changed and are stable for the debounce time.
+
+		With inotify, only paths reported by inotify events since the last call are checked. Otherwise, or if events were
+		lost, the whole directory tree is scanned.
+
+		:returns: List of updates.
+		"""
+		now = monotonic()
+		if (paths := self._ChangedPaths()) is None:
+			paths = self._Scan()
+			for path in set(self._signatures) - paths:
+				self._Forget(path)
+
+		for path in paths | set(self._pending):
+			try:
+				stat = path.stat()
+			except FileNotFoundError:
+				self._Forget(path)
+				continue
+
+			signature = (stat.st_mtime_ns, stat.st_size)
+			if self._signatures.get(path) != signature:
+				self._signatures[path] = signature
+				self._pending[path] = now
+
+		updates = []
+		for path, changedAt in list(self._pending.items()):
+			if now - changedAt >= self._debounce:
+				del self._pending[path]
+				updates.append(self._Load(path))
+
+		return updates
+
+	def _Forget(self, path: Path) -> None:
+		self._signatures.pop(path, None)
+		self._pending.pop(path, None)
+		self._documents.pop(path, None)
+
+	def _IsReportFile(self, path: Path) -> bool:
+		if path.name.endswith("_alerts.yml"):
+			return True
+
+		return path.suffix == ".yml" and path.parent == self._directory
+
+	def _ChangedPaths(self) -> Nullable[Set[Path]]:
+		"""
+		Collect report files reported by inotify events.
+
+		:returns: Set of possibly changed report files, or ``None`` if the whole directory tree needs to be scanned.
+		"""
+		with self._lock:
+			if self._inotify is None or self._rescan:
+				return None
+
+			if (events := self._inotify.ReadEvents()) is None:
+				self._rescan = True
+				return None
+
+			paths = set()
+			try:
+				for path, isDirectory in events:
+					if not isDirectory:
+						if self._IsReportFile(path):
+							paths.add(path)
+					elif path.is_dir():
+						# Files might have been created before the new directory was watched.
+						self._inotify.AddWatch(path)
+						for subpath in path.rglob("*"):
+							if subpath.is_dir():
+								self._inotify.AddWatch(subpath)
+							elif self._IsReportFile(subpath):
+								paths.add(subpath)
+			except OSError:
+				self._CloseInotify()
+				return None
+
+		return paths
+
+	def _Scan(self) -> Set[Path]:
+		if not self._directory.is_dir():
+			return set()
+
+		paths = {path for path in self._directory.glob("*.yml") if not path.name.endswith("_alerts.yml")}
+		paths.update(self._directory.rglob("*_alerts.yml"))
+
+		with self._lock:
+			if self._inotify is not None:
+				try:
+					self._inotify.AddWatch(self._directory)
+					for subdirectory in self._directory.rglob("*"):
+						if subdirectory.is_dir():
+							self._inotify.AddWatch(subdirectory)
+				except OSError:
+					self._CloseInotify()
+				else:
+					self._rescan = False
+
+		return paths
+
+	def _CloseInotify(self) -> None:
+		with self._wakeLock:
+			if self._inotify is not None:
+				self._inotify.Close()
+				self._inotify = None
+
+	def _Load(self, path: Path) -> ReportUpdate:
+		try:
+			if path.name.endswith("_alerts.yml"):
+				document = AlertLogDocument(path, analyzeAndConvert=True, loader=self._loader)
+				changed = None
+			elif (document := self._documents.get(path)) is not None:
+				changed = document.Refresh()
+			else:
+				document = BuildSummaryDocument(path, analyzeAndConvert=True, loader=self._loader)
+				changed = set(document.Testsuites)
+		except Exception as ex:  # e.g. a file, which is still written
+			self._documents.pop(path, None)
+			return ReportUpdate(path, exception=ex)
+
+		self._documents[path] = document
+		return ReportUpdate(path, document, changed)
+
+	def _Wait(self) -> None:
+		timeout = min(self._pollInterval, self._debounce) if self._pending else self._pollInterval
+		with self._lock:
+			if self._inotify is not None:
+				if not self._stop.is_set():
+					self._inotify.Wait(timeout)
+				return
+
+		self._stop.wait(timeout)
+
+	def _NextUpdates(self) -> List[ReportUpdate]:
+		while not self._stop.is_set():
+			if updates := self.Poll():
+				return updates
+
+			self._Wait()
+
+		return []
+
+	def Start(self) -> None:
+		"""
+		Start a background thread passing all updates to the callback.
+
+		:raises OSVVMException: If no callback was given or the watcher is already running.
+		"""
+		if self._callback is None:
+			raise OSVVMException(f"ReportWatcher for '{self._directory}' has no callback.")
+		elif self._thread is not None:
+			raise OSVVMException(f"ReportWatcher for '{self._directory}' is already running.")
+
+		self._stop.clear()
+		self._callbackErrors = []
+		self._thread = Thread(target=self._Run, name=f"ReportWatcher({self._directory})", daemon=True)
+		self._thread.start()
+
+	def _Run(self) -> None:
+		while not self._stop.is_set():
+			for update in self._NextUpdates():
+				try:
+					self._callback(update)
+				except Exception as ex:
+					self._callbackErrors.append((update, ex))
+
+	def Stop(self) -> None:
+		"""Stop the background thread or asynchronous iterator and release the inotify resources."""
+		self._stop.set()
+		with self._wakeLock:
+			if self._inotify is not None:
+				self._inotify.Wake()
+
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+
+		with self._lock:
+			self._CloseInotify()
+
+	async def Updates(self) -> AsyncIterator[ReportUpdate]:
+		"""
+		Asynchronously iterate updates until :meth:`Stop` is called.
+
+		Scanning, waiting and loading is done in a worker thread, so the event loop isn't blocked.
+
+		:returns: Asynchronous iterator of updates.
+		"""
+		self._stop.clear()
+		while not self._stop.is_set():
+			for update in await to_thread(self._NextUpdates):
+				yield update
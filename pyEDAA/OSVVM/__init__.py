@@ -39,6 +39,8 @@ __project_url__ =       "https://github.com/edaa-org/pyEDAA.OSVVM"
 __documentation_url__ = "https://edaa-org.github.io/pyEDAA.OSVVM"
 __issue_tracker_url__ = "https://GitHub.com/edaa-org/pyEDAA.OSVVM/issues"
 
+from enum                 import Enum
+
 from pyTooling.Decorators import export
 from pyTooling.Exceptions import ExceptionBase
 
@@ -46,3 +48,17 @@ from pyTooling.Exceptions import ExceptionBase
 @export
 class OSVVMException(ExceptionBase):
 	"""Base-class for all pyEDAA.OSVVM specific exceptions."""
+
+
+@export
+class YAMLLoader(Enum):
+	"""
+	Selects the YAML loader used to analyze OSVVM's YAML files.
+
+	The round-trip loader preserves line and column information for every node, which is used to annotate exceptions.
+	The fast loader uses ruamel.yaml's safe loader (C-accelerated, if ``ruamel.yaml.clib`` is installed) and produces
+	plain dictionaries and lists. If the conversion of a fast-loaded document fails, the file is re-analyzed in
+	round-trip mode, so the raised exception still carries line numbers.
+	"""
+	RoundTrip = "roundtrip"  #: ruamel.yaml's round-trip loader creating ``CommentedMap`` and ``CommentedSeq`` nodes.
+	Fast =      "fast"       #: ruamel.yaml's safe loader creating plain ``dict`` and ``list`` nodes.
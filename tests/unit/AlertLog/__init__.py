@@ -139,3 +139,57 @@ class Iterate(TestCase):
 
 		self.assertTupleEqual(tuple(root), children)
 		self.assertDictEqual(root.Children, {c.Name: c for c in children})
+
+
+class Aggregate(TestCase):
+	def test_Subtree(self) -> None:
+		leaf1 = AlertLogItem("leaf1", alertCountWarnings=1, alertCountErrors=2)
+		leaf2 = AlertLogItem("leaf2", totalErrors=3, alertCountFailures=3)
+		inner = AlertLogItem("inner", alertCountWarnings=4, children=(leaf1, leaf2))
+		root = AlertLogItem("root", children=(inner, ))
+
+		self.assertEqual(5, root.SubtreeAlertCountWarnings)
+		self.assertEqual(2, root.SubtreeAlertCountErrors)
+		self.assertEqual(3, root.SubtreeAlertCountFailures)
+		self.assertEqual(3, root.SubtreeTotalErrors)
+		self.assertEqual(11, len(root.SubtreeAggregate))
+
+	def test_Reparent(self) -> None:
+		leaf = AlertLogItem("leaf", alertCountErrors=2)
+		inner1 = AlertLogItem("inner1", children=(leaf, ))
+		inner2 = AlertLogItem("inner2", alertCountErrors=1)
+		root = AlertLogItem("root", children=(inner1, inner2))
+
+		self.assertEqual(3, root.SubtreeAlertCountErrors)
+		self.assertEqual(2, inner1.SubtreeAlertCountErrors)
+
+		leaf.Parent = inner2
+		self.assertEqual(3, root.SubtreeAlertCountErrors)
+		self.assertEqual(0, inner1.SubtreeAlertCountErrors)
+		self.assertEqual(3, inner2.SubtreeAlertCountErrors)
+
+		inner2.Parent = None
+		self.assertEqual(0, root.SubtreeAlertCountErrors)
+
+		_ = AlertLogItem("new", alertCountErrors=5, parent=root)
+		self.assertEqual(5, root.SubtreeAlertCountErrors)
+
+	def test_PartiallyAggregated(self) -> None:
+		root = AlertLogItem("root")
+		a = AlertLogItem("a", parent=root)
+		b = AlertLogItem("b", totalErrors=1, parent=a)
+
+		self.assertEqual(1, a.SubtreeTotalErrors)
+		self.assertIsNone(root._subtreeAggregate)
+
+		c = AlertLogItem("c", totalErrors=3, parent=a)
+		self.assertEqual(4, a.SubtreeTotalErrors)
+		self.assertIsNone(root._subtreeAggregate)
+
+		c.Parent = None
+		self.assertEqual(1, a.SubtreeTotalErrors)
+		self.assertEqual(1, root.SubtreeTotalErrors)
+
+		b.Parent = None
+		self.assertEqual(0, a.SubtreeTotalErrors)
+		self.assertEqual(0, root.SubtreeTotalErrors)
@@ -0,0 +1,116 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2021-2026 Electronic Design Automation Abstraction (EDA²)                                                  #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for batch loading of many OSVVM report files."""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib            import Path
+from tempfile           import TemporaryDirectory
+from unittest           import TestCase
+from unittest.mock      import patch
+
+from pyEDAA.OSVVM.AlertLog import Document as AlertLogDocument, LoadAlertLogs
+from pyEDAA.OSVVM.Batch    import ExecutorKind
+from pyEDAA.OSVVM.Build    import LoadBuildSummaries
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class AlertLog(TestCase):
+	def test_LoadAlertLogs(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		with TemporaryDirectory() as tempDirectory:
+			missingPath = Path(tempDirectory) / "Missing_alerts.yml"
+			brokenPath = Path(tempDirectory) / "Broken_alerts.yml"
+			brokenPath.write_text("Version: \"0.1\"\nName: \"Broken\"\n")
+
+			result = LoadAlertLogs([path, missingPath, brokenPath], workers=2, loader="fast")
+
+		self.assertEqual(3, len(result))
+		self.assertIs(ExecutorKind.Processes, result.Executor)
+		self.assertEqual([path], list(result.Documents))
+		self.assertEqual({missingPath, brokenPath}, set(result.Failures))
+		self.assertGreater(result.Throughput, 0.0)
+
+		doc = result.Documents[path]
+		self.assertEqual(AlertLogDocument(path, analyzeAndConvert=True).ToTree().Render(), doc.ToTree().Render())
+		self.assertIsNotNone(doc.AnalysisDuration)
+		self.assertIsNotNone(doc.ModelConversionDuration)
+
+	def test_LoadAlertLogs_Serial(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		result = LoadAlertLogs([path, path], workers=1)
+
+		self.assertEqual(1, len(result.Documents))
+		self.assertEqual(0, len(result.Failures))
+
+	def test_LoadAlertLogs_InvalidWorkers(self) -> None:
+		with self.assertRaises(ValueError):
+			_ = LoadAlertLogs([], workers=0)
+
+
+class BuildSummary(TestCase):
+	def test_LoadBuildSummaries(self) -> None:
+		paths = [
+			Path("tests/data/OSVVM/OSVVMLibraries_OsvvmLibraries.yml"),
+			Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		]
+		result = LoadBuildSummaries(paths, workers=2, loader="fast")
+
+		self.assertIs(ExecutorKind.Processes, result.Executor)
+		self.assertEqual(paths, list(result.Documents))
+		self.assertEqual(0, len(result.Failures))
+		self.assertEqual(309, result.Documents[paths[1]].TestcaseCount)
+
+	def test_LoadBuildSummaries_SpawnedWorkers(self) -> None:
+		paths = [
+			Path("tests/data/OSVVM/OSVVMLibraries_OsvvmLibraries.yml"),
+			Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		]
+		with patch("pyEDAA.OSVVM.Batch.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as executor:
+			result = LoadBuildSummaries(paths, workers=2, loader="fast")
+
+		self.assertIs(ExecutorKind.Processes, result.Executor)
+		self.assertEqual("spawn", executor.call_args.kwargs["mp_context"].get_start_method())
+		self.assertEqual(0, len(result.Failures))
+
+	def test_LoadBuildSummaries_ThreadFallback(self) -> None:
+		paths = [
+			Path("tests/data/OSVVM/OSVVMLibraries_OsvvmLibraries.yml"),
+			Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		]
+		with patch("pyEDAA.OSVVM.Batch.ProcessPoolExecutor", side_effect=OSError("no process pool")):
+			result = LoadBuildSummaries(paths, workers=2)
+
+		self.assertIs(ExecutorKind.Threads, result.Executor)
+		self.assertEqual(paths, list(result.Documents))
+		self.assertEqual(309, result.Documents[paths[1]].TestcaseCount)
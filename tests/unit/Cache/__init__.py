@@ -0,0 +1,161 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2021-2026 Electronic Design Automation Abstraction (EDA²)                                                  #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for the on-disk cache of converted OSVVM data models."""
+from os           import utime
+from pathlib      import Path
+from shutil       import copyfile
+from tempfile     import TemporaryDirectory
+from unittest     import TestCase
+
+from pyEDAA.OSVVM.AlertLog import Document as AlertLogDocument
+from pyEDAA.OSVVM.Build    import BuildSummaryDocument
+from pyEDAA.OSVVM.Cache    import CacheDirectory, EvictionPolicy
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Directory(TestCase):
+	def test_GetPut(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			cache = CacheDirectory(Path(tempDirectory) / "cache")
+
+			key = cache.CreateKey("file.yml", 1234, "0.8.1")
+			self.assertIsNone(cache.Get(key))
+			cache.Put(key, {"Name": "Cached"})
+
+			self.assertEqual({"Name": "Cached"}, cache.Get(key))
+			self.assertEqual(1, len(cache))
+			self.assertEqual(1, cache.HitCount)
+			self.assertEqual(1, cache.MissCount)
+
+	def test_CreateKey(self) -> None:
+		self.assertEqual(CacheDirectory.CreateKey("a", 1), CacheDirectory.CreateKey("a", 1))
+		self.assertNotEqual(CacheDirectory.CreateKey("a", 1), CacheDirectory.CreateKey("a", 2))
+
+	def test_CorruptedEntry(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			cache = CacheDirectory(Path(tempDirectory))
+			(Path(tempDirectory) / "broken.pickle").write_bytes(b"no pickle")
+
+			self.assertIsNone(cache.Get("broken"))
+			self.assertEqual(0, len(cache))
+			self.assertEqual(1, cache.MissCount)
+
+	def test_StaleEntry(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			cache = CacheDirectory(Path(tempDirectory))
+			cache.Put("entry", {"Version": 1})
+
+			self.assertIsNone(cache.Get("entry", validate=lambda value: value["Version"] == 2))
+			self.assertEqual(0, len(cache))
+			self.assertEqual(0, cache.HitCount)
+			self.assertEqual(1, cache.MissCount)
+
+	def test_EvictLeastRecentlyUsed(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			cache = CacheDirectory(Path(tempDirectory), maxSize=2500)
+			for i, key in enumerate(("a", "b")):
+				cache.Put(key, bytes(1000))
+				utime(Path(tempDirectory) / f"{key}.pickle", ns=(i * 10**9, i * 10**9))
+
+			self.assertIsNotNone(cache.Get("a"))
+			cache.Put("c", bytes(1000))
+
+			self.assertEqual(2, len(cache))
+			self.assertIsNotNone(cache.Get("a"))
+			self.assertIsNone(cache.Get("b"))
+			self.assertIsNotNone(cache.Get("c"))
+			self.assertLessEqual(cache.Size, cache.MaxSize)
+
+	def test_EvictFirstInFirstOut(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			cache = CacheDirectory(Path(tempDirectory), maxSize=2500, policy=EvictionPolicy.FirstInFirstOut)
+			for i, key in enumerate(("a", "b")):
+				cache.Put(key, bytes(1000))
+				utime(Path(tempDirectory) / f"{key}.pickle", ns=(i * 10**9, i * 10**9))
+
+			self.assertIsNotNone(cache.Get("a"))
+			cache.Put("c", bytes(1000))
+
+			self.assertIsNone(cache.Get("a"))
+			self.assertIsNotNone(cache.Get("b"))
+			self.assertIsNotNone(cache.Get("c"))
+
+
+class BuildSummary(TestCase):
+	def test_Load(self) -> None:
+		path = Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		with TemporaryDirectory() as tempDirectory:
+			cache = CacheDirectory(Path(tempDirectory))
+
+			doc = BuildSummaryDocument.Load(path, cache=cache)
+			cachedDoc = BuildSummaryDocument.Load(path, cache=cache)
+
+		self.assertEqual(1, cache.MissCount)
+		self.assertEqual(1, cache.HitCount)
+		self.assertIsNot(doc, cachedDoc)
+		self.assertEqual(doc.Name, cachedDoc.Name)
+		self.assertEqual(doc.TestcaseCount, cachedDoc.TestcaseCount)
+		self.assertEqual(doc.ToTree().Render(), cachedDoc.ToTree().Render())
+
+	def test_Load_Invalidation(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "RunAllTests.yml"
+			copyfile("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml", path)
+			cache = CacheDirectory(Path(tempDirectory) / "cache")
+
+			_ = BuildSummaryDocument.Load(path, cache=cache)
+			path.write_text(path.read_text().replace("Name:     \"RunAllTests\"", "Name:     \"Modified\"", 1))
+			doc = BuildSummaryDocument.Load(path, cache=cache)
+
+		self.assertEqual(2, cache.MissCount)
+		self.assertEqual("Modified", doc.Name)
+
+
+class AlertLog(TestCase):
+	def test_Load(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		with TemporaryDirectory() as tempDirectory:
+			cache = CacheDirectory(Path(tempDirectory))
+
+			doc = AlertLogDocument.Load(path, cache=cache)
+			cachedDoc = AlertLogDocument.Load(path, cache=cache)
+
+		self.assertEqual(1, cache.MissCount)
+		self.assertEqual(1, cache.HitCount)
+		self.assertIsNot(doc, cachedDoc)
+		self.assertEqual(doc.ToTree().Render(), cachedDoc.ToTree().Render())
+		for name, item in cachedDoc.Children.items():
+			self.assertIs(cachedDoc, item.Parent)
+			self.assertEqual(name, item.Name)
@@ -31,11 +31,16 @@
 """Testcase for unit testing report files generated by OSVVM."""
 from datetime     import timedelta
 from pathlib      import Path
+from tempfile     import TemporaryDirectory
+from textwrap     import dedent
 from unittest     import TestCase
 
+from ruamel.yaml                      import YAML
+from ruamel.yaml.events               import MappingStartEvent
 from pyEDAA.Reports.Unittesting.JUnit import Document as JUnitDocument
 
-from pyEDAA.OSVVM.Build               import BuildSummaryDocument
+from pyEDAA.OSVVM                     import OSVVMException, YAMLLoader
+from pyEDAA.OSVVM.Build               import BuildSummaryDocument, TestcaseColumns, UnittestException
 from pyEDAA.OSVVM.AlertLog            import Document as AlertLogDocument, AlertLogException
 
 if __name__ == "__main__": # pragma: no cover
@@ -159,6 +164,164 @@ class YAMLGeneratedByOSVVM(TestCase):
 			if tcCount is not None:  # WORKAROUND: for testsuite 'Ethernet'
 				self.assertEqual(tcCount, len(ts.Testcases), tsName)
 
+	def test_RunAllTests_FastLoader(self) -> None:
+		yamlPath = Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		roundTripDoc = BuildSummaryDocument(yamlPath, analyzeAndConvert=True)
+		fastDoc = BuildSummaryDocument(yamlPath, analyzeAndConvert=True, loader=YAMLLoader.Fast)
+
+		self.assertIs(YAMLLoader.Fast, fastDoc.Loader)
+		self.assertEqual(roundTripDoc.Name, fastDoc.Name)
+		self.assertEqual(roundTripDoc.StartTime, fastDoc.StartTime)
+		self.assertEqual(roundTripDoc.TestsuiteCount, fastDoc.TestsuiteCount)
+		self.assertEqual(roundTripDoc.TestcaseCount, fastDoc.TestcaseCount)
+		self.assertEqual(roundTripDoc.Passed, fastDoc.Passed)
+		self.assertEqual(roundTripDoc.ToTree().Render(), fastDoc.ToTree().Render())
+
+	def test_RunAllTests_Columnar(self) -> None:
+		yamlPath = Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		doc = BuildSummaryDocument(yamlPath, analyzeAndConvert=True)
+		columnarDoc = BuildSummaryDocument(yamlPath, analyzeAndConvert=True, columnar=True)
+
+		self.assertIsNone(doc.Columns)
+		self.assertEqual(doc.TestsuiteCount, columnarDoc.TestsuiteCount)
+
+		testcases = [tc for ts in doc.Testsuites.values() for tc in ts.Testcases.values()]
+		self.assertEqual(len(testcases), len(columnarDoc.Columns))
+		properties = (
+			"Name", "StartTime", "SetupDuration", "TestDuration", "TeardownDuration", "TotalDuration", "Status",
+			"AssertionCount", "PassedAssertionCount", "FailedAssertionCount",
+			"RequirementsCount", "PassedRequirementsCount", "FailedRequirementsCount", "FunctionalCoverage",
+			"WarningCount", "ErrorCount", "FatalCount",
+			"DisabledWarningCount", "DisabledErrorCount", "DisabledFatalCount",
+			"ExpectedWarningCount", "ExpectedErrorCount", "ExpectedFatalCount"
+		)
+		for testcase, view in zip(testcases, columnarDoc.Columns):
+			self.assertEqual(testcase.Parent.Name, view.Parent.Name)
+			converted = view.ToTestcase()
+			for name in properties:
+				self.assertEqual(getattr(testcase, name), getattr(view, name), f"{testcase.Name}.{name}")
+				self.assertEqual(getattr(converted, name), getattr(view, name), f"{testcase.Name}.{name}")
+
+	def test_RunAllTests_ColumnarTestcases(self) -> None:
+		yamlPath = Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		doc = BuildSummaryDocument(yamlPath, analyzeAndConvert=True)
+		columnarDoc = BuildSummaryDocument(yamlPath, analyzeAndConvert=True, columnar=True)
+
+		self.assertGreater(doc.TestcaseCount, 0)
+		self.assertEqual(doc.TestcaseCount, columnarDoc.TestcaseCount)
+		self.assertEqual(doc.AssertionCount, columnarDoc.AssertionCount)
+		self.assertEqual(
+			[(testcase.Parent.Name, testcase.Name) for testcase in doc.IterateTestcases()],
+			[(view.Parent.Name, view.Name) for view in columnarDoc.IterateTestcases()]
+		)
+		self.assertEqual(doc.ToTree().Render(), columnarDoc.ToTree().Render())
+
+	def test_RunAllTests_ColumnarAggregate(self) -> None:
+		yamlPath = Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		doc = BuildSummaryDocument(yamlPath, analyzeAndConvert=True)
+		columnarDoc = BuildSummaryDocument(yamlPath, analyzeAndConvert=True, columnar=True)
+
+		self.assertEqual(doc.Aggregate(), TestcaseColumns.FromSummary(doc).Aggregate(doc))
+		self.assertEqual(doc.Tests, columnarDoc.Tests)
+		self.assertEqual(doc.Passed, columnarDoc.Passed)
+		self.assertEqual(doc.Status, columnarDoc.Status)
+		for name, testsuite in doc.Testsuites.items():
+			columnarTestsuite = columnarDoc.Testsuites[name]
+			self.assertEqual(testsuite.Tests, columnarTestsuite.Tests, name)
+			self.assertEqual(testsuite.Passed, columnarTestsuite.Passed, name)
+			self.assertEqual(testsuite.Status, columnarTestsuite.Status, name)
+			self.assertEqual(testsuite.TotalDuration, columnarTestsuite.TotalDuration, name)
+
+	def test_RunAllTests_Refresh(self) -> None:
+		yamlPath = Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		yaml = YAML()
+		yamlDocument = yaml.load(yamlPath)
+		yamlTestsuites = list(yamlDocument["TestSuites"])
+
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "RunAllTests.yml"
+			del yamlDocument["TestSuites"][5:]
+			yaml.dump(yamlDocument, path)
+			doc = BuildSummaryDocument(path, analyzeAndConvert=True)
+			testsuites = dict(doc.Testsuites)
+
+			yamlDocument["TestSuites"].extend(yamlTestsuites[5:])
+			yaml.dump(yamlDocument, path)
+			changed = doc.Refresh()
+
+			self.assertEqual({ts["Name"] for ts in yamlTestsuites[5:]}, changed)
+			for name, testsuite in testsuites.items():
+				self.assertIs(testsuite, doc.Testsuites[name])
+
+			yamlTestsuites[0]["TestCases"][0]["ElapsedTime"] = 42.0
+			del yamlDocument["TestSuites"][1]
+			yaml.dump(yamlDocument, path)
+			changed = doc.Refresh()
+
+			self.assertEqual({yamlTestsuites[0]["Name"], yamlTestsuites[1]["Name"]}, changed)
+			self.assertNotIn(yamlTestsuites[1]["Name"], doc.Testsuites)
+			self.assertIsNot(testsuites[yamlTestsuites[0]["Name"]], doc.Testsuites[yamlTestsuites[0]["Name"]])
+
+			refreshedDoc = BuildSummaryDocument(path, analyzeAndConvert=True)
+
+		self.assertEqual(list(refreshedDoc.Testsuites), list(doc.Testsuites))
+		self.assertEqual(refreshedDoc.Tests, doc.Tests)
+		self.assertEqual(refreshedDoc.Passed, doc.Passed)
+		self.assertEqual(refreshedDoc.Status, doc.Status)
+		self.assertEqual(refreshedDoc.ToTree().Render(), doc.ToTree().Render())
+
+	def test_RunAllTests_RefreshFailure(self) -> None:
+		yamlPath = Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml")
+		yaml = YAML()
+		yamlDocument = yaml.load(yamlPath)
+
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "RunAllTests.yml"
+			yaml.dump(yamlDocument, path)
+			doc = BuildSummaryDocument(path, analyzeAndConvert=True)
+			testsuites = dict(doc.Testsuites)
+			tree = doc.ToTree().Render()
+
+			self.assertEqual(set(), doc.Refresh())
+
+			yamlDocument["TestSuites"][0]["Name"] = "Added"
+			del yamlDocument["TestSuites"][-1]["TestCases"][0]["Results"]["TotalErrors"]
+			yaml.dump(yamlDocument, path)
+			with self.assertRaises(UnittestException) as context:
+				doc.Refresh()
+
+		self.assertIn("line", str(context.exception) + "\n".join(getattr(context.exception, "__notes__", [])))
+		self.assertEqual(testsuites, doc.Testsuites)
+		for testsuite in testsuites.values():
+			self.assertIs(doc, testsuite.Parent)
+		self.assertEqual(tree, doc.ToTree().Render())
+
+	def test_FastLoader_ErrorWithLineNumber(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "Broken.yml"
+			path.write_text(dedent("""\
+				Version: "0.1"
+				Name: "Broken"
+				BuildInfo:
+				  StartTime: 2026-02-22T20:21:18+01:00
+				  ElapsedTime: 1.5
+				TestSuites:
+				  - Name: Testsuite
+				    ElapsedTime: 1.5
+				    TestCases:
+				      - TestCaseName: "Testcase"
+				        Status: PASSED
+				        Results: 42
+				        ElapsedTime: 1.5
+				"""))
+
+			doc = BuildSummaryDocument(path, loader="fast")
+			doc.Analyze()
+			with self.assertRaises(UnittestException) as context:
+				doc.Convert()
+
+		self.assertIn("line 12", "\n".join(context.exception.__notes__))
+
 	# 	for suite in doc:
 	# 		self.printTestsuite(suite)
 	#
@@ -213,3 +376,161 @@ class AlertLog(TestCase):
 		print()
 		print(f"Statistics:")
 		print(f"  Times: YAML parsing: {doc.AnalysisDuration}s   convert: {doc.ModelConversionDuration}s")
+
+	def test_Create_WithParse_FastLoader(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		roundTripDoc = AlertLogDocument(path, analyzeAndConvert=True)
+		fastDoc = AlertLogDocument(path, analyzeAndConvert=True, loader="fast")
+
+		self.assertIs(YAMLLoader.RoundTrip, roundTripDoc.Loader)
+		self.assertIs(YAMLLoader.Fast, fastDoc.Loader)
+		self.assertEqual(roundTripDoc.Name, fastDoc.Name)
+		self.assertEqual(roundTripDoc.ToTree().Render(), fastDoc.ToTree().Render())
+
+	def test_FastLoader_ErrorWithLineNumber(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "Broken_alerts.yml"
+			path.write_text(dedent("""\
+				Version: "0.1"
+				Name: "Broken"
+				Status: PASSED
+				Children:
+				  - Name: "Default"
+				    Status: PASSED
+				    Results: {AlertCount: {Failure: 0, Error: 0, Warning: 0}, PassedCount: 0, AffirmCount: 0, RequirementsPassed: 0, RequirementsGoal: 0, DisabledAlertCount: {Failure: 0, Error: 0, Warning: 0}}
+				    Children: []
+				"""))
+
+			doc = AlertLogDocument(path, loader=YAMLLoader.Fast)
+			doc.Analyze()
+			with self.assertRaises(OSVVMException) as context:
+				doc.Parse()
+
+		self.assertIn("TotalErrors", str(context.exception))
+		self.assertIn("line 7", str(context.exception))
+
+	def test_ParseStreaming(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		doc = AlertLogDocument(path, analyzeAndConvert=True)
+		streamedDoc = AlertLogDocument(path)
+		streamedDoc.ParseStreaming()
+
+		self.assertEqual(doc.Name, streamedDoc.Name)
+		self.assertEqual(doc.Status, streamedDoc.Status)
+		self.assertEqual(doc.ToTree().Render(), streamedDoc.ToTree().Render())
+		for item in streamedDoc.Children.values():
+			self.assertIs(streamedDoc, item.Parent)
+
+	def test_ParseStreaming_BoundedConstructorCache(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		doc = AlertLogDocument(path)
+		yamlReader = YAML(typ="safe")
+		with path.open("rb") as file:
+			events = yamlReader.parse(file)
+			for event in events:
+				if isinstance(event, MappingStartEvent):
+					break
+
+			fields = doc._ReadStreamedItem(events, yamlReader)
+
+		self.assertIn("Children", fields)
+		self.assertEqual(0, len(yamlReader.constructor.constructed_objects))
+
+	def test_ParseStreaming_ErrorWithLineNumber(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "Broken_alerts.yml"
+			path.write_text(dedent("""\
+				Version: "0.1"
+				Name: "Broken"
+				Status: PASSED
+				Children:
+				  - Name: "Default"
+				    Status: PASSED
+				    Results: {AlertCount: {Failure: 0, Error: 0, Warning: 0}, PassedCount: 0, AffirmCount: 0, RequirementsPassed: 0, RequirementsGoal: 0, DisabledAlertCount: {Failure: 0, Error: 0, Warning: 0}}
+				    Children: []
+				"""))
+
+			doc = AlertLogDocument(path)
+			with self.assertRaises(OSVVMException) as context:
+				doc.ParseStreaming()
+
+		self.assertIn("TotalErrors", str(context.exception))
+		self.assertIn("line 5", "\n".join(context.exception.__notes__))
+
+	def test_Lazy(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		doc = AlertLogDocument(path, analyzeAndConvert=True)
+		lazyDoc = AlertLogDocument(path, analyzeAndConvert=True, lazy=True)
+
+		self.assertTrue(lazyDoc.Lazy)
+		self.assertIsNotNone(lazyDoc._pendingChildren)
+		self.assertEqual(doc.Name, lazyDoc.Name)
+		self.assertEqual(doc.Status, lazyDoc.Status)
+		self.assertEqual(doc.TotalErrors, lazyDoc.TotalErrors)
+
+		self.assertEqual(len(doc), len(lazyDoc))
+		self.assertIsNone(lazyDoc._pendingChildren)
+		for item in lazyDoc:
+			self.assertIs(lazyDoc, item.Parent)
+			self.assertIs(item, lazyDoc[item.Name])
+
+		self.assertEqual(doc.ToTree().Render(), lazyDoc.ToTree().Render())
+
+	def test_Lazy_FailedConversion(self) -> None:
+		content = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml").read_text()
+		content = content.replace("  - Name: \"OSVVM\"\n    Status: PASSED\n", "  - Name: \"OSVVM\"\n", 1)
+
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "Broken_alerts.yml"
+			path.write_text(content)
+			lazyDoc = AlertLogDocument(path, analyzeAndConvert=True, lazy=True)
+
+		for _ in range(2):
+			with self.assertRaises(OSVVMException):
+				len(lazyDoc)
+
+			self.assertEqual({}, lazyDoc._children)
+			self.assertIsNotNone(lazyDoc._pendingChildren)
+
+	def test_Find(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		doc = AlertLogDocument(path, analyzeAndConvert=True)
+
+		item = doc.Find("subordinate_1/Protocol Error")
+		self.assertIs(doc["subordinate_1"]["Protocol Error"], item)
+		self.assertEqual("subordinate_1/Protocol Error", doc.GetPath(item))
+		self.assertIsNone(doc.Find("subordinate_1/Unknown"))
+
+		self.assertEqual([item], list(doc.Glob("sub*/Protocol*")))
+		self.assertIn(item, list(doc.Glob("**/Protocol Error")))
+		self.assertEqual(len(doc), len(list(doc.Glob("*"))))
+
+		allItems = list(doc.FindAll(lambda i: True))
+		self.assertIn(item, allItems)
+		self.assertEqual([i for i in allItems if i.TotalErrors > 0], list(doc.FindAll(lambda i: i.TotalErrors > 0, withErrorsOnly=True)))
+
+		lazyDoc = AlertLogDocument(path, analyzeAndConvert=True, lazy=True)
+		self.assertEqual("Protocol Error", lazyDoc.Find("subordinate_1/Protocol Error").Name)
+
+	def test_Find_Reparent(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		doc = AlertLogDocument(path, analyzeAndConvert=True)
+
+		item = doc.Find("subordinate_1/Protocol Error")
+		item.Parent = doc["Default"]
+		self.assertIsNone(doc.Find("subordinate_1/Protocol Error"))
+		self.assertIs(item, doc.Find("Default/Protocol Error"))
+		self.assertNotIn("Protocol Error", doc["subordinate_1"].Children)
+
+		item.Parent = None
+		self.assertIsNone(doc.Find("Default/Protocol Error"))
+		self.assertIsNone(item.Parent)
+
+	def test_Noisiest(self) -> None:
+		path = Path("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml")
+		doc = AlertLogDocument(path, analyzeAndConvert=True)
+		lazyDoc = AlertLogDocument(path, analyzeAndConvert=True, lazy=True)
+
+		self.assertEqual(doc.SubtreeAggregate, lazyDoc.SubtreeAggregate)
+		self.assertLessEqual(len(doc.Noisiest(3)), 3)
+		self.assertEqual([i.Name for i in doc.Noisiest(3)], [i.Name for i in lazyDoc.Noisiest(3)])
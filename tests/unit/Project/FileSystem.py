@@ -0,0 +1,168 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2025-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for the file system cache of processed OSVVM scripts."""
+from os       import chdir
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase as TestCase
+
+from pyEDAA.OSVVM.Project     import FileSystemCache, PathKind
+from pyEDAA.OSVVM.Project.TCL import OsvvmProFileProcessor
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Queries(TestCase):
+	def test_Memoization(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			root = Path(tempDirectory).resolve()
+			(root / "src").mkdir()
+			(root / "src" / "a.vhdl").touch()
+
+			fileSystem = FileSystemCache()
+			self.assertEqual(root / "src" / "a.vhdl", fileSystem.Resolve(root / "src" / ".." / "src" / "a.vhdl"))
+			self.assertTrue(fileSystem.IsFile(root / "src" / "a.vhdl"))
+			self.assertTrue(fileSystem.IsDirectory(root / "src"))
+			self.assertFalse(fileSystem.Exists(root / "src" / "b.vhdl"))
+
+			misses = fileSystem.MissCount
+			self.assertTrue(fileSystem.IsFile(root / "src" / "a.vhdl"))
+			self.assertFalse(fileSystem.Exists(root / "src" / "b.vhdl"))
+			self.assertEqual(misses, fileSystem.MissCount)
+			self.assertGreater(fileSystem.HitCount, 0)
+
+			self.assertEqual(Path("../src/a.vhdl"), fileSystem.RelativeTo(root / "src" / "a.vhdl", root / "tests"))
+
+	def test_Invalidate(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			root = Path(tempDirectory).resolve()
+			file = root / "a.vhdl"
+
+			fileSystem = FileSystemCache()
+			self.assertFalse(fileSystem.Exists(file))
+
+			file.touch()
+			self.assertFalse(fileSystem.Exists(file))
+			fileSystem.Invalidate(file)
+			self.assertTrue(fileSystem.IsFile(file))
+
+			file.unlink()
+			fileSystem.Invalidate()
+			self.assertEqual(PathKind.Missing, fileSystem.Kind(file))
+
+	def test_Prefetch(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			root = Path(tempDirectory).resolve()
+			(root / "src" / "sub").mkdir(parents=True)
+			(root / "src" / "a.vhdl").touch()
+			(root / "src" / "sub" / "b.vhdl").touch()
+
+			fileSystem = FileSystemCache()
+			self.assertEqual(4, fileSystem.Prefetch(root))
+
+			misses = fileSystem.MissCount
+			self.assertTrue(fileSystem.IsFile(root / "src" / "sub" / ".." / "a.vhdl"))
+			self.assertTrue(fileSystem.IsDirectory(root / "src" / "sub"))
+			self.assertFalse(fileSystem.Exists(root / "src" / "c.vhdl"))
+			self.assertEqual(PathKind.Directory, fileSystem.Kind(root.parent))
+
+			(root / "src" / "c.vhdl").touch()
+			self.assertFalse(fileSystem.Exists(root / "src" / "c.vhdl"))
+			fileSystem.Invalidate(root / "src" / "c.vhdl")
+			self.assertTrue(fileSystem.IsFile(root / "src" / "c.vhdl"))
+			self.assertLess(misses, fileSystem.MissCount)
+
+	def test_Classify(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			root = Path(tempDirectory).resolve()
+			(root / "src").mkdir()
+			for name in ("a.vhdl", "b.vhdl", "c.vhdl"):
+				(root / "src" / name).touch()
+
+			paths = [root / "src" / name for name in ("a.vhdl", "b.vhdl", "c.vhdl", "d.vhdl")]
+			expected = {path: PathKind.File for path in paths[:3]}
+			expected[paths[3]] = PathKind.Missing
+
+			for workers in (1, 2):
+				fileSystem = FileSystemCache()
+				self.assertEqual(PathKind.Directory, fileSystem.Kind(root / "src"))
+				self.assertEqual(expected, fileSystem.Classify(paths, workers))
+
+				misses = fileSystem.MissCount
+				self.assertEqual(expected, fileSystem.Classify(paths, workers))
+				self.assertEqual(misses, fileSystem.MissCount)
+
+			with self.assertRaises(ValueError):
+				fileSystem.Classify(paths, 0)
+
+	def test_SymbolicLink(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			root = Path(tempDirectory).resolve()
+			(root / "src").mkdir()
+			(root / "src" / "a.vhdl").touch()
+			try:
+				(root / "link").symlink_to(root / "src", target_is_directory=True)
+			except OSError:  # pragma: no cover
+				self.skipTest("Symbolic links aren't supported.")
+
+			fileSystem = FileSystemCache()
+			fileSystem.Prefetch(root)
+
+			self.assertEqual(root / "src" / "a.vhdl", fileSystem.Resolve(root / "link" / "a.vhdl"))
+			self.assertTrue(fileSystem.IsFile(root / "link" / "a.vhdl"))
+			self.assertTrue(fileSystem.IsDirectory(root / "link"))
+
+
+class Processing(TestCase):
+	def test_Regression(self) -> None:
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			processor = OsvvmProFileProcessor()
+			expected = processor.LoadRegressionFile(Path("regression.pro"))
+
+			prefetchingProcessor = OsvvmProFileProcessor()
+			prefetchingProcessor.Context.FileSystem.Prefetch(Path.cwd())
+			project = prefetchingProcessor.LoadRegressionFile(Path("regression.pro"))
+		finally:
+			chdir(workingDirectory)
+
+		self.assertGreater(processor.Context.FileSystem.HitCount, 0)
+		self.assertGreater(prefetchingProcessor.Context.FileSystem.HitCount, 0)
+		self.assertEqual(list(expected.Builds), list(project.Builds))
+		for buildName, build in expected.Builds.items():
+			self.assertEqual(
+				{name: [file.Path for file in library.Files] for name, library in build.VHDLLibraries.items()},
+				{name: [file.Path for file in library.Files] for name, library in project.Builds[buildName].VHDLLibraries.items()}
+			)
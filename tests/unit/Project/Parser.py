@@ -0,0 +1,161 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2025-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Native *.pro file parser tests."""
+from os       import chdir
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase as TestCase
+
+from pyEDAA.OSVVM                import OSVVMException
+from pyEDAA.OSVVM.Project        import Context
+from pyEDAA.OSVVM.Project.Parser import Command, ProFileParser, UnsupportedConstruct
+from pyEDAA.OSVVM.Project.TCL    import OsvvmProFileProcessor
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Parsing(TestCase):
+	def test_Commands(self) -> None:
+		commands = ProFileParser(
+			"# comment\n"
+			"library lib1 ; analyze {file 1.vhdl} \\\n"
+			"  [generic G1 \"value 1\"] [ConstraintFile a.xdc [ScopeToRef ref]]\n"
+			"RunTest tb.vhdl\n"
+		).Parse()
+
+		self.assertEqual(["library", "analyze", "RunTest"], [command.Name for command in commands])
+		self.assertEqual([2, 2, 4], [command.Line for command in commands])
+		self.assertEqual(["lib1"], commands[0].Arguments)
+
+		fileName, genericCommand, constraintCommand = commands[1].Arguments
+		self.assertEqual("file 1.vhdl", fileName)
+		self.assertIsInstance(genericCommand, Command)
+		self.assertEqual("generic", genericCommand.Name)
+		self.assertEqual(["G1", "value 1"], genericCommand.Arguments)
+		self.assertEqual("ScopeToRef", constraintCommand.Arguments[1].Name)
+
+	def test_Unsupported(self) -> None:
+		for code in (
+			"set version 2019",
+			"proc myProc {} {}",
+			"if {1} {library lib1}",
+			"analyze $file",
+			"analyze file[generic a b].vhdl",
+			"analyze \"$file\"",
+			"analyze file\\ 1.vhdl",
+			"analyze file.vhdl [library lib1]",
+			"analyze file.vhdl [generic a b",
+			"library {lib1",
+			"{*}{library lib1}",
+		):
+			with self.subTest(code=code):
+				with self.assertRaises(UnsupportedConstruct):
+					ProFileParser(code).Parse()
+
+
+class Evaluation(TestCase):
+	def _Load(self, nativeParsing: bool) -> Context:
+		processor = OsvvmProFileProcessor(nativeParsing=nativeParsing)
+		processor.LoadRegressionFile(Path("regression.pro"))
+		return processor.Context
+
+	def test_SameAsTcl(self) -> None:
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			tclContext = self._Load(False)
+			nativeContext = self._Load(True)
+		finally:
+			chdir(workingDirectory)
+
+		self.assertEqual(list(tclContext.Builds), list(nativeContext.Builds))
+		self.assertEqual(tclContext.IncludedFiles, nativeContext.IncludedFiles)
+		for tclBuild, nativeBuild in zip(tclContext.Builds.values(), nativeContext.Builds.values()):
+			self.assertEqual(list(tclBuild.VHDLLibraries), list(nativeBuild.VHDLLibraries))
+			for tclLibrary, nativeLibrary in zip(tclBuild.VHDLLibraries.values(), nativeBuild.VHDLLibraries.values()):
+				self.assertEqual(
+					[(file.Path, file.VHDLVersion) for file in tclLibrary.Files],
+					[(file.Path, file.VHDLVersion) for file in nativeLibrary.Files]
+				)
+			self.assertEqual(
+				{name: list(suite.Testcases) for name, suite in tclBuild.Testsuites.items()},
+				{name: list(suite.Testcases) for name, suite in nativeBuild.Testsuites.items()}
+			)
+
+	def test_Error(self) -> None:
+		processor = OsvvmProFileProcessor(nativeParsing=True)
+
+		with self.assertRaises(OSVVMException) as context:
+			processor.EvaluateProFile(Path("tests/examples/missing.pro"))
+
+		processor.Context.BeginBuild("build")
+		processor.Context.SetLibrary("lib")
+		with self.assertRaises(OSVVMException) as context:
+			processor.EvaluateProFile(Path("tests/examples/simple/tb/build.pro"))
+		self.assertIsInstance(context.exception.__cause__, OSVVMException)
+		self.assertIn("'analyze' in line 3", context.exception.__notes__[0])
+
+	def test_ParallelBuilds(self) -> None:
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			expected = OsvvmProFileProcessor().LoadRegressionFile(Path("regression.pro"))
+
+			processor = OsvvmProFileProcessor(nativeParsing=True)
+			self.assertEqual(2, len(processor._DiscoverBuilds(Path("regression.pro"))))
+			self.assertEqual(0, len(processor.Context.Builds))
+
+			project = OsvvmProFileProcessor(nativeParsing=True).LoadRegressionFileParallel(Path("regression.pro"), workers=2)
+		finally:
+			chdir(workingDirectory)
+
+		self.assertEqual(list(expected.Builds), list(project.Builds))
+		for buildName, build in expected.Builds.items():
+			self.assertEqual(
+				{name: [file.Path for file in library.Files] for name, library in build.VHDLLibraries.items()},
+				{name: [file.Path for file in library.Files] for name, library in project.Builds[buildName].VHDLLibraries.items()}
+			)
+
+	def test_RedefinedProcedure(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "redefine.pro").write_text("proc analyze {args} {}\n")
+			(directory / "build.pro").write_text("library lib\nanalyze missing.vhdl\n")
+
+			processor = OsvvmProFileProcessor(nativeParsing=True)
+			processor.Context.BeginBuild("build")
+			processor.EvaluateProFile(directory / "redefine.pro")
+			processor.EvaluateProFile(directory / "build.pro")
+
+		self.assertEqual(0, len(processor.Context.Build.VHDLLibraries["lib"].Files))
@@ -0,0 +1,124 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2025-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Processing profiler tests."""
+from os       import chdir
+from pathlib  import Path
+from unittest import TestCase as TestCase
+
+from pyEDAA.OSVVM.Project.Profiler import ProcessingProfiler
+from pyEDAA.OSVVM.Project.TCL      import OsvvmProFileProcessor
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Recording(TestCase):
+	def test_Nesting(self) -> None:
+		profiler = ProcessingProfiler()
+
+		def inner() -> int:
+			return 42
+
+		def outer() -> int:
+			return profiler.Call("inner", inner) + profiler.Call("inner", inner)
+
+		def recursive(depth: int) -> None:
+			if depth > 0:
+				profiler.Call("recursive", recursive, depth - 1)
+
+		profiler.EnterFile(Path("a.pro"))
+		self.assertEqual(84, profiler.Call("outer", outer))
+		profiler.Call("recursive", recursive, 2)
+		profiler.LeaveFile()
+
+		file = profiler.Files["a.pro"]
+		outerRecord = profiler.Procedures["outer"]
+		innerRecord = profiler.Procedures["inner"]
+		recursiveRecord = profiler.Procedures["recursive"]
+
+		self.assertEqual(1, file.CallCount)
+		self.assertEqual(1, outerRecord.CallCount)
+		self.assertEqual(2, innerRecord.CallCount)
+		self.assertEqual(3, recursiveRecord.CallCount)
+
+		self.assertLessEqual(innerRecord.TotalDuration, outerRecord.TotalDuration)
+		self.assertLessEqual(outerRecord.SelfDuration, outerRecord.TotalDuration)
+		self.assertLessEqual(recursiveRecord.TotalDuration, file.TotalDuration)
+		self.assertLessEqual(outerRecord.TotalDuration + recursiveRecord.TotalDuration, file.TotalDuration)
+
+	def test_Exception(self) -> None:
+		profiler = ProcessingProfiler()
+
+		def throw() -> None:
+			raise ValueError()
+
+		with self.assertRaises(ValueError):
+			profiler.Call("throw", throw)
+
+		self.assertEqual(1, profiler.Procedures["throw"].CallCount)
+		profiler.Call("throw", lambda: None)
+		self.assertEqual(2, profiler.Procedures["throw"].CallCount)
+
+
+class Processing(TestCase):
+	def test_Regression(self) -> None:
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			profilers = []
+			for nativeParsing in (False, True):
+				profiler = ProcessingProfiler()
+				processor = OsvvmProFileProcessor(nativeParsing=nativeParsing, profiler=profiler)
+				processor.LoadRegressionFile(Path("regression.pro"))
+				profilers.append(profiler)
+		finally:
+			chdir(workingDirectory)
+
+		for profiler in profilers:
+			self.assertEqual(5, len(profiler.Files))
+			self.assertEqual(2, profiler.Procedures["build"].CallCount)
+			self.assertEqual(6, profiler.Procedures["analyze"].CallCount)
+			self.assertEqual(4, profiler.Procedures["ConstraintFile"].CallCount)
+
+			regressionFile = next(record for name, record in profiler.Files.items() if name.endswith("/regression.pro"))
+			self.assertLessEqual(profiler.Procedures["build"].TotalDuration, regressionFile.TotalDuration)
+
+			report = profiler.Report().splitlines()
+			self.assertIn("File", report[0])
+			self.assertIn("Procedure", report[7])
+			self.assertTrue(report[1].endswith("/regression.pro"))
+
+		self.assertEqual(
+			{name: record.CallCount for name, record in profilers[0].Procedures.items()},
+			{name: record.CallCount for name, record in profilers[1].Procedures.items()}
+		)
@@ -29,16 +29,23 @@
 # ==================================================================================================================== #
 #
 """Tcl procedure tests."""
+from concurrent.futures import ThreadPoolExecutor
+from os       import chdir, path as os_path
 from pathlib  import Path
+from shutil   import copytree
+from tempfile import TemporaryDirectory
 from textwrap import dedent
 from tkinter  import TclError
 from unittest import TestCase as TestCase
+from unittest.mock import patch
 
 from pyTooling.Common import firstPair, firstValue, firstItem, firstElement
 from pyVHDLModel      import VHDLVersion
 
-from pyEDAA.OSVVM.Project     import Context, osvvmContext
-from pyEDAA.OSVVM.Project.TCL import OsvvmProFileProcessor, getException
+from pyEDAA.OSVVM             import OSVVMException
+from pyEDAA.OSVVM.Cache       import CacheDirectory
+from pyEDAA.OSVVM.Project     import Context, OptionTable, NoNullRangeWarning, osvvmContext
+from pyEDAA.OSVVM.Project.TCL import OsvvmProFileProcessor, OsvvmProFileProcessorPool, getException
 
 if __name__ == "__main__": # pragma: no cover
 	print("ERROR: you called a testcase declaration file as an executable module.")
@@ -46,34 +53,29 @@ if __name__ == "__main__": # pragma: no cover
 	exit(1)
 
 
-def BeginBuild(buildName: str) -> None:
+def BeginBuild(context: Context, buildName: str) -> None:
 	try:
-		osvvmContext.BeginBuild(buildName)
+		context.BeginBuild(buildName)
 	except Exception as ex:  # pragma: no cover
-		osvvmContext.LastException = ex
+		context.LastException = ex
 		raise ex
 
 
-def EndBuild() -> None:
+def EndBuild(context: Context) -> None:
 	try:
-		osvvmContext.EndBuild()
+		context.EndBuild()
 	except Exception as ex:  # pragma: no cover
-		osvvmContext.LastException = ex
+		context.LastException = ex
 		raise ex
 
 
-def throw():
+def throw(context: Context):
 	ex = ValueError(f"Dummy exception")
-	osvvmContext.LastException = ex
+	context.LastException = ex
 	raise ex
 
 
 class BasicProcedures(TestCase):
-	def setUp(self) -> None:
-		from pyEDAA.OSVVM.Project import osvvmContext
-
-		osvvmContext.Clear()
-
 	def test_Build(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
@@ -137,8 +139,8 @@ class BasicProcedures(TestCase):
 	def test_Include(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		path = Path("tests/examples/simple/test.pro")
 
@@ -169,8 +171,8 @@ class BasicProcedures(TestCase):
 	def test_Library(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		code = dedent(f"""\
 			BeginBuild {{build}}
@@ -199,8 +201,8 @@ class BasicProcedures(TestCase):
 	def test_Analyze1(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		file1 = Path("tests/examples/simple/lib1_file1.vhdl")
 
@@ -237,8 +239,8 @@ class BasicProcedures(TestCase):
 	def test_Analyze2(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		file1 = Path("tests/examples/simple/lib1_file1.vhdl")
 		file2 = Path("tests/examples/simple/lib1_file2.vhdl")
@@ -277,8 +279,8 @@ class BasicProcedures(TestCase):
 	def test_Library1_Analyze1(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		file1 = Path("tests/examples/simple/lib1_file1.vhdl")
 
@@ -316,8 +318,8 @@ class BasicProcedures(TestCase):
 	def test_Library2_Analyze3(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		file1_1 = Path("tests/examples/simple/lib1_file1.vhdl")
 		file2_1 = Path("tests/examples/simple/lib2_file1.vhdl")
@@ -370,8 +372,8 @@ class BasicProcedures(TestCase):
 	def test_Simulate(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		code = dedent(f"""\
 			BeginBuild {{build}}
@@ -403,8 +405,8 @@ class BasicProcedures(TestCase):
 	def test_Simulate_Generic(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		code = dedent(f"""\
 			BeginBuild {{build}}
@@ -440,8 +442,8 @@ class BasicProcedures(TestCase):
 	def test_Testsuite(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		code = dedent(f"""\
 			BeginBuild {{build}}
@@ -470,8 +472,8 @@ class BasicProcedures(TestCase):
 	def test_TestName(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		code = dedent(f"""\
 			BeginBuild {{build}}
@@ -524,8 +526,8 @@ class BasicProcedures(TestCase):
 	def test_RunTest(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(BeginBuild)
-		processor.RegisterPythonFunctionAsTclProcedure(EndBuild)
+		processor.RegisterContextBoundProcedure(BeginBuild)
+		processor.RegisterContextBoundProcedure(EndBuild)
 
 		file1 = Path("tests/examples/simple/lib1_file1.vhdl")
 
@@ -567,11 +569,6 @@ class BasicProcedures(TestCase):
 
 
 class SetterGatter(TestCase):
-	def setUp(self) -> None:
-		from pyEDAA.OSVVM.Project import osvvmContext
-
-		osvvmContext.Clear()
-
 	def test_SetVHDLVersion(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
@@ -638,11 +635,6 @@ class SetterGatter(TestCase):
 
 
 class Helper(TestCase):
-	def setUp(self) -> None:
-		from pyEDAA.OSVVM.Project import osvvmContext
-
-		osvvmContext.Clear()
-
 	def test_FileExists(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
@@ -688,15 +680,10 @@ class Helper(TestCase):
 
 
 class NoOperation(TestCase):
-	def setUp(self) -> None:
-		from pyEDAA.OSVVM.Project import osvvmContext
-
-		osvvmContext.Clear()
-
 	def test_Exception(self) -> None:
 		print()
 		processor = OsvvmProFileProcessor()
-		processor.RegisterPythonFunctionAsTclProcedure(throw)
+		processor.RegisterContextBoundProcedure(throw)
 
 		code = dedent(f"""\
 			throw
@@ -720,3 +707,346 @@ class NoOperation(TestCase):
 			processor.TCL.eval(code)
 		except TclError as ex:
 			raise getException(ex, processor.Context)
+
+
+class ProjectCache(TestCase):
+	def test_LoadBuildFile(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			copytree(Path("tests/examples/simple"), Path(tempDirectory) / "simple")
+			buildFile = Path(os_path.relpath(tempDirectory)) / "simple/project.pro"
+			cache = CacheDirectory(Path(tempDirectory) / "cache")
+
+			processor = OsvvmProFileProcessor()
+			build = processor.LoadBuildFile(buildFile, cache=cache)
+			includedFiles = list(processor.Context.IncludedFiles)
+			self.assertEqual(0, cache.HitCount)
+
+			processor = OsvvmProFileProcessor()
+			cachedBuild = processor.LoadBuildFile(buildFile, cache=cache)
+			self.assertEqual(1, cache.HitCount)
+			self.assertIs(cachedBuild, processor.Context.Builds["project"])
+			self.assertEqual(includedFiles, processor.Context.IncludedFiles)
+			self.assertEqual(list(build.VHDLLibraries), list(cachedBuild.VHDLLibraries))
+			self.assertEqual(
+				[file.Path for file in build.VHDLLibraries["lib1"].Files],
+				[file.Path for file in cachedBuild.VHDLLibraries["lib1"].Files]
+			)
+
+			ipcoreFile = Path(tempDirectory) / "simple/ipcore/ipcore.pro"
+			ipcoreFile.write_text(ipcoreFile.read_text().replace("library ip", "library ip2"))
+
+			processor = OsvvmProFileProcessor()
+			changedBuild = processor.LoadBuildFile(buildFile, cache=cache)
+			self.assertIn("ip2", changedBuild.VHDLLibraries)
+			self.assertNotIn("ip", changedBuild.VHDLLibraries)
+			self.assertEqual(1, cache.HitCount)
+			self.assertEqual(2, cache.MissCount)
+			self.assertEqual(1, len(cache))
+
+	def test_CacheKeyMatchesFingerprints(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			copytree(Path("tests/examples/simple"), Path(tempDirectory) / "simple")
+			buildDirectory = Path(os_path.relpath(tempDirectory)) / "simple/tb"
+			cache = CacheDirectory(Path(tempDirectory) / "cache")
+
+			keys = []
+			createKey = CacheDirectory.CreateKey
+			with patch.object(CacheDirectory, "CreateKey", side_effect=lambda *args: keys.append(args) or createKey(*args)):
+				processor = OsvvmProFileProcessor()
+				processor.LoadBuildFile(buildDirectory, "tb", cache=cache)
+
+			proFile = (Path(tempDirectory) / "simple/tb/build.pro").resolve()
+			self.assertEqual(proFile, keys[0][3])
+
+			fingerprints, *_ = cache.Get(createKey(*keys[0]))
+			self.assertIn(proFile, fingerprints)
+
+
+class IncrementalReload(TestCase):
+	def test_Reload(self) -> None:
+		workingDirectory = Path.cwd()
+		with TemporaryDirectory() as tempDirectory:
+			copytree(Path("tests/examples"), Path(tempDirectory) / "examples")
+			chdir(Path(tempDirectory) / "examples")
+			try:
+				# Include the IP core in both builds.
+				sharedFile = Path("simple/ipcore/ipcore.pro")
+				testFile = Path("simple/test.pro")
+				testFile.write_text("include ipcore\n" + testFile.read_text())
+
+				processor = OsvvmProFileProcessor()
+				project = processor.LoadRegressionFile(Path("regression.pro"))
+				projectBuild = project.Builds["project"]
+				testBuild = project.Builds["test"]
+
+				includeGraph = processor.Context.IncludeGraph
+				tbFile = Path("simple/tb/build.pro").resolve()
+				self.assertEqual({"test"}, includeGraph.BuildsOf(tbFile))
+				self.assertEqual({"project", "test"}, includeGraph.BuildsOf(sharedFile.resolve()))
+				self.assertIn(tbFile, includeGraph.Subtree(Path("simple/test.pro").resolve()))
+				self.assertEqual(set(), processor.Reload(project))
+
+				tbFile.write_text(tbFile.read_text().replace("suite1", "suite2"))
+				self.assertEqual({"test"}, processor.Reload(project))
+				self.assertIs(projectBuild, project.Builds["project"])
+				self.assertIsNot(testBuild, project.Builds["test"])
+				self.assertIs(project, project.Builds["test"].Project)
+				self.assertEqual(["suite2"], list(project.Builds["test"].Testsuites))
+				self.assertEqual(["project", "test"], list(project.Builds))
+				self.assertEqual(set(), processor.Reload(project))
+
+				sharedFile.write_text(sharedFile.read_text() + "\n# changed\n")
+				currentDirectory = processor.Context._currentDirectory
+				self.assertEqual({"project", "test"}, processor.Reload(project))
+				self.assertEqual(currentDirectory, processor.Context._currentDirectory)
+				self.assertIsNot(projectBuild, project.Builds["project"])
+				self.assertEqual({"project", "test"}, includeGraph.BuildsOf(sharedFile.resolve()))
+				self.assertEqual(set(), processor.Reload(project))
+				projectBuild = project.Builds["project"]
+
+				regressionFile = Path("regression.pro")
+				regressionFile.write_text(regressionFile.read_text() + "\n# changed\n")
+				self.assertEqual({"project", "test"}, processor.Reload(project))
+				self.assertIsNot(projectBuild, project.Builds["project"])
+				self.assertEqual(["suite2"], list(project.Builds["test"].Testsuites))
+			finally:
+				chdir(workingDirectory)
+
+
+def summarize(project) -> list:
+	return [
+		(
+			buildName,
+			[(libraryName, [str(file.Path) for file in library.Files]) for libraryName, library in build.VHDLLibraries.items()],
+			{suiteName: list(suite.Testcases) for suiteName, suite in build.Testsuites.items()}
+		)
+		for buildName, build in project.Builds.items()
+	]
+
+
+class ParallelBuilds(TestCase):
+
+	def test_LoadRegressionFileParallel(self) -> None:
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			serialProject = OsvvmProFileProcessor().LoadRegressionFile(Path("regression.pro"))
+			expected = summarize(serialProject)
+
+			for workers in (1, 2):
+				with self.subTest(workers=workers):
+					project = OsvvmProFileProcessor().LoadRegressionFileParallel(Path("regression.pro"), workers=workers)
+
+					self.assertEqual("regression", project.Name)
+					self.assertEqual(["project", "test"], list(project.Builds))
+					self.assertEqual(expected, summarize(project))
+					for build in project.Builds.values():
+						self.assertIs(project, build.Project)
+		finally:
+			chdir(workingDirectory)
+
+	def test_ReloadParallel(self) -> None:
+		workingDirectory = Path.cwd()
+		for workers in (1, 2):
+			with self.subTest(workers=workers), TemporaryDirectory() as tempDirectory:
+				copytree(Path("tests/examples"), Path(tempDirectory) / "examples")
+				chdir(Path(tempDirectory) / "examples")
+				try:
+					processor = OsvvmProFileProcessor()
+					project = processor.LoadRegressionFileParallel(Path("regression.pro"), workers=workers)
+					projectBuild = project.Builds["project"]
+
+					includeGraph = processor.Context.IncludeGraph
+					regressionFile = Path("regression.pro").resolve()
+					self.assertEqual([regressionFile], list(includeGraph.TopLevel()))
+					self.assertIn(Path("simple/tb/build.pro").resolve(), includeGraph.Subtree(regressionFile))
+					self.assertEqual(set(), processor.Reload(project))
+
+					tbFile = Path("simple/tb/build.pro")
+					tbFile.write_text(tbFile.read_text().replace("suite1", "suite2"))
+					self.assertEqual({"test"}, processor.Reload(project))
+					self.assertIs(projectBuild, project.Builds["project"])
+					self.assertEqual(["suite2"], list(project.Builds["test"].Testsuites))
+
+					regressionFile.write_text(regressionFile.read_text() + "\n# changed\n")
+					self.assertEqual({"project", "test"}, processor.Reload(project))
+					self.assertEqual(["project", "test"], list(project.Builds))
+				finally:
+					chdir(workingDirectory)
+
+	def test_GlobalContextUntouched(self) -> None:
+		builds = dict(osvvmContext.Builds)
+		includedFiles = list(osvvmContext.IncludedFiles)
+
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			processor = OsvvmProFileProcessor()
+			processor.LoadRegressionFile(Path("regression.pro"))
+			OsvvmProFileProcessor().LoadRegressionFileParallel(Path("regression.pro"), workers=2)
+		finally:
+			chdir(workingDirectory)
+
+		self.assertIsNot(osvvmContext, processor.Context)
+		self.assertEqual(builds, osvvmContext.Builds)
+		self.assertEqual(includedFiles, osvvmContext.IncludedFiles)
+
+	def test_IndependentProcessorsInThreads(self) -> None:
+		def load(_: int) -> list:
+			processor = OsvvmProFileProcessor()
+			return summarize(processor.LoadRegressionFile(Path("regression.pro")))
+
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			expected = load(0)
+			with ThreadPoolExecutor(max_workers=4) as executor:
+				results = list(executor.map(load, range(8)))
+		finally:
+			chdir(workingDirectory)
+
+		for result in results:
+			self.assertEqual(expected, result)
+
+	def test_InvalidWorkers(self) -> None:
+		with self.assertRaises(ValueError):
+			OsvvmProFileProcessor().LoadRegressionFileParallel(Path("regression.pro"), workers=0)
+
+
+class ProcessorPool(TestCase):
+	def test_Reuse(self) -> None:
+		pool = OsvvmProFileProcessorPool(maxIdle=1)
+		pool.Warm()
+		self.assertEqual(1, pool.IdleCount)
+
+		with pool.Acquire() as processor1:
+			self.assertEqual(0, pool.IdleCount)
+			with pool.Acquire() as processor2:
+				self.assertIsNot(processor1, processor2)
+
+		self.assertEqual(1, pool.IdleCount)
+		self.assertEqual(1, pool.HitCount)
+		self.assertEqual(1, pool.MissCount)
+		self.assertEqual(1, pool.ResetCount)
+
+		with pool.Acquire() as processor3:
+			self.assertIn(processor3, (processor1, processor2))
+
+		self.assertEqual(2, pool.HitCount)
+		self.assertEqual(2, pool.ResetCount)
+		self.assertLessEqual(pool.AverageResetDuration, pool.ResetDuration)
+
+	def test_Reset(self) -> None:
+		pool = OsvvmProFileProcessorPool()
+
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			with pool.Acquire() as processor:
+				expected = summarize(processor.LoadRegressionFile(Path("regression.pro")))
+				processor.EvaluateTclCode(dedent("""\
+					set myVariable 1
+					proc myProcedure {} {}
+					namespace eval ::myNamespace {}
+					proc build {args} {}
+					rename analyze {}
+					set ::osvvm::ToolName "changed"
+					"""))
+				processor.RegisterContextBoundProcedure(throw, "myThrow")
+
+			with pool.Acquire() as processor:
+				self.assertEqual(0, len(processor.Context.Builds))
+				self.assertEqual("0", str(processor.TCL.eval("info exists myVariable")))
+				self.assertEqual("", str(processor.TCL.eval("info commands myProcedure")))
+				self.assertEqual("", str(processor.TCL.eval("info commands myThrow")))
+				self.assertEqual("0", str(processor.TCL.eval("namespace exists ::myNamespace")))
+				self.assertNotEqual("changed", str(processor.TCL.eval("set ::osvvm::ToolName")))
+				self.assertNotIn("myThrow", processor.Procedures)
+
+				self.assertEqual(expected, summarize(processor.LoadRegressionFile(Path("regression.pro"))))
+		finally:
+			chdir(workingDirectory)
+
+	def test_ForeignThread(self) -> None:
+		pool = OsvvmProFileProcessorPool()
+
+		def acquire() -> None:
+			with pool.Acquire():
+				pass
+
+		with ThreadPoolExecutor(max_workers=1) as executor:
+			with self.assertRaises(OSVVMException):
+				executor.submit(acquire).result()
+
+
+class OptionHandles(TestCase):
+	def test_Table(self) -> None:
+		table = OptionTable(capacity=2)
+
+		first = table.Add(NoNullRangeWarning())
+		second = table.Add(NoNullRangeWarning())
+		self.assertLess(first, second)
+		self.assertEqual(2, table.PeakCount)
+
+		option = table[second]
+		self.assertIs(option, table.Consume(second))
+		self.assertNotIn(second, table)
+		with self.assertRaises(KeyError):
+			table.Consume(second)
+
+		third = table.Add(NoNullRangeWarning())
+		self.assertLess(second, third)
+		with self.assertRaises(OSVVMException):
+			table.Add(NoNullRangeWarning())
+
+		self.assertIn(first, table)
+		self.assertIn(third, table)
+		self.assertEqual(2, table.LiveCount)
+		self.assertEqual(2, table.PeakCount)
+		self.assertEqual(3, table.AddCount)
+		self.assertEqual(1, table.ReleaseCount)
+
+		table.Clear()
+		self.assertEqual(0, len(table))
+		self.assertLess(third, table.Add(NoNullRangeWarning()))
+
+		with self.assertRaises(ValueError):
+			OptionTable(capacity=0)
+
+	def test_ConsumedByProcedures(self) -> None:
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			processor = OsvvmProFileProcessor()
+			processor.LoadRegressionFile(Path("regression.pro"))
+		finally:
+			chdir(workingDirectory)
+
+		options = processor.Context.Options
+		self.assertEqual(0, options.LiveCount)
+		self.assertGreater(options.AddCount, 0)
+		self.assertEqual(options.AddCount, options.ReleaseCount)
+		self.assertLessEqual(options.PeakCount, 3)
+
+	def test_ConsumedOnce(self) -> None:
+		processor = OsvvmProFileProcessor()
+		optionID = processor.TCL.eval("BuildName myBuild")
+
+		processor.Context.ConsumeOption(int(optionID))
+		with self.assertRaises(KeyError):
+			processor.Context.ConsumeOption(int(optionID))
+
+	def test_CapacityExceeded(self) -> None:
+		context = Context()
+		context._options = OptionTable(capacity=1)
+		processor = OsvvmProFileProcessor(context)
+		processor.TCL.eval("BuildName myBuild")
+		with self.assertRaises(TclError):
+			processor.TCL.eval("BuildName otherBuild")
+
+		self.assertIsInstance(context.LastException, OSVVMException)
+		self.assertIn("capacity of 1", str(context.LastException))
+
+		context.Clear()
+		self.assertEqual(1, context.Options.Capacity)
+		self.assertEqual(0, context.Options.LiveCount)
@@ -0,0 +1,137 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2025-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for the deferred validation of files referenced by OSVVM scripts."""
+from os            import chdir
+from pathlib       import Path
+from tempfile      import TemporaryDirectory
+from unittest      import TestCase as TestCase
+from unittest.mock import patch
+
+from pyEDAA.OSVVM             import OSVVMException
+from pyEDAA.OSVVM.Project     import FileSystemCache
+from pyEDAA.OSVVM.Project.TCL import OsvvmProFileProcessor
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def vhdlFiles(project) -> dict:
+	return {
+		buildName: {name: [file.Path for file in library.Files] for name, library in build.VHDLLibraries.items()}
+		for buildName, build in project.Builds.items()
+	}
+
+
+class DeferredValidation(TestCase):
+	def test_MissingFiles(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			root = Path(tempDirectory).resolve()
+			(root / "a.vhdl").touch()
+			(root / "build.pro").write_text("analyze a.vhdl\nanalyze b.vhdl\nRunTest c.vhdl\n")
+
+			workingDirectory = Path.cwd()
+			chdir(root)
+			try:
+				processor = OsvvmProFileProcessor()
+				with self.assertRaises(OSVVMException) as immediate:
+					processor.LoadBuildFile(Path("build.pro"))
+
+				for workers in (1, 2):
+					processor = OsvvmProFileProcessor(deferValidation=True, validationWorkers=workers)
+					self.assertTrue(processor.DeferValidation)
+					with self.assertRaises(OSVVMException) as deferred:
+						processor.LoadBuildFile(Path("build.pro"))
+
+					self.assertIn("2 referenced file(s)", str(deferred.exception))
+					self.assertEqual(2, len(deferred.exception.__notes__))
+					self.assertTrue(deferred.exception.__notes__[0].endswith(f"referenced in '{root / 'build.pro'}'."))
+					self.assertEqual(0, len(processor.Context.ReferencedFiles))
+					self.assertEqual(3, len(processor.Context.Builds["build"].VHDLLibraries["default"].Files))
+			finally:
+				chdir(workingDirectory)
+
+		self.assertIn("b.vhdl", str(immediate.exception.__cause__))
+
+	def test_Regression(self) -> None:
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			expected = OsvvmProFileProcessor().LoadRegressionFile(Path("regression.pro"))
+			processor = OsvvmProFileProcessor(deferValidation=True)
+			project = processor.LoadRegressionFile(Path("regression.pro"))
+		finally:
+			chdir(workingDirectory)
+
+		self.assertEqual(0, len(processor.Context.ReferencedFiles))
+		self.assertEqual(list(expected.Builds), list(project.Builds))
+		self.assertEqual(vhdlFiles(expected), vhdlFiles(project))
+
+	def test_RegressionParallel(self) -> None:
+		workingDirectory = Path.cwd()
+		chdir(Path("tests/examples"))
+		try:
+			expected = OsvvmProFileProcessor().LoadRegressionFile(Path("regression.pro"))
+			processor = OsvvmProFileProcessor(deferValidation=True, validationWorkers=2)
+			project = processor.LoadRegressionFileParallel(Path("regression.pro"), workers=2)
+		finally:
+			chdir(workingDirectory)
+
+		self.assertEqual(0, len(processor.Context.ReferencedFiles))
+		self.assertEqual(vhdlFiles(expected), vhdlFiles(project))
+
+	def test_ResolveWhenValidating(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			root = Path(tempDirectory).resolve()
+			(root / "a.vhdl").touch()
+			(root / "b.vhdl").touch()
+			(root / "build.pro").write_text("analyze a.vhdl\nRunTest b.vhdl\n")
+
+			workingDirectory = Path.cwd()
+			chdir(root)
+			try:
+				processor = OsvvmProFileProcessor(deferValidation=True)
+				context = processor.Context
+				with patch.object(FileSystemCache, "Resolve", autospec=True, side_effect=FileSystemCache.Resolve) as resolve:
+					context.BeginBuild("build")
+					processor.EvaluateProFile(Path("build.pro"))
+					build = context.EndBuild()
+
+					self.assertEqual([], [call.args[1] for call in resolve.call_args_list if call.args[1].suffix == ".vhdl"])
+					self.assertEqual({root / "a.vhdl", root / "b.vhdl"}, set(context.ReferencedFiles))
+
+					context.ValidateReferencedFiles(workers=2)
+			finally:
+				chdir(workingDirectory)
+
+		self.assertEqual(0, len(context.ReferencedFiles))
+		self.assertEqual([Path("a.vhdl"), Path("b.vhdl")], [file.Path for file in build.VHDLLibraries["default"].Files])
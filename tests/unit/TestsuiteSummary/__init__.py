@@ -29,10 +29,14 @@
 # ==================================================================================================================== #
 #
 """Testcase for OSVVM specific file formats."""
+from datetime     import datetime, timedelta
 from pathlib      import Path
 from unittest     import TestCase
 
-from pyEDAA.OSVVM.Build import Testsuite, Testcase, TestsuiteSummary, BuildSummaryDocument
+from pyEDAA.Reports.Unittesting import TestcaseStatus
+
+from pyEDAA.OSVVM.Build import Testsuite, Testcase, TestsuiteSummary, BuildSummaryDocument, MergeBuildSummaries
+from pyEDAA.OSVVM.Build import TestcaseColumns, UnittestException
 
 if __name__ == "__main__": # pragma: no cover
 	print("ERROR: you called a testcase declaration file as an executable module.")
@@ -61,3 +65,166 @@ class Instantiation(TestCase):
 		doc = BuildSummaryDocument(summaryFile)
 
 		self.assertEqual("Unprocessed OSVVM YAML file", doc.Name)
+
+
+class Columnar(TestCase):
+	def test_AppendAndView(self) -> None:
+		ts = Testsuite("ts")
+		columns = TestcaseColumns()
+		columns.Append(ts, "tc1", timedelta(seconds=1.5), TestcaseStatus.Passed, assertionCount=3, passedAssertionCount=3)
+		columns.Append(ts, "tc2", timedelta(seconds=2), TestcaseStatus.Failed, assertionCount=3, passedAssertionCount=1, errorCount=2)
+		index = columns.Append(ts, "tc1", timedelta(seconds=1), TestcaseStatus.Failed, warningCount=1)
+
+		self.assertEqual(0, index)
+		self.assertEqual(2, len(columns))
+		self.assertEqual(["tc1", "tc2"], [view.Name for view in columns])
+
+		view = columns[-1]
+		self.assertIs(ts, view.Parent)
+		self.assertEqual(TestcaseStatus.Failed, view.Status)
+		self.assertEqual(timedelta(seconds=2), view.TotalDuration)
+		self.assertEqual(2, view.FailedAssertionCount)
+		self.assertEqual(1, columns[0].WarningCount)
+
+		testcase = view.ToTestcase(parent=ts)
+		self.assertIs(testcase, ts.Testcases["tc2"])
+		self.assertEqual(2, testcase.ErrorCount)
+
+		with self.assertRaises(IndexError):
+			_ = columns[2]
+
+	def test_AllProperties(self) -> None:
+		summary = TestsuiteSummary("tss")
+		ts = Testsuite("ts", parent=summary)
+		_ = Testcase(
+			"tc1",
+			startTime=datetime(2026, 1, 2, 3, 4, 5),
+			setupDuration=timedelta(seconds=1),
+			testDuration=timedelta(seconds=2),
+			teardownDuration=timedelta(0),
+			totalDuration=timedelta(seconds=3),
+			status=TestcaseStatus.Failed,
+			assertionCount=4,
+			passedAssertionCount=3,
+			requirementsCount=5,
+			failedRequirementsCount=2,
+			functionalCoverage=0.75,
+			disabledFatalCount=1,
+			expectedWarningCount=2,
+			parent=ts
+		)
+		_ = Testcase("tc2", totalDuration=timedelta(seconds=1), parent=ts)
+
+		properties = (
+			"Name", "StartTime", "SetupDuration", "TestDuration", "TeardownDuration", "TotalDuration", "Status",
+			"AssertionCount", "PassedAssertionCount", "FailedAssertionCount",
+			"RequirementsCount", "PassedRequirementsCount", "FailedRequirementsCount", "FunctionalCoverage",
+			"WarningCount", "ErrorCount", "FatalCount",
+			"DisabledWarningCount", "DisabledErrorCount", "DisabledFatalCount",
+			"ExpectedWarningCount", "ExpectedErrorCount", "ExpectedFatalCount"
+		)
+		columns = TestcaseColumns.FromSummary(summary)
+		for testcase, view in zip(ts.Testcases.values(), columns):
+			converted = view.ToTestcase()
+			for name in properties:
+				self.assertEqual(getattr(testcase, name), getattr(view, name), f"{testcase.Name}.{name}")
+				self.assertEqual(getattr(testcase, name), getattr(converted, name), f"{testcase.Name}.{name}")
+
+		self.assertEqual(3, columns[0].PassedRequirementsCount)
+		self.assertIsNone(columns[1].SetupDuration)
+		self.assertIsNone(columns[1].FunctionalCoverage)
+
+	def test_Aggregate(self) -> None:
+		summary = TestsuiteSummary("tss")
+		ts1 = Testsuite("ts1", parent=summary)
+		ts2 = Testsuite("ts2", parent=ts1)
+		_ = Testcase("tc1", totalDuration=timedelta(seconds=1), status=TestcaseStatus.Passed, assertionCount=2, passedAssertionCount=2, parent=ts1)
+		_ = Testcase("tc2", totalDuration=timedelta(seconds=2), status=TestcaseStatus.Failed, assertionCount=2, passedAssertionCount=1, parent=ts2)
+		_ = Testcase("tc3", totalDuration=timedelta(seconds=3), assertionCount=0, passedAssertionCount=0, parent=ts2)
+
+		columns = TestcaseColumns.FromSummary(summary)
+		result = columns.Aggregate(summary)
+
+		self.assertEqual(summary.Aggregate(), result)
+		self.assertEqual(3, summary.Tests)
+		self.assertEqual(1, ts1.Passed)
+		self.assertEqual(2, ts1.Failed + ts1.Weak)
+		self.assertEqual(TestcaseStatus.Weak, columns[2].Status)
+		self.assertEqual(timedelta(seconds=6), ts1.TotalDuration)
+
+	def test_Aggregate_MissingAssertionCount(self) -> None:
+		summary = TestsuiteSummary("tss")
+		ts = Testsuite("ts", parent=summary)
+		tc = Testcase("tc", totalDuration=timedelta(seconds=1), parent=ts)
+
+		columns = TestcaseColumns.FromSummary(summary)
+		self.assertIsNone(columns[0].PassedAssertionCount)
+		self.assertIsNone(columns[0].ToTestcase().PassedAssertionCount)
+
+		result = columns.Aggregate(summary)
+		columnarPassed, columnarWeak = ts.Passed, ts.Weak
+
+		self.assertEqual(summary.Aggregate(), result)
+		self.assertEqual(1, ts.Passed)
+		self.assertEqual(0, ts.Weak)
+		self.assertEqual((ts.Passed, ts.Weak), (columnarPassed, columnarWeak))
+		self.assertEqual(tc.Status, columns[0].Status)
+
+	def test_Aggregate_UnknownStatus(self) -> None:
+		summary = TestsuiteSummary("tss")
+		ts = Testsuite("ts", parent=summary)
+		columns = TestcaseColumns()
+		columns.Append(ts, "tc", timedelta(seconds=1), TestcaseStatus.Excluded | TestcaseStatus.Skipped)
+
+		with self.assertRaises(UnittestException):
+			columns.Aggregate(summary)
+
+
+class Merge(TestCase):
+	def _CreateShard(self, name: str, testcases: dict) -> TestsuiteSummary:
+		summary = TestsuiteSummary(name, totalDuration=timedelta(seconds=10))
+		for testsuiteName, testcaseNames in testcases.items():
+			testsuite = Testsuite(testsuiteName, totalDuration=timedelta(seconds=len(testcaseNames)), parent=summary)
+			for testcaseName in testcaseNames:
+				_ = Testcase(
+					testcaseName,
+					totalDuration=timedelta(seconds=1),
+					status=TestcaseStatus.Passed,
+					assertionCount=4,
+					passedAssertionCount=4,
+					warningCount=1,
+					disabledErrorCount=2,
+					parent=testsuite
+				)
+
+		return summary
+
+	def test_MergeShards(self) -> None:
+		shard1 = self._CreateShard("shard1", {"ts1": ("tc1", "tc2"), "ts2": ("tc3", )})
+		shard2 = self._CreateShard("shard2", {"ts1": ("tc2", "tc4"), "ts3": ("tc5", )})
+
+		merged = MergeBuildSummaries((shard1, shard2), name="regression")
+
+		self.assertEqual("regression", merged.Name)
+		self.assertEqual({"ts1", "ts2", "ts3"}, set(merged.Testsuites))
+		self.assertEqual(5, merged.TestcaseCount)
+		self.assertEqual(5, merged.Passed)
+		self.assertEqual(timedelta(seconds=20), merged.TotalDuration)
+		self.assertEqual(timedelta(seconds=4), merged.Testsuites["ts1"].TotalDuration)
+
+		testcase = merged.Testsuites["ts1"].Testcases["tc2"]
+		self.assertIsNot(shard1.Testsuites["ts1"].Testcases["tc2"], testcase)
+		self.assertEqual(8, testcase.AssertionCount)
+		self.assertEqual(2, testcase.WarningCount)
+		self.assertEqual(4, testcase.DisabledErrorCount)
+		self.assertEqual(timedelta(seconds=2), testcase.TotalDuration)
+		self.assertEqual(1, shard1.Testsuites["ts1"].Testcases["tc2"].WarningCount)
+
+	def test_MergeDocuments(self) -> None:
+		doc = BuildSummaryDocument(Path("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml"), analyzeAndConvert=True)
+
+		merged = MergeBuildSummaries((doc, doc))
+
+		self.assertEqual(doc.TestcaseCount, merged.TestcaseCount)
+		self.assertEqual(doc.Passed, merged.Passed)
+		self.assertEqual(doc.TotalDuration * 2, merged.TotalDuration)
@@ -0,0 +1,224 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___  ______     ____     ____  __                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    / _ \/ ___\ \   / /\ \   / /  \/  |                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \  | | | \___ \\ \ / /  \ \ / /| |\/| |                                        #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ | |_| |___) |\ V /    \ V / | |  | |                                        #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___/|____/  \_/      \_/  |_|  |_|                                        #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2021-2026 Electronic Design Automation Abstraction (EDA²)                                                  #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for watching an OSVVM reports directory."""
+from asyncio      import run, wait_for
+from pathlib      import Path
+from shutil       import copyfile
+from sys          import platform
+from tempfile     import TemporaryDirectory
+from threading    import Event
+from time         import monotonic
+from unittest     import TestCase, skipUnless
+from unittest.mock import patch
+
+from pyEDAA.OSVVM.AlertLog import Document as AlertLogDocument
+from pyEDAA.OSVVM.Build    import BuildSummaryDocument
+from pyEDAA.OSVVM.Watcher  import ReportWatcher, WatchBackend
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Poll(TestCase):
+	def test_Poll(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			buildPath = directory / "RunAllTests.yml"
+			alertPath = directory / "reports" / "lib" / "TbAxi4_BasicReadWrite_alerts.yml"
+			alertPath.parent.mkdir(parents=True)
+			copyfile("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml", buildPath)
+			copyfile("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml", alertPath)
+
+			watcher = ReportWatcher(directory, debounce=0.0, useInotify=False)
+			self.assertIs(WatchBackend.Polling, watcher.Backend)
+
+			updates = {update.Path: update for update in watcher.Poll()}
+			self.assertEqual({buildPath, alertPath}, set(updates))
+			self.assertIsInstance(updates[buildPath].Document, BuildSummaryDocument)
+			self.assertIsInstance(updates[alertPath].Document, AlertLogDocument)
+			self.assertEqual(17, len(updates[buildPath].Changed))
+			self.assertEqual([], watcher.Poll())
+
+			document = updates[buildPath].Document
+			buildPath.write_text(buildPath.read_text().replace("Name:     \"RunAllTests\"", "Name:     \"Modified\"", 1) + "\n")
+			updates = watcher.Poll()
+
+			self.assertEqual(1, len(updates))
+			self.assertIs(document, updates[0].Document)
+			self.assertEqual("Modified", document.Name)
+			self.assertEqual(set(), updates[0].Changed)
+
+			alertPath.unlink()
+			self.assertEqual([], watcher.Poll())
+			self.assertNotIn(alertPath, watcher.Documents)
+
+	def test_Debounce(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "Broken.yml").write_text("Version: \"1.0\"\n")
+
+			watcher = ReportWatcher(directory, debounce=3600.0, useInotify=False)
+			self.assertEqual([], watcher.Poll())
+
+			watcher = ReportWatcher(directory, debounce=0.0, useInotify=False)
+			updates = watcher.Poll()
+			self.assertEqual(1, len(updates))
+			self.assertIsNone(updates[0].Document)
+			self.assertIsNotNone(updates[0].Exception)
+
+	def test_HalfWrittenFile(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			buildPath = directory / "RunAllTests.yml"
+			buildPath.write_text("Name: x\n")
+
+			watcher = ReportWatcher(directory, debounce=0.0, useInotify=False)
+			updates = watcher.Poll()
+			self.assertEqual(1, len(updates))
+			self.assertIsNotNone(updates[0].Exception)
+			self.assertEqual([], watcher.Poll())
+
+			copyfile("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml", buildPath)
+			updates = watcher.Poll()
+			self.assertEqual(1, len(updates))
+			self.assertIsNone(updates[0].Exception)
+			self.assertEqual("RunAllTests", updates[0].Document.Name)
+
+
+class Live(TestCase):
+	def test_Callback(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			received = []
+			done = Event()
+
+			def callback(update) -> None:
+				received.append(update)
+				done.set()
+
+			watcher = ReportWatcher(directory, callback=callback, pollInterval=0.05, debounce=0.05)
+			if platform.startswith("linux"):
+				self.assertIs(WatchBackend.Inotify, watcher.Backend)
+
+			watcher.Start()
+			try:
+				copyfile("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml", directory / "Tb_alerts.yml")
+				self.assertTrue(done.wait(10.0))
+			finally:
+				watcher.Stop()
+
+		self.assertEqual("Tb_alerts.yml", received[0].Path.name)
+
+	def test_AsyncIterator(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			copyfile("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml", directory / "RunAllTests.yml")
+			watcher = ReportWatcher(directory, pollInterval=0.05, debounce=0.0)
+
+			async def first():
+				async for update in watcher.Updates():
+					return update
+
+			try:
+				update = run(wait_for(first(), 10.0))
+			finally:
+				watcher.Stop()
+
+		self.assertEqual("RunAllTests", update.Document.Name)
+
+	@skipUnless(platform.startswith("linux"), "requires inotify")
+	def test_InotifyEvents(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			buildPath = directory / "RunAllTests.yml"
+			copyfile("tests/data/OSVVM/OSVVMLibraries_RunAllTests.yml", buildPath)
+
+			watcher = ReportWatcher(directory, debounce=0.0)
+			try:
+				self.assertEqual({buildPath}, {update.Path for update in watcher.Poll()})
+
+				with patch.object(Path, "rglob", side_effect=AssertionError("unexpected scan")):
+					(directory / "Other.txt").write_text("ignored")
+					self.assertEqual([], watcher.Poll())
+
+				alertPath = directory / "reports" / "Tb_alerts.yml"
+				alertPath.parent.mkdir()
+				copyfile("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml", alertPath)
+				self.assertEqual([alertPath], [update.Path for update in watcher.Poll()])
+
+				alertPath.unlink()
+				self.assertEqual([], watcher.Poll())
+				self.assertNotIn(alertPath, watcher.Documents)
+			finally:
+				watcher.Stop()
+
+	def test_StopWhileWaiting(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			watcher = ReportWatcher(Path(tempDirectory), callback=lambda update: None, pollInterval=3600.0)
+			watcher.Start()
+			started = monotonic()
+			watcher.Stop()
+
+			self.assertLess(monotonic() - started, 10.0)
+			self.assertIsNone(watcher._thread)
+
+	def test_RaisingCallback(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			received = []
+			first = Event()
+			done = Event()
+
+			def callback(update) -> None:
+				received.append(update)
+				if not first.is_set():
+					first.set()
+					raise ValueError("callback failed")
+				done.set()
+
+			watcher = ReportWatcher(directory, callback=callback, pollInterval=0.05, debounce=0.05)
+			watcher.Start()
+			try:
+				copyfile("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml", directory / "Tb1_alerts.yml")
+				self.assertTrue(first.wait(10.0))
+				copyfile("tests/data/OSVVM/TbAxi4_BasicReadWrite_alerts.yml", directory / "Tb2_alerts.yml")
+				self.assertTrue(done.wait(10.0))
+				self.assertTrue(watcher._thread.is_alive())
+			finally:
+				watcher.Stop()
+
+		self.assertEqual(["Tb1_alerts.yml", "Tb2_alerts.yml"], [update.Path.name for update in received])
+		self.assertEqual(1, len(watcher.CallbackErrors))
+		update, ex = watcher.CallbackErrors[0]
+		self.assertIs(received[0], update)
+		self.assertIsInstance(ex, ValueError)